@@ -1,5 +1,6 @@
 """Django Ninja API configuration."""
 
+from django.conf import settings
 from ninja import NinjaAPI
 
 from features.budget_maker.endpoints import router as budget_router
@@ -12,10 +13,15 @@ from features.crud.transactions.endpoints import router as db_transactions_route
 from features.crud.transactions.expenses.endpoints import router as db_expenses_router
 from features.crud.transactions.transfers.endpoints import router as db_transfers_router
 from features.crud.transactions.deposits.endpoints import router as db_deposits_router
+from features.crud.transactions.imports.endpoints import router as db_imports_router
+from features.crud.exports.endpoints import router as db_exports_router
 from features.crud.users.endpoints import router as db_users_router
 from features.crud.accounts.endpoints import router as db_accounts_router
 from features.goal_maker.endpoints import router as goal_router
-from features.orchestrator.endpoints import router as orchestrator_router
+from features.orchestrator.endpoints import (
+    analysis_router as orchestrator_analysis_router,
+    router as orchestrator_router,
+)
 from features.transaction_maker.endpoints import router as transaction_router
 from features.auth.endpoints import router as auth_router
 from features.notifications.endpoints import router as notifications_router
@@ -32,11 +38,20 @@ api = NinjaAPI(
 api.add_router(
     "/personal_assistant", orchestrator_router, tags=["Personal Assistant Chat"]
 )
-api.add_router("/personal_assistant/budget", budget_router, tags=["Budget Maker"])
-api.add_router("/personal_assistant/goal", goal_router, tags=["Goal Maker"])
-api.add_router(
-    "/personal_assistant/transaction", transaction_router, tags=["Transaction Maker"]
-)
+
+# Agent routes. The agents themselves load on first use
+# (features.agent_registry); CRUD-only workers can leave them out entirely.
+if settings.ENABLE_AGENTS:
+    api.add_router(
+        "/personal_assistant",
+        orchestrator_analysis_router,
+        tags=["Personal Assistant Chat"],
+    )
+    api.add_router("/personal_assistant/budget", budget_router, tags=["Budget Maker"])
+    api.add_router("/personal_assistant/goal", goal_router, tags=["Goal Maker"])
+    api.add_router(
+        "/personal_assistant/transaction", transaction_router, tags=["Transaction Maker"]
+    )
 
 
 api.add_router(
@@ -45,6 +60,8 @@ api.add_router(
 api.add_router("/database/expense", db_expenses_router, tags=["Database - Expenses"])
 api.add_router("/database/transfer", db_transfers_router, tags=["Database - Transfers"])
 api.add_router("/database/deposit", db_deposits_router, tags=["Database - Deposits"])
+api.add_router("/database/import", db_imports_router, tags=["Database - Imports"])
+api.add_router("/database/export", db_exports_router, tags=["Database - Exports"])
 api.add_router("/database/budget", db_budgets_router, tags=["Database - Budgets"])
 api.add_router("/database/goal", db_goals_router, tags=["Database - Goals"])
 api.add_router("/database/income", db_income_router, tags=["Database - Income"])
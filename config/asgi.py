@@ -7,3 +7,11 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.WARMUP_ON_START:
+    # Warm up before the server starts accepting requests on this worker
+    from features.warmup import run_warmup_at_start
+
+    run_warmup_at_start()
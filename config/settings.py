@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",  # Trigram lookups for transaction search
     # --- 2. THIRD PARTY APPS ---
     "corsheaders",
     "ninja",
@@ -125,6 +126,14 @@ TEMPLATES = [
 ]
 
 # Database - PostgreSQL
+#
+# Under ASGI every request runs its sync code in a fresh thread, so Django's
+# per-thread persistent connections (CONN_MAX_AGE) would never be reused.
+# A psycopg3 pool per worker process keeps TLS connections open across
+# requests; Django returns the connection to the pool when a request ends.
+# Set DB_POOL=False to fall back to persistent per-thread connections (WSGI).
+DB_POOL = os.getenv("DB_POOL", "True") == "True"
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -132,10 +141,40 @@ DATABASES = {
         "USER": os.getenv("DB_USER"),
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST"),
-        "PORT": "5432",
+        "PORT": os.getenv("DB_PORT", "5432"),
         "OPTIONS": {
             "sslmode": os.getenv("DB_SSLMODE", "require"),
         },
+        # Pools hand out fresh connections; persistence only applies without one
+        "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+if DB_POOL:
+    from psycopg_pool import ConnectionPool
+
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        # Per worker process: total DB connections = workers * DB_POOL_MAX_SIZE
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+        # Seconds a request waits for a free connection before failing
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        # Close idle connections above min_size, and recycle old ones
+        "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+        "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+        # Health check on checkout, so a connection dropped by the server
+        # (failover, idle timeout) is replaced instead of failing a request
+        "check": ConnectionPool.check_connection,
+    }
+
+# Cache - per-process memory by default. Per-user snapshots are keyed on the
+# user's data version, so separate worker caches never serve stale data.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "personal-assistant",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
     }
 }
 
@@ -155,6 +194,77 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 API_TITLE = "Personal Assistant API"
 API_VERSION = "1.0.0"
 
+# Process role: False serves only CRUD/dashboard routes and never loads the
+# LLM agents (LangChain, LangGraph, prompts). Agents otherwise load on first use.
+ENABLE_AGENTS = os.getenv("ENABLE_AGENTS", "True") == "True"
+
+# LLM providers (core.llm_providers.registry). Agents use LLM_PROVIDER; limits
+# are per worker process. "fake" runs the agent stack offline with scripted
+# answers (LLM_FAKE_SCRIPT, a JSON file) after LLM_FAKE_LATENCY_MS.
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "digital_ocean")
+LLM_PROVIDERS = {
+    "digital_ocean": {
+        "BACKEND": "core.llm_providers.digital_ocean.gpt_oss_120b",
+        "MAX_CONCURRENCY": int(os.getenv("LLM_MAX_CONCURRENCY", "32")),
+        "RATE_PER_SECOND": float(os.getenv("LLM_RATE_PER_SECOND", "10")),
+        "BURST": int(os.getenv("LLM_BURST", "20")),
+        "TIMEOUT": float(os.getenv("LLM_TIMEOUT", "60")),
+        "MAX_RETRIES": int(os.getenv("LLM_MAX_RETRIES", "2")),
+    },
+    "fake": {
+        "BACKEND": "core.llm_providers.fake.fake_chat_model",
+        "OPTIONS": {
+            "script": os.getenv("LLM_FAKE_SCRIPT") or None,
+            "latency_ms": float(os.getenv("LLM_FAKE_LATENCY_MS", "0")),
+            "jitter_ms": float(os.getenv("LLM_FAKE_JITTER_MS", "0")),
+            "seed": 0,
+        },
+    },
+}
+
+# Rule/classifier router that answers obvious turns without the LLM router
+# (features.orchestrator.fast_router). FAST_ROUTER_MODEL is an optional JSON
+# model written by `manage.py train_fast_router`.
+FAST_ROUTER = os.getenv("FAST_ROUTER", "True") == "True"
+FAST_ROUTER_MODEL = os.getenv("FAST_ROUTER_MODEL", "")
+FAST_ROUTER_MIN_CONFIDENCE = float(os.getenv("FAST_ROUTER_MIN_CONFIDENCE", "0.9"))
+# Below that, turns the fast router still rates as probable data lookups
+# start the database agent in parallel with the LLM router; the run is
+# discarded (one wasted LLM call) if the router picks another agent.
+SPECULATIVE_DB = os.getenv("SPECULATIVE_DB", "True") == "True"
+SPECULATIVE_DB_MIN_CONFIDENCE = float(os.getenv("SPECULATIVE_DB_MIN_CONFIDENCE", "0.6"))
+
+# Reply on database-agent turns: "template" answers from the result set,
+# "llm" asks the personal assistant for a one-sentence confirmation (an
+# extra LLM round trip on every data lookup).
+DB_CONFIRMATION_MODE = os.getenv("DB_CONFIRMATION_MODE", "template")
+
+# Database-agent SQL plans by request text (features.database_agent.plan_cache).
+# A repeated request reuses the stored SELECT with the user's id and date
+# windows rebound, instead of another LLM call. SIZE plans per process in
+# memory; the core_sqlplan table keeps up to MAX_ROWS across restarts.
+SQL_PLAN_CACHE = os.getenv("SQL_PLAN_CACHE", "True") == "True"
+SQL_PLAN_CACHE_SIZE = int(os.getenv("SQL_PLAN_CACHE_SIZE", "1000"))
+SQL_PLAN_CACHE_TTL = int(os.getenv("SQL_PLAN_CACHE_TTL", str(7 * 24 * 3600)))
+SQL_PLAN_CACHE_MAX_ROWS = int(os.getenv("SQL_PLAN_CACHE_MAX_ROWS", "20000"))
+
+# Results of the database agent's SELECTs per user and data version
+# (features.database_agent.result_cache), so repeated aggregates within an
+# analysis or a conversation skip Postgres. Memory budget per process.
+QUERY_RESULT_CACHE = os.getenv("QUERY_RESULT_CACHE", "True") == "True"
+QUERY_RESULT_CACHE_BYTES = int(os.getenv("QUERY_RESULT_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+# Warm each ASGI worker (DB pool, agents, prompts) before it serves traffic.
+# When False, the first /personal_assistant/ready probe does it instead.
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "True") == "True"
+
+# Conversation memory: callable used to fold old messages into
+# ChatConversation.summary_text (see features.crud.conversations.summarizer)
+CONVERSATION_SUMMARIZER = os.getenv(
+    "CONVERSATION_SUMMARIZER",
+    "features.crud.conversations.summarizer.summarize_with_llm",
+)
+
 # JWT Settings
 
 
@@ -1,12 +1,18 @@
 from langchain_gradient import ChatGradient
 import os
 
-gpt_oss_120b_digital_ocean = ChatGradient(
-    model="openai-gpt-oss-120b",
-    api_key=os.getenv("DIGITALOCEAN_INFERENCE_KEY_GPT_120B"),
-    max_completion_tokens=4096,
-    temperature=0.4,
-)
+
+def gpt_oss_120b(**options) -> ChatGradient:
+    """GPT-OSS-120B on DigitalOcean; the "digital_ocean" LLM provider backend."""
+    return ChatGradient(
+        **{
+            "model": "openai-gpt-oss-120b",
+            "api_key": os.getenv("DIGITALOCEAN_INFERENCE_KEY_GPT_120B"),
+            "max_completion_tokens": 4096,
+            "temperature": 0.4,
+            **options,
+        }
+    )
 
 # gpt5_mini_digital_ocean = ChatGradient(
 #     model="openai-gpt-5-mini",
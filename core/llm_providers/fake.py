@@ -0,0 +1,111 @@
+"""
+Offline stand-in for the chat model, used by load tests and benchmarks.
+
+Answers with scripted text after a configurable, optionally jittered delay, so
+agent graphs can be exercised end to end without network access or token cost.
+The async path sleeps with asyncio.sleep, which is what lets many concurrent
+turns share one event loop.
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+from typing import Any, List, Optional, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import Field, PrivateAttr
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Chat model returning the first scripted response whose regex matches the prompt.
+
+    Attributes:
+        responses: (pattern, text) pairs, searched against the joined prompt messages.
+        default_response: Returned when no pattern matches.
+        latency_ms: Simulated round-trip time of every call.
+        jitter_ms: Uniform +/- noise added to latency_ms.
+        seed: Seed for the jitter, for reproducible runs.
+    """
+
+    responses: List[Tuple[str, str]] = Field(default_factory=list)
+    default_response: str = ""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    seed: Optional[int] = None
+
+    _rng: Optional[random.Random] = PrivateAttr(default=None)
+    _calls: int = PrivateAttr(default=0)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-latency"
+
+    @property
+    def calls(self) -> int:
+        """Number of completions served so far."""
+        return self._calls
+
+    def _delay_seconds(self) -> float:
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        self._calls += 1
+        prompt = "\n".join(
+            m.content for m in messages if isinstance(m.content, str)
+        )
+        text = next(
+            (response for pattern, response in self.responses if re.search(pattern, prompt)),
+            self.default_response,
+        )
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self._delay_seconds())
+        return self._respond(messages)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self._delay_seconds())
+        return self._respond(messages)
+
+    def with_structured_output(self, schema: Any, **kwargs: Any):
+        """Parse the scripted JSON response into `schema` (a pydantic model)."""
+
+        def parse(message: BaseMessage) -> Any:
+            text = message.content.replace("```json", "").replace("```", "").strip()
+            return schema.model_validate_json(text)
+
+        return self | RunnableLambda(parse)
+
+
+def fake_chat_model(script: Optional[str] = None, **options: Any) -> FakeChatModel:
+    """
+    The "fake" LLM provider backend.
+
+    `script` is an optional JSON file {"responses": [[pattern, text], ...],
+    "default_response": text}; keyword options override its values.
+    """
+    if script:
+        with open(script, encoding="utf-8") as handle:
+            options = {**json.load(handle), **options}
+    return FakeChatModel(**options)
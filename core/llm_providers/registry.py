@@ -0,0 +1,234 @@
+"""
+LLM provider registry.
+
+Agents ask for a model with `get_llm()` instead of importing a client
+directly. Each provider in settings.LLM_PROVIDERS is built once per process
+and wrapped in a GovernedLLM that enforces that provider's limits on every
+call:
+
+- MAX_CONCURRENCY: calls in flight at once (a semaphore).
+- RATE_PER_SECOND / BURST: token bucket on call starts.
+- TIMEOUT: seconds per attempt (async calls; sync calls rely on the client).
+- MAX_RETRIES: retries of timeouts, connection errors and 408/429/5xx
+  responses, with exponential backoff and full jitter.
+
+settings.LLM_PROVIDER names the provider agents use by default, e.g. "fake"
+to run the whole agent stack offline (core.llm_providers.fake).
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+from django.conf import settings
+from django.utils.module_loading import import_string
+from langchain_core.runnables import Runnable, RunnableConfig
+
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+RETRYABLE_ERRORS = (TimeoutError, asyncio.TimeoutError, ConnectionError, httpx.TransportError)
+
+# Backoff before retry n is uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**n))
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, RETRYABLE_ERRORS):
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in RETRYABLE_STATUS
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, holding at most `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token; return how many seconds to wait before using it."""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative queues callers behind each other in arrival order
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class ProviderLimits:
+    """Concurrency, rate and retry policy shared by every model of one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 0,
+        rate_per_second: float = 0.0,
+        burst: int = 1,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self._thread_slots = (
+            threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        )
+        # asyncio semaphores belong to one event loop
+        self._loop_slots: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats_lock = threading.Lock()
+        self.stats = {"calls": 0, "retries": 0, "timeouts": 0, "failures": 0, "throttled_s": 0.0}
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _async_slot(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        slot = self._loop_slots.get(loop)
+        if slot is None:
+            slot = self._loop_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        return slot
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+    async def acall(self, fn, *args, **kwargs) -> Any:
+        """Await `fn(*args, **kwargs)` under the provider's limits."""
+        slot = self._async_slot()
+        for attempt in range(self.max_retries + 1):
+            if slot is not None:
+                await slot.acquire()
+            try:
+                wait = self.bucket.reserve()
+                if wait:
+                    self._count("throttled_s", wait)
+                    await asyncio.sleep(wait)
+                self._count("calls")
+                return await asyncio.wait_for(fn(*args, **kwargs), self.timeout)
+            except Exception as exc:
+                if isinstance(exc, asyncio.TimeoutError):
+                    self._count("timeouts")
+                if attempt == self.max_retries or not is_retryable(exc):
+                    self._count("failures")
+                    raise
+            finally:
+                if slot is not None:
+                    slot.release()
+            self._count("retries")
+            # Back off without holding a slot
+            await asyncio.sleep(self._backoff(attempt))
+
+    def call(self, fn, *args, **kwargs) -> Any:
+        """Call `fn(*args, **kwargs)` under the provider's limits (sync callers)."""
+        for attempt in range(self.max_retries + 1):
+            if self._thread_slots is not None:
+                self._thread_slots.acquire()
+            try:
+                wait = self.bucket.reserve()
+                if wait:
+                    self._count("throttled_s", wait)
+                    time.sleep(wait)
+                self._count("calls")
+                return fn(*args, **kwargs)
+            except Exception as exc:
+                if attempt == self.max_retries or not is_retryable(exc):
+                    self._count("failures")
+                    raise
+            finally:
+                if self._thread_slots is not None:
+                    self._thread_slots.release()
+            self._count("retries")
+            time.sleep(self._backoff(attempt))
+
+
+class GovernedLLM(Runnable):
+    """
+    A chat model (or a runnable derived from one) called under ProviderLimits.
+
+    Composes like the model itself (`prompt | llm | parser`);
+    with_structured_output / bind / bind_tools return governed runnables too.
+    """
+
+    def __init__(self, model: Runnable, limits: ProviderLimits):
+        self.model = model
+        self.limits = limits
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        return self.limits.call(self.model.invoke, input, config, **kwargs)
+
+    async def ainvoke(
+        self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        return await self.limits.acall(self.model.ainvoke, input, config, **kwargs)
+
+    def with_structured_output(self, *args: Any, **kwargs: Any) -> "GovernedLLM":
+        return GovernedLLM(self.model.with_structured_output(*args, **kwargs), self.limits)
+
+    def bind_tools(self, *args: Any, **kwargs: Any) -> "GovernedLLM":
+        return GovernedLLM(self.model.bind_tools(*args, **kwargs), self.limits)
+
+    def bind(self, **kwargs: Any) -> "GovernedLLM":
+        return GovernedLLM(self.model.bind(**kwargs), self.limits)
+
+    def __repr__(self) -> str:
+        return f"GovernedLLM({self.limits.name}: {self.model!r})"
+
+
+_providers: Dict[str, GovernedLLM] = {}
+_lock = threading.Lock()
+
+
+def build_provider(name: str) -> GovernedLLM:
+    """Instantiate provider `name` from settings.LLM_PROVIDERS."""
+    try:
+        conf = settings.LLM_PROVIDERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown LLM provider '{name}'. Configured: {', '.join(settings.LLM_PROVIDERS)}"
+        ) from None
+    model = import_string(conf["BACKEND"])(**conf.get("OPTIONS", {}))
+    limits = ProviderLimits(
+        name,
+        max_concurrency=conf.get("MAX_CONCURRENCY", 0),
+        rate_per_second=conf.get("RATE_PER_SECOND", 0.0),
+        burst=conf.get("BURST", 1),
+        timeout=conf.get("TIMEOUT"),
+        max_retries=conf.get("MAX_RETRIES", 0),
+    )
+    return GovernedLLM(model, limits)
+
+
+def get_llm(name: Optional[str] = None) -> GovernedLLM:
+    """The process-wide model of provider `name` (default settings.LLM_PROVIDER)."""
+    name = name or settings.LLM_PROVIDER
+    llm = _providers.get(name)
+    if llm is None:
+        with _lock:
+            llm = _providers.get(name)
+            if llm is None:
+                llm = _providers[name] = build_provider(name)
+    return llm
+
+
+def provider_stats() -> Dict[str, Dict[str, Any]]:
+    """Call/retry/timeout/throttle counters of every provider built so far."""
+    return {name: dict(llm.limits.stats) for name, llm in _providers.items()}
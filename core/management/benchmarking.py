@@ -0,0 +1,283 @@
+"""Shared helpers for the `bench_*` management commands.
+
+Benchmarks seed a throwaway user with synthetic data directly in SQL
+(generate_series), time the code paths under test and clean up afterwards.
+"""
+
+import asyncio
+import select
+import socket
+import statistics
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+# Tables holding per-user rows, in FK-safe deletion order
+USER_TABLES = (
+    "core_notification",
+    "core_budgetmonthlyspend",
+    "core_transaction",
+    "core_income",
+    "core_goal",
+    "core_budget",
+    "core_account",
+    "core_profile",
+    # Last: deleting from the tables above bumps the version row again
+    "core_userdataversion",
+)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples` (pct in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Return p50/p95/mean/min/max for a list of millisecond timings."""
+    return {
+        "n": len(samples_ms),
+        "p50": percentile(samples_ms, 50),
+        "p95": percentile(samples_ms, 95),
+        "mean": statistics.fmean(samples_ms) if samples_ms else 0.0,
+        "min": min(samples_ms, default=0.0),
+        "max": max(samples_ms, default=0.0),
+    }
+
+
+def time_calls(
+    fn: Callable[[], object], iterations: int = 50, warmup: int = 3
+) -> Dict[str, float]:
+    """Call `fn` repeatedly and return latency stats in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def format_stats(label: str, stats: Dict[str, float]) -> str:
+    """One-line, aligned rendering of `summarize` output."""
+    return (
+        f"{label:<32} n={stats['n']:<5} p50={stats['p50']:>9.2f}ms "
+        f"p95={stats['p95']:>9.2f}ms mean={stats['mean']:>9.2f}ms"
+    )
+
+
+def delete_user_data(user_id: int) -> None:
+    """Hard-delete every row owned by `user_id`, then the user itself."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM core_chatmessage WHERE conversation_id IN "
+            "(SELECT id FROM core_chatconversation WHERE user_id = %s)",
+            [user_id],
+        )
+        cursor.execute(
+            "DELETE FROM core_chatconversation WHERE user_id = %s", [user_id]
+        )
+        for table in USER_TABLES:
+            cursor.execute(f"DELETE FROM {table} WHERE user_id = %s", [user_id])
+        cursor.execute("DELETE FROM auth_user WHERE id = %s", [user_id])
+
+
+@contextmanager
+def bench_user(keep: bool = False) -> Iterator[User]:
+    """Create a throwaway user for a benchmark run and delete it afterwards."""
+    user = User.objects.create_user(
+        username=f"bench_{uuid.uuid4().hex[:12]}", first_name="Bench", last_name="User"
+    )
+    try:
+        yield user
+    finally:
+        if not keep:
+            delete_user_data(user.id)
+
+
+def seed_transactions(
+    user_id: int,
+    count: int,
+    budget_ids: Sequence[int] = (),
+    account_id: Optional[int] = None,
+    days: int = 730,
+    expense_ratio: float = 0.8,
+) -> None:
+    """
+    Insert `count` synthetic transactions spread over the last `days` days.
+
+    Roughly `expense_ratio` of rows are EXPENSE (assigned round-robin to
+    `budget_ids`), the rest DEPOSIT; about 5% are soft-deleted.
+    """
+    budgets = list(budget_ids) or [None]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_transaction
+                (transaction_type, date, amount, description, city, user_id,
+                 budget_id, account_id, neighbourhood, active, created_at)
+            SELECT
+                CASE WHEN random() < %(expense_ratio)s THEN 'EXPENSE' ELSE 'DEPOSIT' END,
+                CURRENT_DATE - (g %% %(days)s),
+                round((random() * 500 + 1)::numeric, 2),
+                'Store ' || (g %% 200),
+                'City ' || (g %% 10),
+                %(user_id)s,
+                (%(budgets)s::bigint[])[1 + g %% %(n_budgets)s],
+                %(account_id)s,
+                'Area ' || (g %% 25),
+                (g %% 20) <> 0,
+                NOW() - make_interval(secs => g)
+            FROM generate_series(1, %(count)s) AS g
+            """,
+            {
+                "expense_ratio": expense_ratio,
+                "days": days,
+                "user_id": user_id,
+                "budgets": budgets,
+                "n_budgets": len(budgets),
+                "account_id": account_id,
+                "count": count,
+            },
+        )
+        cursor.execute("ANALYZE core_transaction")
+
+
+class LatencyProxy:
+    """
+    Local TCP proxy that delays every chunk by `delay_ms / 2` each way.
+
+    Simulates a remote database: each client/server round trip pays about
+    `delay_ms` extra, which is what makes per-query round trips visible.
+    """
+
+    def __init__(self, target_host: str, target_port: int, delay_ms: float):
+        self.target = (target_host, target_port)
+        self.delay = delay_ms / 2000
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        self._closed = threading.Event()
+
+    def _pump(self, source: socket.socket, dest: socket.socket) -> None:
+        try:
+            while not self._closed.is_set():
+                ready, _, _ = select.select([source], [], [], 0.5)
+                if not ready:
+                    continue
+                data = source.recv(65536)
+                if not data:
+                    break
+                time.sleep(self.delay)
+                dest.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, dest):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def _accept_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            upstream = socket.create_connection(self.target)
+            for src, dst in ((client, upstream), (upstream, client)):
+                threading.Thread(target=self._pump, args=(src, dst), daemon=True).start()
+
+    def start(self) -> "LatencyProxy":
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        return self
+
+    def close(self) -> None:
+        self._closed.set()
+        self._server.close()
+
+
+@contextmanager
+def latency_proxy(delay_ms: float) -> Iterator[None]:
+    """Route the default DB connection through a LatencyProxy for the block."""
+    settings_dict = connection.settings_dict
+    original = (settings_dict["HOST"], settings_dict["PORT"])
+    proxy = LatencyProxy(
+        original[0] or "localhost", int(original[1] or 5432), delay_ms
+    ).start()
+    connection.close()
+    settings_dict["HOST"], settings_dict["PORT"] = "127.0.0.1", str(proxy.port)
+    try:
+        yield
+    finally:
+        connection.close()
+        settings_dict["HOST"], settings_dict["PORT"] = original
+        proxy.close()
+
+
+# Importing it builds every agent chain, binding get_llm() at that moment
+AGENT_GRAPH_MODULE = "features.orchestrator.graph"
+
+
+@contextmanager
+def fake_llm(
+    responses: Sequence[Tuple[str, str]],
+    default_response: str = "",
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    max_concurrency: int = 0,
+    rate_per_second: float = 0.0,
+) -> Iterator[Any]:
+    """
+    Make get_llm() return a scripted FakeChatModel (see core.llm_providers.fake).
+
+    Must run before the agents are imported, since they bind their model then.
+    """
+    from core.llm_providers.registry import get_llm
+
+    if AGENT_GRAPH_MODULE in sys.modules:
+        raise CommandError("Agents are already imported with the configured LLM provider.")
+    providers = {
+        **settings.LLM_PROVIDERS,
+        "bench_fake": {
+            "BACKEND": "core.llm_providers.fake.FakeChatModel",
+            "MAX_CONCURRENCY": max_concurrency,
+            "RATE_PER_SECOND": rate_per_second,
+            "BURST": max(1, int(rate_per_second)),
+            "OPTIONS": {
+                "responses": list(responses),
+                "default_response": default_response,
+                "latency_ms": latency_ms,
+                "jitter_ms": jitter_ms,
+                "seed": 0,
+            },
+        },
+    }
+    with override_settings(LLM_PROVIDER="bench_fake", LLM_PROVIDERS=providers):
+        yield get_llm().model
+
+
+async def run_turns(graph: Any, states: List[dict], concurrency: int) -> List[float]:
+    """`graph.ainvoke` every state on one event loop, at most `concurrency` in flight; ms each."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def turn(state: dict) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await graph.ainvoke(state)
+            return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(turn(state) for state in states))
@@ -0,0 +1,57 @@
+"""Fingerprint existing transactions in chunks."""
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from core.models import Transaction
+from core.utils.fingerprint import transaction_fingerprint
+
+
+class Command(BaseCommand):
+    help = "Fill Transaction.fingerprint for rows that do not have one yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every row, not only those missing a fingerprint.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        queryset = Transaction.objects.all()
+        if not options["all"]:
+            queryset = queryset.filter(fingerprint__isnull=True)
+
+        last_id = 0
+        updated = 0
+        while True:
+            # Keyset over the primary key: each chunk is an index range scan
+            rows = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list(
+                    "id", "user_id", "date", "amount", "description",
+                    "account_id", "transaction_type",
+                )[:batch_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            ids = [row[0] for row in rows]
+            fingerprints = [transaction_fingerprint(*row[1:]) for row in rows]
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE core_transaction t SET fingerprint = v.fingerprint
+                    FROM unnest(%s::bigint[], %s::bigint[]) AS v(id, fingerprint)
+                    WHERE t.id = v.id
+                    """,
+                    [ids, fingerprints],
+                )
+            updated += len(rows)
+            self.stdout.write(f"{updated} rows fingerprinted (last id {last_id})")
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {updated} rows fingerprinted."))
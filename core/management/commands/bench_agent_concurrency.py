@@ -0,0 +1,100 @@
+"""Load-test concurrent chat turns per worker against a fake, latency-injecting LLM."""
+
+import asyncio
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from core.management.benchmarking import bench_user, fake_llm, run_turns, summarize
+from core.llm_providers.registry import provider_stats
+
+# Router -> database agent -> confirmation: the longest common chat path
+SCRIPT = [
+    (
+        r"Personal Assistant Orchestrator \(Router\)",
+        json.dumps({"agent": "database_agent", "message": "Show the latest transactions"}),
+    ),
+    (
+        r"read-only database agent",
+        json.dumps({"query": "SELECT 1 AS one", "edit": False, "message": "ok"}),
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = "Measure chat turns/s per worker with a fake LLM of fixed latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--turns", type=int, default=200)
+        parser.add_argument("--concurrency", default="1,8,32,128")
+        parser.add_argument("--latency-ms", type=float, default=500.0)
+        parser.add_argument("--jitter-ms", type=float, default=100.0)
+        parser.add_argument("--message", default="show my latest transactions")
+        parser.add_argument(
+            "--confirmation", default="llm,template", help="DB_CONFIRMATION_MODE values to compare."
+        )
+        parser.add_argument(
+            "--no-fast-router", action="store_true", help="Always make the LLM routing call."
+        )
+        parser.add_argument(
+            "--llm-concurrency", type=int, default=0, help="Provider MAX_CONCURRENCY (0: none)."
+        )
+        parser.add_argument(
+            "--llm-rate", type=float, default=0.0, help="Provider RATE_PER_SECOND (0: none)."
+        )
+
+    def handle(self, *args, **options):
+        with fake_llm(
+            SCRIPT,
+            default_response="Here are your latest transactions.",
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+            max_concurrency=options["llm_concurrency"],
+            rate_per_second=options["llm_rate"],
+        ) as fake:
+            self.run_benchmark(fake, options)
+
+    def run_benchmark(self, fake, options):
+        from features.agent_registry import get_agent
+
+        graph = get_agent("orchestrator")
+
+        with bench_user() as user:
+            state = {
+                "user_id": str(user.id),
+                "conversation_id": "",
+                "user_name": user.username,
+                "user_message": options["message"],
+            }
+            for mode in options["confirmation"].split(","):
+                with override_settings(
+                    DB_CONFIRMATION_MODE=mode, FAST_ROUTER=not options["no_fast_router"]
+                ):
+                    self.run_mode(graph, fake, state, mode, options)
+        self.stdout.write(f"provider: {provider_stats()['bench_fake']}")
+
+    def run_mode(self, graph, fake, state, mode, options):
+        # Import-time and first-call costs stay out of the timings
+        calls_before = fake.calls
+        asyncio.run(graph.ainvoke(dict(state)))
+        calls_per_turn = fake.calls - calls_before
+
+        self.stdout.write(
+            f"--- confirmation={mode}: {calls_per_turn} LLM calls/turn at "
+            f"{options['latency_ms']:.0f}±{options['jitter_ms']:.0f}ms each"
+        )
+        for concurrency in (int(c) for c in options["concurrency"].split(",")):
+            states = [dict(state) for _ in range(options["turns"])]
+            start = time.perf_counter()
+            samples = asyncio.run(run_turns(graph, states, concurrency))
+            wall = time.perf_counter() - start
+            stats = summarize(samples)
+            # Turns/s if nothing but the LLM latency were on the critical path
+            ideal = concurrency * 1000 / max(calls_per_turn * options["latency_ms"], 1e-9)
+            self.stdout.write(
+                f"concurrency={concurrency:<4} {len(samples) / wall:>8.1f} turns/s "
+                f"(ideal {ideal:>7.1f}) "
+                f"p50={stats['p50']:>8.1f}ms p95={stats['p95']:>8.1f}ms"
+            )
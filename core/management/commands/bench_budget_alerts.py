@@ -0,0 +1,81 @@
+"""Benchmark the per-write cost of budget alert evaluation as history grows."""
+
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.management.benchmarking import bench_user, format_stats, seed_transactions, time_calls
+from core.models import Budget, Transaction
+from features.crud.budgets.service import rebuild_budget_rollup, record_expense_change
+
+
+class Rollback(Exception):
+    """Raised to discard the writes of a single timed call."""
+
+
+class Command(BaseCommand):
+    help = (
+        "Time one expense write + alert evaluation at increasing history sizes, "
+        "comparing the incremental evaluator with full re-aggregation."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="1000,10000,100000,1000000",
+            help="Comma separated cumulative history sizes.",
+        )
+        parser.add_argument("--iterations", type=int, default=30)
+
+    def handle(self, *args, **options):
+        sizes = [int(s) for s in options["sizes"].split(",")]
+        iterations = options["iterations"]
+
+        with bench_user() as user:
+            budget = Budget.objects.create(
+                user=user, budget_name="Bench", total_limit=Decimal("1e9")
+            )
+            today = timezone.now().date()
+
+            def write(evaluate):
+                def run():
+                    try:
+                        with transaction.atomic():
+                            txn = Transaction.objects.create(
+                                user=user,
+                                budget=budget,
+                                date=today,
+                                amount=Decimal("12.34"),
+                                transaction_type="EXPENSE",
+                            )
+                            evaluate(txn)
+                            raise Rollback
+                    except Rollback:
+                        pass
+
+                return run
+
+            def incremental(txn):
+                record_expense_change(new_txn=txn)
+
+            def full_reaggregation(txn):
+                # What the old post_save signal did on every write
+                Transaction.objects.filter(budget_id=txn.budget_id, active=True).aggregate(
+                    total=Coalesce(Sum("amount"), Decimal("0.00"))
+                )
+
+            seeded = 0
+            for size in sizes:
+                seed_transactions(
+                    user.id, size - seeded, budget_ids=[budget.id], expense_ratio=1.0
+                )
+                seeded = size
+                rebuild_budget_rollup(user.id)
+
+                self.stdout.write(f"--- history = {size} transactions")
+                self.stdout.write(format_stats("incremental evaluator", time_calls(write(incremental), iterations)))
+                self.stdout.write(format_stats("full re-aggregation", time_calls(write(full_reaggregation), iterations)))
@@ -0,0 +1,71 @@
+"""Benchmark budget stats: raw monthly aggregation vs the spend rollup."""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, DecimalField, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.management.benchmarking import bench_user, format_stats, seed_transactions, time_calls
+from core.models import Account, Budget
+from features.crud.budgets.service import annotate_month_spend, rebuild_budget_rollup
+
+
+class Command(BaseCommand):
+    help = "Compare per-request budget stats cost with and without the rollup table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=1_000_000)
+        parser.add_argument("--budgets", type=int, default=12)
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--keep", action="store_true", help="Keep seeded data.")
+
+    def handle(self, *args, **options):
+        with bench_user(keep=options["keep"]) as user:
+            account = Account.objects.create(user=user, name="Bench")
+            budgets = [
+                Budget.objects.create(
+                    user=user, budget_name=f"Budget {i}", total_limit=1000
+                )
+                for i in range(options["budgets"])
+            ]
+            self.stdout.write(f"Seeding {options['transactions']} transactions...")
+            seed_transactions(
+                user.id,
+                options["transactions"],
+                budget_ids=[b.id for b in budgets],
+                account_id=account.id,
+            )
+            rebuild_budget_rollup(user.id)
+
+            today = timezone.now().date()
+            month_start = today.replace(day=1)
+            month_filter = Q(
+                transaction__date__gte=month_start,
+                transaction__active=True,
+                transaction__transaction_type="EXPENSE",
+            )
+            queryset = Budget.objects.filter(user_id=user.id, active=True)
+
+            def aggregate_path():
+                return list(
+                    queryset.annotate(
+                        monthly_spent=Coalesce(
+                            Sum("transaction__amount", filter=month_filter),
+                            0,
+                            output_field=DecimalField(),
+                        ),
+                        monthly_count=Count("transaction__id", filter=month_filter),
+                    )
+                )
+
+            def rollup_path():
+                return list(annotate_month_spend(queryset, today))
+
+            expected = {b.id: b.monthly_spent for b in aggregate_path()}
+            actual = {b.id: b.monthly_spent for b in rollup_path()}
+            if expected != actual:
+                self.stderr.write("WARNING: rollup and aggregate results differ.")
+
+            iterations = options["iterations"]
+            self.stdout.write(format_stats("aggregate (Sum over join)", time_calls(aggregate_path, iterations)))
+            self.stdout.write(format_stats("rollup (one row per budget)", time_calls(rollup_path, iterations)))
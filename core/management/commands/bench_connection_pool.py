@@ -0,0 +1,127 @@
+"""Benchmark per-request connection handling: connect-per-request vs the psycopg pool."""
+
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Callable, Iterator
+
+from asgiref.sync import async_to_sync
+from django.core.signals import request_finished
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.management.benchmarking import (
+    bench_user,
+    format_stats,
+    latency_proxy,
+    seed_transactions,
+    time_calls,
+)
+from core.models import Account, Budget
+from features.crud.budgets.service import rebuild_budget_rollup
+from features.crud.transactions.endpoints import get_transactions
+from features.dashboard.endpoints import get_dashboard_overview
+
+DEFAULT_POOL = {"min_size": 2, "max_size": 4}
+
+
+@contextmanager
+def connection_mode(pooled: bool) -> Iterator[None]:
+    """Toggle pooling on the default alias (settings are shared by all threads)."""
+    settings_dict = connection.settings_dict
+    options = settings_dict["OPTIONS"]
+    original = (options.get("pool"), settings_dict["CONN_MAX_AGE"])
+    connection.close()
+    connection.close_pool()
+    if pooled:
+        options["pool"] = original[0] or DEFAULT_POOL
+    else:
+        options.pop("pool", None)
+    settings_dict["CONN_MAX_AGE"] = 0
+    try:
+        yield
+    finally:
+        connection.close()
+        connection.close_pool()
+        if original[0] is None:
+            options.pop("pool", None)
+        else:
+            options["pool"] = original[0]
+        settings_dict["CONN_MAX_AGE"] = original[1]
+
+
+def as_request(fn: Callable[[], object]) -> Callable[[], None]:
+    """
+    Run `fn` the way the ASGI handler runs a request: in a fresh thread,
+    followed by request_finished (which closes or returns the connection).
+    """
+
+    def target():
+        try:
+            fn()
+        finally:
+            request_finished.send(sender=Command)
+
+    def run():
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    return run
+
+
+class Command(BaseCommand):
+    help = "Time dashboard/CRUD requests with and without the connection pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=50_000)
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument(
+            "--latency-ms",
+            default="0,5,20",
+            help="Comma-separated simulated round-trip latencies.",
+        )
+
+    def handle(self, *args, **options):
+        with bench_user() as user:
+            account = Account.objects.create(user=user, name="Main", balance=5000)
+            budgets = [
+                Budget.objects.create(user=user, budget_name=f"Budget {i}", total_limit=800)
+                for i in range(10)
+            ]
+            seed_transactions(
+                user.id,
+                options["transactions"],
+                budget_ids=[b.id for b in budgets],
+                account_id=account.id,
+            )
+            rebuild_budget_rollup(user.id)
+
+            request = SimpleNamespace(user=user)
+            endpoints = {
+                "/dashboard/overview": lambda: async_to_sync(get_dashboard_overview)(
+                    request
+                ),
+                "/database/transaction/": lambda: async_to_sync(get_transactions)(
+                    request,
+                    active=True,
+                    start_date=None,
+                    end_date=None,
+                    transaction_type=None,
+                    limit=100,
+                    cursor=None,
+                ),
+            }
+
+            iterations = options["iterations"]
+            for latency in (float(v) for v in options["latency_ms"].split(",")):
+                self.stdout.write(f"--- simulated round trip = {latency:g} ms")
+                with latency_proxy(latency):
+                    for pooled in (False, True):
+                        mode = "pool" if pooled else "connect/request"
+                        with connection_mode(pooled):
+                            for path, call in endpoints.items():
+                                self.stdout.write(format_stats(
+                                    f"{path} [{mode}]",
+                                    time_calls(as_request(call), iterations),
+                                ))
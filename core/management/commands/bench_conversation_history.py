@@ -0,0 +1,94 @@
+"""Benchmark per-turn history loading as a conversation grows."""
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+from core.management.benchmarking import bench_user, format_stats, time_calls
+from core.models import ChatConversation, ChatMessage
+from features.crud.conversations.service import (
+    afold_until_current,
+    format_messages_list,
+    get_conversation_summary,
+)
+
+
+def seed_messages(conversation_id: int, count: int) -> None:
+    """Append `count` alternating user/assistant messages (every third is json)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_chatmessage
+                (conversation_id, sender_type, source_agent, content, content_type,
+                 language, created_at)
+            SELECT %s,
+                   CASE WHEN g %% 2 = 0 THEN 'user' ELSE 'assistant' END,
+                   CASE WHEN g %% 2 = 0 THEN 'User' ELSE 'PersonalAssistant' END,
+                   CASE WHEN g %% 3 = 0 THEN '{"amount": 12.5, "budget_id": 3}'
+                        ELSE 'How much did I spend on groceries in week ' || g || '?' END,
+                   CASE WHEN g %% 3 = 0 THEN 'json' ELSE 'text' END,
+                   'en',
+                   NOW() + g * INTERVAL '1 millisecond'
+            FROM generate_series(1, %s) AS g
+            """,
+            [conversation_id, count],
+        )
+        cursor.execute("ANALYZE core_chatmessage")
+
+
+class Command(BaseCommand):
+    help = "Time history retrieval and prompt size per turn at growing conversation lengths."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="100,1000,10000,50000")
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--window", type=int, default=20)
+        parser.add_argument(
+            "--legacy",
+            action="store_true",
+            help="Also time the previous unbounded fetch (reads every message).",
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(s) for s in options["sizes"].split(",")]
+        window = options["window"]
+
+        # Deterministic summarizer so timings measure storage, not the model
+        with override_settings(
+            CONVERSATION_SUMMARIZER="features.crud.conversations.summarizer.summarize_extractive"
+        ), bench_user() as user:
+            conversation = ChatConversation.objects.create(user=user, channel="bench")
+
+            def bounded():
+                return get_conversation_summary(conversation.id, limit=window)
+
+            def unbounded():
+                messages = list(
+                    ChatMessage.objects.filter(conversation_id=conversation.id)
+                    .exclude(content_type__in=["json"])
+                    .order_by("-id")
+                    .values("content_type", "source_agent", "sender_type", "content")
+                )
+                return format_messages_list(list(reversed(messages)))
+
+            seeded = 0
+            for size in sizes:
+                seed_messages(conversation.id, size - seeded)
+                seeded = size
+
+                self.stdout.write(f"--- conversation = {size} messages")
+                # What the background folds after each turn would have done
+                folds = async_to_sync(afold_until_current)(conversation.id)
+                self.stdout.write(f"summary catch-up: {folds} folds")
+                stats = time_calls(bounded, options["iterations"])
+                self.stdout.write(
+                    format_stats("bounded window", stats)
+                    + f" prompt_chars={len(bounded())}"
+                )
+                if options["legacy"]:
+                    stats = time_calls(unbounded, max(5, options["iterations"] // 10))
+                    self.stdout.write(
+                        format_stats("legacy unbounded", stats)
+                        + f" prompt_chars={len(unbounded())}"
+                    )
@@ -0,0 +1,105 @@
+"""Benchmark the home screen: three endpoints of separate aggregates vs /dashboard/overview."""
+
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from django.db.models import DecimalField, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.management.benchmarking import (
+    bench_user,
+    format_stats,
+    latency_proxy,
+    seed_transactions,
+    time_calls,
+)
+from core.models import Account, Budget, Income, Transaction
+from features.crud.analytics.endpoints import get_overspend
+from features.crud.budgets.service import annotate_month_spend, rebuild_budget_rollup
+from features.dashboard.endpoints import (
+    get_dashboard_budgets,
+    get_dashboard_overview,
+    get_dashboard_summary,
+)
+
+
+def legacy_home_screen(user_id: int) -> None:
+    """The aggregates the three endpoints issued before the overview query."""
+    today = timezone.now().date()
+    total = lambda field: Coalesce(Sum(field), 0, output_field=DecimalField())
+
+    # /dashboard/summary
+    Income.objects.filter(user_id=user_id, active=True).aggregate(t=total("amount"))
+    Transaction.objects.filter(
+        user_id=user_id, active=True, date__gte=today.replace(day=1),
+        transaction_type="EXPENSE",
+    ).aggregate(t=total("amount"))
+    Budget.objects.filter(user_id=user_id, active=True).aggregate(t=total("total_limit"))
+    Account.objects.filter(user_id=user_id, active=True).aggregate(t=total("balance"))
+    # /dashboard/budgets
+    budgets = Budget.objects.filter(user_id=user_id, active=True)
+    list(annotate_month_spend(budgets, today))
+    # /database/analytic/overspend
+    list(annotate_month_spend(budgets, today).values("budget_name", "monthly_spent"))
+    Income.objects.filter(user_id=user_id).aggregate(t=total("amount"))
+    list(Account.objects.filter(user_id=user_id, active=True))
+
+
+class Command(BaseCommand):
+    help = "Time the home-screen data: legacy aggregates, three endpoints, one overview."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=200_000)
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument(
+            "--latency-ms",
+            default="0,5,20",
+            help="Comma-separated simulated round-trip latencies.",
+        )
+
+    def handle(self, *args, **options):
+        with bench_user() as user:
+            account = Account.objects.create(user=user, name="Main", balance=5000)
+            Account.objects.create(user=user, name="Savings", type="SAVINGS", balance=900)
+            Income.objects.create(
+                user=user, account=account, type_income="Salary", amount=4000
+            )
+            budgets = [
+                Budget.objects.create(user=user, budget_name=f"Budget {i}", total_limit=800)
+                for i in range(10)
+            ]
+            self.stdout.write(f"Seeding {options['transactions']} transactions...")
+            seed_transactions(
+                user.id,
+                options["transactions"],
+                budget_ids=[b.id for b in budgets],
+                account_id=account.id,
+            )
+            rebuild_budget_rollup(user.id)
+
+            request = SimpleNamespace(user=user)
+
+            def three_endpoints():
+                async_to_sync(get_dashboard_summary)(request)
+                async_to_sync(get_dashboard_budgets)(request)
+                async_to_sync(get_overspend)(request)
+
+            def overview():
+                async_to_sync(get_dashboard_overview)(request)
+
+            iterations = options["iterations"]
+            for latency in (float(v) for v in options["latency_ms"].split(",")):
+                self.stdout.write(f"--- simulated round trip = {latency:g} ms")
+                with latency_proxy(latency):
+                    self.stdout.write(format_stats(
+                        "legacy aggregates (10 queries)",
+                        time_calls(lambda: legacy_home_screen(user.id), iterations),
+                    ))
+                    self.stdout.write(format_stats(
+                        "3 endpoints (projections)", time_calls(three_endpoints, iterations)
+                    ))
+                    self.stdout.write(format_stats(
+                        "/dashboard/overview", time_calls(overview, iterations)
+                    ))
@@ -0,0 +1,79 @@
+"""Offline accuracy/latency benchmark of the fast-path router against recorded decisions."""
+
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.benchmarking import summarize
+from features.orchestrator.fast_router import (
+    AGENTS,
+    NaiveBayesRouter,
+    classify,
+    logged_routing_decisions,
+    read_routing_dataset,
+)
+
+
+class Command(BaseCommand):
+    help = "Measure fast-router hit rate, accuracy and latency on recorded routing decisions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dataset", default=None, help="JSON-lines file of {message, agent} (default: chat log)."
+        )
+        parser.add_argument("--limit", type=int, default=50_000)
+        parser.add_argument(
+            "--holdout", type=float, default=0.2, help="Newest fraction used only for evaluation."
+        )
+        parser.add_argument("--min-confidence", default="0.8,0.9,0.95")
+        parser.add_argument(
+            "--llm-ms", type=float, default=1500.0, help="LLM routing call latency to credit per hit."
+        )
+
+    def handle(self, *args, **options):
+        samples = (
+            read_routing_dataset(options["dataset"])
+            if options["dataset"]
+            else logged_routing_decisions(options["limit"])[::-1]  # oldest first
+        )
+        if len(samples) < 10:
+            raise CommandError(f"Need at least 10 recorded decisions, found {len(samples)}.")
+
+        split = int(len(samples) * (1 - options["holdout"]))
+        train, test = samples[:split], samples[split:]
+        model = NaiveBayesRouter().fit(train)
+        self.stdout.write(
+            f"train={len(train)} test={len(test)} "
+            f"test mix={dict(Counter(agent for _, agent in test))}"
+        )
+        self.stdout.write(f"confusion: rows = recorded agent, columns = routed to {AGENTS}")
+
+        configs = [("rules only", None, 1.0)] + [
+            (f"rules + model >= {c}", model, float(c))
+            for c in options["min_confidence"].split(",")
+        ]
+        for label, router_model, min_confidence in configs:
+            hits = correct = 0
+            confusion = Counter()
+            samples_ms = []
+            for text, expected in test:
+                start = time.perf_counter()
+                route = classify(text, router_model, min_confidence)
+                samples_ms.append((time.perf_counter() - start) * 1000)
+                if route is None:
+                    continue
+                hits += 1
+                correct += route.agent == expected
+                confusion[(expected, route.agent)] += 1
+
+            stats = summarize(samples_ms)
+            self.stdout.write(
+                f"--- {label}: hit rate {hits / len(test):.1%}, "
+                f"accuracy on hits {correct / hits if hits else 0:.1%}, "
+                f"p50={stats['p50'] * 1000:.0f}us p95={stats['p95'] * 1000:.0f}us, "
+                f"LLM time saved ~{hits * options['llm_ms'] / 1000:.0f}s"
+            )
+            for expected in AGENTS:
+                row = "  ".join(f"{confusion[(expected, got)]:>6}" for got in AGENTS)
+                self.stdout.write(f"    {expected:<28} -> {row}")
@@ -0,0 +1,69 @@
+"""Benchmark repeated database-agent aggregates with and without the query result cache."""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.management.benchmarking import bench_user, format_stats, seed_transactions, time_calls
+from core.models import Budget, Transaction
+from core.utils.database import run_select
+from features.database_agent.result_cache import get_result_cache
+
+# The kind of SQL one behaviour-analyst run issues, several times over
+QUERIES = [
+    "SELECT ROUND(SUM(amount), 2) AS total FROM core_transaction "
+    "WHERE user_id = {user_id} AND active = true AND transaction_type = 'EXPENSE' "
+    "AND date >= DATE_TRUNC('month', CURRENT_DATE)",
+    "SELECT b.budget_name, ROUND(SUM(t.amount), 2) AS spent FROM core_transaction t "
+    "JOIN core_budget b ON b.id = t.budget_id WHERE t.user_id = {user_id} "
+    "AND t.active = true AND t.date >= CURRENT_DATE - INTERVAL '90 days' "
+    "GROUP BY b.budget_name ORDER BY spent DESC",
+    "SELECT DATE_TRUNC('month', date) AS month, ROUND(SUM(amount), 2) AS total "
+    "FROM core_transaction WHERE user_id = {user_id} AND active = true "
+    "AND transaction_type = 'EXPENSE' GROUP BY month ORDER BY month",
+    "SELECT description, COUNT(*) AS times, ROUND(AVG(amount), 2) AS average "
+    "FROM core_transaction WHERE user_id = {user_id} AND active = true "
+    "GROUP BY description ORDER BY times DESC LIMIT 20",
+]
+
+
+class Command(BaseCommand):
+    help = "Time repeated agent aggregates: Postgres every time vs the per-user result cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=100_000)
+        parser.add_argument("--iterations", type=int, default=30)
+
+    def handle(self, *args, **options):
+        with bench_user() as user:
+            budgets = [
+                Budget.objects.create(user=user, budget_name=f"Budget {i}", total_limit=800)
+                for i in range(10)
+            ]
+            self.stdout.write(f"Seeding {options['transactions']} transactions...")
+            seed_transactions(user.id, options["transactions"], budget_ids=[b.id for b in budgets])
+            queries = [sql.format(user_id=user.id) for sql in QUERIES]
+
+            cache = get_result_cache()
+
+            # What the database agent's _execute_select_query does per SELECT
+            def analysis(cached: bool) -> None:
+                for sql in queries:
+                    if cached:
+                        cache.fetch(sql, None, user.id, lambda: run_select(sql))
+                    else:
+                        run_select(sql)
+
+            cache.clear()
+            for label, cached in (("postgres", False), ("result_cache", True)):
+                stats = time_calls(lambda: analysis(cached), iterations=options["iterations"])
+                self.stdout.write(format_stats(f"{len(queries)} aggregates, {label}", stats))
+            self.stdout.write(f"result cache: {cache.report()}")
+
+            # A write bumps the user's data version: the next run misses again
+            Transaction.objects.create(user=user, date=timezone.localdate(), amount=10)
+            misses = cache.stats.misses
+            analysis(cached=True)
+            self.stdout.write(
+                f"after one new transaction: {cache.stats.misses - misses}/{len(queries)} "
+                f"queries went back to Postgres"
+            )
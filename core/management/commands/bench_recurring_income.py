@@ -0,0 +1,138 @@
+"""Benchmark the recurring income job: set-based chunks vs the per-income loop."""
+
+import calendar
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.management.benchmarking import bench_user
+from core.models import Account, Income, Transaction
+from features.crud.income.service import INCOME_CHUNK_SIZE, process_due_incomes
+
+
+def seed_incomes(user_id: int, account_ids: list, count: int, max_months_behind: int) -> None:
+    """Insert `count` due incomes, up to `max_months_behind` months overdue."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_income
+                (user_id, account_id, type_income, amount, payment_day,
+                 next_payment_date, active, created_at)
+            SELECT %(user_id)s,
+                   (%(accounts)s::bigint[])[1 + g %% %(n_accounts)s],
+                   'Salary', 1000 + g %% 500, 1 + g %% 31,
+                   CURRENT_DATE - (g %% (%(months)s * 30 + 1)),
+                   TRUE, NOW()
+            FROM generate_series(1, %(count)s) AS g
+            """,
+            {
+                "user_id": user_id,
+                "accounts": account_ids,
+                "n_accounts": len(account_ids),
+                "months": max_months_behind,
+                "count": count,
+            },
+        )
+        cursor.execute("ANALYZE core_income")
+
+
+def legacy_next_date(current, anchor_day):
+    year, month = current.year + current.month // 12, current.month % 12 + 1
+    _, last = calendar.monthrange(year, month)
+    return current.replace(year=year, month=month, day=min(anchor_day, last))
+
+
+def legacy_run(user_id: int, today) -> int:
+    """What RecurringIncomeJob.do did: one transaction and three writes per income."""
+    count = 0
+    due = Income.objects.filter(
+        user_id=user_id, active=True, next_payment_date__lte=today,
+        payment_day__isnull=False,
+    ).select_related("account", "user")
+    for income in due:
+        with transaction.atomic():
+            income.account.balance = F("balance") + income.amount
+            income.account.save(update_fields=["balance"])
+            Transaction.objects.create(
+                user=income.user, transaction_type="DEPOSIT", date=today,
+                amount=income.amount,
+                description=f"{income.type_income} Recurring Income",
+                account=income.account, income_source=income,
+            )
+            income.next_payment_date = legacy_next_date(
+                income.next_payment_date, income.payment_day
+            )
+            income.save()
+            count += 1
+    return count
+
+
+class Command(BaseCommand):
+    help = "Time the recurring income job over many overdue incomes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--incomes", type=int, default=100_000)
+        parser.add_argument("--accounts", type=int, default=1_000)
+        parser.add_argument("--months-behind", type=int, default=6)
+        parser.add_argument("--chunk-size", type=int, default=INCOME_CHUNK_SIZE)
+        parser.add_argument("--workers", type=int, default=1, help="Concurrent job runs.")
+        parser.add_argument(
+            "--legacy-sample",
+            type=int,
+            default=2_000,
+            help="Incomes run through the old loop to extrapolate it (0 to skip).",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+        with bench_user() as user:
+            accounts = Account.objects.bulk_create(
+                Account(user=user, name=f"Bench {i}") for i in range(options["accounts"])
+            )
+            account_ids = [a.id for a in accounts]
+            seed_incomes(user.id, account_ids, options["incomes"], options["months_behind"])
+
+            def worker(_):
+                try:
+                    return process_due_incomes(today, options["chunk_size"], user.id)
+                finally:
+                    connection.close()
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(options["workers"]) as pool:
+                results = list(pool.map(worker, range(options["workers"])))
+            elapsed = time.perf_counter() - start
+
+            incomes = sum(r["incomes"] for r in results)
+            deposits = sum(r["deposits"] for r in results)
+            self.stdout.write(
+                f"set-based: {incomes} incomes, {deposits} deposits in {elapsed:.2f}s "
+                f"with {options['workers']} worker(s) ({incomes / elapsed:,.0f} incomes/s)"
+            )
+            expected = Transaction.objects.filter(user_id=user.id).count()
+            if expected != deposits:
+                self.stderr.write(f"deposit count mismatch: {expected} rows vs {deposits}")
+
+            # Idempotency: a second run finds nothing to do
+            again = process_due_incomes(today, options["chunk_size"], user.id)
+            self.stdout.write(f"re-run: {again['deposits']} deposits")
+
+            sample = options["legacy_sample"]
+            if sample:
+                Income.objects.filter(
+                    id__in=Income.objects.filter(user_id=user.id)
+                    .order_by("id")
+                    .values("id")[:sample]
+                ).update(next_payment_date=today)
+                start = time.perf_counter()
+                processed = legacy_run(user.id, today)
+                per_income = (time.perf_counter() - start) / max(processed, 1)
+                self.stdout.write(
+                    f"per-income loop: {per_income * 1000:.2f} ms/income -> "
+                    f"{per_income * options['incomes']:.1f}s extrapolated for "
+                    f"{options['incomes']} incomes (one period each)"
+                )
@@ -0,0 +1,145 @@
+"""Benchmark CRUD throughput: Waitress (WSGI, threads) vs run_server.py (ASGI workers)."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.benchmarking import bench_user, seed_transactions, summarize
+from core.models import Account, Budget, Goal, Income
+from features.auth.utils import create_token_pair
+from features.crud.budgets.service import rebuild_budget_rollup
+
+CRUD_PATHS = (
+    "/api/dashboard/overview",
+    "/api/database/transaction/?limit=100",
+    "/api/database/budget/",
+    "/api/database/goal/",
+    "/api/database/income/",
+    "/api/database/account/",
+)
+
+
+@contextmanager
+def running_server(command: List[str], port: int, env: Dict[str, str]) -> Iterator[str]:
+    """Start a server subprocess and wait until it answers HTTP."""
+    process = subprocess.Popen(
+        command,
+        cwd=settings.BASE_DIR,
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            if process.poll() is not None:
+                raise CommandError(f"{command[0]} exited with {process.returncode}")
+            try:
+                httpx.get(f"{base_url}/api/personal_assistant/health", timeout=1)
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise CommandError(f"{command[0]} did not start within 60s")
+                time.sleep(0.25)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def load(base_url: str, token: str, requests: int, concurrency: int) -> Dict[str, float]:
+    """Issue `requests` GETs round-robin over CRUD_PATHS from `concurrency` clients."""
+    local = threading.local()
+    headers = {"Authorization": f"Bearer {token}"}
+    errors = []
+
+    def call(i: int) -> float:
+        if not hasattr(local, "client"):
+            local.client = httpx.Client(base_url=base_url, headers=headers, timeout=60)
+        start = time.perf_counter()
+        response = local.client.get(CRUD_PATHS[i % len(CRUD_PATHS)])
+        elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code != 200:
+            errors.append(response.status_code)
+        return elapsed
+
+    # Warm every worker/thread before timing
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(call, range(concurrency * len(CRUD_PATHS))))
+        errors.clear()
+        start = time.perf_counter()
+        samples = list(pool.map(call, range(requests)))
+        wall = time.perf_counter() - start
+
+    stats = summarize(samples)
+    stats["rps"] = requests / wall
+    stats["errors"] = len(errors)
+    return stats
+
+
+class Command(BaseCommand):
+    help = "Compare CRUD endpoint throughput under Waitress/WSGI and uvicorn/ASGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=20_000)
+        parser.add_argument("--requests", type=int, default=2_000)
+        parser.add_argument("--concurrency", default="1,8,32")
+        parser.add_argument("--workers", type=int, default=2, help="ASGI worker processes.")
+        parser.add_argument("--threads", type=int, default=8, help="Waitress threads.")
+        parser.add_argument("--port", type=int, default=8765)
+
+    def handle(self, *args, **options):
+        port = options["port"]
+        modes = {
+            f"waitress wsgi ({options['threads']} threads)": [
+                sys.executable, "-m", "waitress",
+                f"--port={port}", f"--threads={options['threads']}",
+                "config.wsgi:application",
+            ],
+            f"uvicorn asgi ({options['workers']} workers)": [
+                sys.executable, "run_server.py",
+                f"--port={port}", f"--workers={options['workers']}",
+                "--max-requests=0",
+            ],
+        }
+
+        with bench_user() as user:
+            account = Account.objects.create(user=user, name="Main", balance=5000)
+            budgets = [
+                Budget.objects.create(user=user, budget_name=f"Budget {i}", total_limit=800)
+                for i in range(10)
+            ]
+            Goal.objects.create(user=user, goal_name="Car", target=5000)
+            Income.objects.create(user=user, account=account, type_income="Salary", amount=4000)
+            seed_transactions(
+                user.id,
+                options["transactions"],
+                budget_ids=[b.id for b in budgets],
+                account_id=account.id,
+            )
+            rebuild_budget_rollup(user.id)
+            token = create_token_pair(user)["access"]
+
+            for label, command in modes.items():
+                self.stdout.write(f"--- {label}")
+                with running_server(command, port, {"WEB_LOG_LEVEL": "warning"}) as url:
+                    for concurrency in (int(c) for c in options["concurrency"].split(",")):
+                        stats = load(url, token, options["requests"], concurrency)
+                        self.stdout.write(
+                            f"concurrency={concurrency:<4} {stats['rps']:>8.1f} req/s "
+                            f"p50={stats['p50']:>8.2f}ms p95={stats['p95']:>8.2f}ms "
+                            f"errors={stats['errors']}"
+                        )
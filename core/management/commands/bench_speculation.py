@@ -0,0 +1,110 @@
+"""Cost/latency report for speculative database-agent runs, against a fake LLM."""
+
+import asyncio
+import json
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from core.management.benchmarking import bench_user, fake_llm, run_turns, summarize
+from features.orchestrator.speculation import reset_speculation_stats, speculation_stats
+
+# "(chat)" turns look like lookups to the fast router, but the LLM router
+# sends them to the personal assistant: the speculative run is wasted.
+SCRIPT = [
+    (
+        r"User: [^\n]*\(chat\)",
+        json.dumps({"agent": "personal_assistant_response", "message": "Reassure the user."}),
+    ),
+    (
+        r"Personal Assistant Orchestrator \(Router\)",
+        json.dumps({"agent": "database_agent", "message": "Total Food spending this month."}),
+    ),
+    (
+        r"read-only database agent",
+        json.dumps({"query": "SELECT 1 AS one", "edit": False, "message": "ok"}),
+    ),
+]
+
+LOOKUP_MESSAGE = "my food spending this month #{i}"
+DISAGREE_MESSAGE = "my food spending worries me #{i} (chat)"
+
+
+class Command(BaseCommand):
+    help = "Compare turn latency and LLM calls with and without speculative database-agent runs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--turns", type=int, default=100)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--latency-ms", type=float, default=800.0)
+        parser.add_argument("--jitter-ms", type=float, default=200.0)
+        parser.add_argument(
+            "--disagree-rate",
+            type=float,
+            default=0.2,
+            help="Fraction of probable-data turns the LLM router sends elsewhere.",
+        )
+
+    def handle(self, *args, **options):
+        with fake_llm(
+            SCRIPT,
+            default_response="Sure, here you go.",
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+        ) as fake:
+            self.run_benchmark(fake, options)
+
+    def run_benchmark(self, fake, options):
+        from features.agent_registry import get_agent
+
+        graph = get_agent("orchestrator")
+        every = round(1 / options["disagree_rate"]) if options["disagree_rate"] > 0 else 0
+
+        with bench_user() as user:
+            states = [
+                {
+                    "user_id": str(user.id),
+                    "conversation_id": "",
+                    "user_name": user.username,
+                    "user_message": (
+                        DISAGREE_MESSAGE if every and i % every == 0 else LOOKUP_MESSAGE
+                    ).format(i=i),
+                }
+                for i in range(options["turns"])
+            ]
+            # Import-time and first-call costs stay out of the timings
+            asyncio.run(graph.ainvoke(dict(states[-1])))
+
+            results = {}
+            for label, enabled in (("sequential", False), ("speculative", True)):
+                with override_settings(SPECULATIVE_DB=enabled):
+                    reset_speculation_stats()
+                    calls_before = fake.calls
+                    samples = asyncio.run(
+                        run_turns(graph, [dict(s) for s in states], options["concurrency"])
+                    )
+                    results[label] = {
+                        **summarize(samples),
+                        "llm_calls": fake.calls - calls_before,
+                        "speculation": speculation_stats(),
+                    }
+
+        turns = options["turns"]
+        for label, result in results.items():
+            self.stdout.write(
+                f"{label:<12} p50={result['p50']:>8.1f}ms p95={result['p95']:>8.1f}ms "
+                f"mean={result['mean']:>8.1f}ms LLM calls/turn={result['llm_calls'] / turns:.2f}"
+            )
+        spec = results["speculative"]["speculation"]
+        base = results["sequential"]
+        extra_calls = results["speculative"]["llm_calls"] - base["llm_calls"]
+        self.stdout.write(
+            f"speculation: started={spec['started']} used={spec['used']} "
+            f"discarded={spec['discarded']} failed={spec['failed']} "
+            f"avg saved={spec['avg_saved_ms']:.0f}ms/used turn"
+        )
+        self.stdout.write(
+            f"mean latency {base['mean'] - results['speculative']['mean']:+.0f}ms/turn saved "
+            f"for {extra_calls} extra LLM calls "
+            f"({extra_calls / max(base['llm_calls'], 1):+.1%} of the sequential total)"
+        )
@@ -0,0 +1,113 @@
+"""Hit rate and saved LLM latency of the database agent's SQL plan cache, against a fake LLM."""
+
+import asyncio
+import json
+import random
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from core.management.benchmarking import bench_user, fake_llm, run_turns, summarize
+from core.models import SqlPlan
+from features.database_agent.plan_cache import get_plan_cache, normalize_request
+
+REQUEST = "Total spending on item {i} this month"
+SQL = (
+    "SELECT ROUND(COALESCE(SUM(amount), 0), 2) AS total FROM core_transaction "
+    "WHERE user_id = {user_id} AND date >= '{month_start}' AND description ILIKE '%item {i}%'"
+)
+
+
+def script(user_ids, requests):
+    """One scripted DatabaseAgent answer per (user, request), as the LLM would write it."""
+    month_start = timezone.localdate().replace(day=1).isoformat()
+    return [
+        (
+            rf"request: {REQUEST.format(i=i)}\s+user_id: {user_id}\b",
+            json.dumps(
+                {
+                    "query": SQL.format(user_id=user_id, month_start=month_start, i=i),
+                    "edit": False,
+                    "message": f"Total for item {i} this month.",
+                }
+            ),
+        )
+        for user_id in user_ids
+        for i in range(requests)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Compare database-agent latency and LLM calls with and without the SQL plan cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=5)
+        parser.add_argument("--requests", type=int, default=10, help="Distinct request texts.")
+        parser.add_argument("--turns", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--latency-ms", type=float, default=800.0)
+        parser.add_argument("--jitter-ms", type=float, default=200.0)
+
+    def handle(self, *args, **options):
+        with ExitStack() as stack:
+            users = [stack.enter_context(bench_user()) for _ in range(options["users"])]
+            fake = stack.enter_context(
+                fake_llm(
+                    script([user.id for user in users], options["requests"]),
+                    default_response=json.dumps({"query": "", "edit": False, "message": "?"}),
+                    latency_ms=options["latency_ms"],
+                    jitter_ms=options["jitter_ms"],
+                )
+            )
+            self.run_benchmark(fake, users, options)
+
+    def forget_bench_plans(self, requests):
+        get_plan_cache().clear()
+        SqlPlan.objects.filter(
+            request_text__in=[normalize_request(REQUEST.format(i=i)) for i in range(requests)]
+        ).delete()
+
+    def run_benchmark(self, fake, users, options):
+        from features.database_agent.graph import database_agent_super_agent as graph
+
+        rng = random.Random(0)
+        states = [
+            {
+                "user_id": rng.choice(users).id,
+                "request": REQUEST.format(i=rng.randrange(options["requests"])),
+            }
+            for _ in range(options["turns"])
+        ]
+
+        results = {}
+        try:
+            for label, enabled in (("llm", False), ("plan_cache", True)):
+                self.forget_bench_plans(options["requests"])
+                # Result caching would hide the SQL cost both runs still pay
+                with override_settings(SQL_PLAN_CACHE=enabled, QUERY_RESULT_CACHE=False):
+                    calls_before = fake.calls
+                    samples = asyncio.run(
+                        run_turns(graph, [dict(s) for s in states], options["concurrency"])
+                    )
+                    results[label] = {
+                        **summarize(samples),
+                        "llm_calls": fake.calls - calls_before,
+                        "plans": get_plan_cache().report(),
+                    }
+        finally:
+            self.forget_bench_plans(options["requests"])
+
+        turns = options["turns"]
+        for label, result in results.items():
+            self.stdout.write(
+                f"{label:<11} p50={result['p50']:>8.1f}ms p95={result['p95']:>8.1f}ms "
+                f"mean={result['mean']:>8.1f}ms LLM calls/turn={result['llm_calls'] / turns:.2f}"
+            )
+        plans = results["plan_cache"]["plans"]
+        self.stdout.write(
+            f"plan cache: hits={plans['hits']} misses={plans['misses']} "
+            f"hit rate={plans['hit_rate']:.1%} saved LLM time={plans['saved_llm_ms'] / 1000:.1f}s "
+            f"({plans['saved_llm_ms'] / max(plans['hits'], 1):.0f}ms/hit)"
+        )
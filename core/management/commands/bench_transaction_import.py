@@ -0,0 +1,85 @@
+"""Benchmark bulk statement import: COPY + set-based merge vs per-row expense writes."""
+
+import io
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.management.benchmarking import bench_user
+from core.models import Account, Budget, Transaction
+from features.crud.budgets.service import record_expense_change
+from features.crud.transactions.imports.parsers import iter_csv_rows
+from features.crud.transactions.imports.service import import_statement
+
+
+def synthetic_statement(rows: int, budget_names: list) -> str:
+    """A CSV statement of `rows` lines over the last two years."""
+    rng = random.Random(42)
+    today = date.today()
+    lines = ["date,amount,description,city,budget"]
+    for i in range(rows):
+        day = today - timedelta(days=rng.randrange(730))
+        amount = rng.uniform(1, 500)
+        budget = budget_names[i % len(budget_names)] if i % 3 else ""
+        lines.append(f"{day.isoformat()},-{amount:.2f},Store {i % 300},Cairo,{budget}")
+    return "\n".join(lines) + "\n"
+
+
+class Command(BaseCommand):
+    help = "Time a bulk statement import and compare with the per-row write path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument(
+            "--per-row-sample",
+            type=int,
+            default=2_000,
+            help="Rows written one by one to extrapolate the per-row path.",
+        )
+
+    def handle(self, *args, **options):
+        with bench_user() as user:
+            account = Account.objects.create(user=user, name="Bench", balance=10_000_000)
+            budgets = [
+                Budget.objects.create(user=user, budget_name=f"Budget {i}", total_limit=5000)
+                for i in range(10)
+            ]
+            statement = synthetic_statement(options["rows"], [b.budget_name for b in budgets])
+
+            start = time.perf_counter()
+            report = import_statement(
+                user.id, account.id, iter_csv_rows(io.StringIO(statement))
+            )
+            bulk_seconds = time.perf_counter() - start
+            self.stdout.write(
+                f"bulk import: {report['imported']} rows in {bulk_seconds:.2f}s "
+                f"({report['imported'] / bulk_seconds:,.0f} rows/s)"
+            )
+
+            sample = options["per_row_sample"]
+            rows = [r for _, r in zip(range(sample), iter_csv_rows(io.StringIO(statement)))]
+            start = time.perf_counter()
+            for row in rows:
+                # What POST /database/expense/ does per row
+                with transaction.atomic():
+                    acc = Account.objects.get(id=account.id)
+                    txn = Transaction.objects.create(
+                        user_id=user.id,
+                        date=row.date,
+                        amount=row.amount,
+                        description=row.description,
+                        budget_id=budgets[row.line % len(budgets)].id,
+                        account_id=account.id,
+                    )
+                    record_expense_change(new_txn=txn)
+                    acc.balance -= row.amount
+                    acc.save(update_fields=["balance"])
+                    Transaction.objects.filter(id=txn.id).values().first()
+            per_row = (time.perf_counter() - start) / len(rows)
+            self.stdout.write(
+                f"per-row path: {per_row * 1000:.2f} ms/row -> "
+                f"{per_row * options['rows']:.1f}s extrapolated for {options['rows']} rows"
+            )
@@ -0,0 +1,75 @@
+"""Benchmark transaction search: legacy icontains-over-join vs trigram-indexed modes."""
+
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from core.management.benchmarking import bench_user, format_stats, seed_transactions, time_calls
+from core.models import Account, Budget, Transaction
+from features.crud.analytics.endpoints import search_transactions
+
+
+def legacy_search(user_id: int, text: str, limit: int = 100) -> list:
+    """The previous query shape: ICONTAINS on description OR the joined budget name."""
+    return list(
+        Transaction.objects.filter(user_id=user_id, active=True)
+        .filter(Q(description__icontains=text) | Q(budget__budget_name__icontains=text))
+        .order_by("-date")
+        .values("id", "date", "amount", "description", "budget__budget_name")[:limit]
+    )
+
+
+class Command(BaseCommand):
+    help = "Time transaction search latency per mode on a large single-tenant history."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=1_000_000)
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--keep", action="store_true", help="Keep seeded data.")
+
+    def handle(self, *args, **options):
+        with bench_user(keep=options["keep"]) as user:
+            account = Account.objects.create(user=user, name="Bench")
+            budgets = [
+                Budget.objects.create(user=user, budget_name=name, total_limit=1000)
+                for name in ("Groceries", "Transport", "Dining", "Utilities")
+            ]
+            self.stdout.write(f"Seeding {options['transactions']} transactions...")
+            seed_transactions(
+                user.id,
+                options["transactions"],
+                budget_ids=[b.id for b in budgets],
+                account_id=account.id,
+            )
+
+            request = SimpleNamespace(user=user)
+
+            def search(text, mode):
+                return lambda: async_to_sync(search_transactions)(
+                    request,
+                    query_text=text,
+                    mode=mode,
+                    category=None,
+                    min_amount=None,
+                    max_amount=None,
+                    start_date=None,
+                    end_date=None,
+                    city=None,
+                    neighbourhood=None,
+                    limit=100,
+                )
+
+            iterations = options["iterations"]
+            for text in ("Store 17", "tore 1", "St"):
+                self.stdout.write(f"--- query = {text!r}")
+                self.stdout.write(format_stats(
+                    "legacy (icontains + join)",
+                    time_calls(lambda: legacy_search(user.id, text), iterations),
+                ))
+                for mode in ("contains", "prefix"):
+                    self.stdout.write(format_stats(mode, time_calls(search(text, mode), iterations)))
+
+            self.stdout.write("--- query = 'stroe 17' (typo)")
+            self.stdout.write(format_stats("fuzzy", time_calls(search("stroe 17", "fuzzy"), iterations)))
@@ -0,0 +1,88 @@
+"""Benchmark the user summary: per-section queries vs one consolidated statement."""
+
+from django.core.management.base import BaseCommand
+
+from core.management.benchmarking import (
+    bench_user,
+    format_stats,
+    latency_proxy,
+    seed_transactions,
+    time_calls,
+)
+from core.models import Account, Budget, Goal, Income, Profile
+from features.crud.budgets.service import fetch_active_budgets
+from features.crud.users.service import (
+    build_user_summary,
+    fetch_active_goals,
+    fetch_income_total,
+    fetch_spending_stats,
+    fetch_user_accounts,
+    fetch_user_profile,
+    format_user_summary,
+)
+
+
+def legacy_summary(user_id: int) -> str:
+    """The previous implementation: one round trip per section."""
+    return format_user_summary(
+        user_id=user_id,
+        profile=fetch_user_profile(user_id),
+        income=fetch_income_total(user_id),
+        accounts=fetch_user_accounts(user_id),
+        goals=fetch_active_goals(user_id),
+        budgets=fetch_active_budgets(user_id),
+        spending_stats=fetch_spending_stats(user_id, months_back=3),
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Time get_user_summary's data fetch as separate queries vs a single "
+        "CTE statement, optionally through a latency-injecting proxy."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--transactions", type=int, default=100_000)
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument(
+            "--latency-ms",
+            default="0,5,20",
+            help="Comma-separated simulated round-trip latencies.",
+        )
+
+    def handle(self, *args, **options):
+        with bench_user() as user:
+            Profile.objects.create(user=user, job_title="Analyst")
+            account = Account.objects.create(user=user, name="Main", balance=5000)
+            Account.objects.create(user=user, name="Savings", type="SAVINGS")
+            Income.objects.create(
+                user=user, account=account, type_income="Salary", amount=4000
+            )
+            Goal.objects.create(user=user, goal_name="Car", target=20000)
+            budgets = [
+                Budget.objects.create(user=user, budget_name=f"Budget {i}", total_limit=800)
+                for i in range(8)
+            ]
+            self.stdout.write(f"Seeding {options['transactions']} transactions...")
+            seed_transactions(
+                user.id,
+                options["transactions"],
+                budget_ids=[b.id for b in budgets],
+                account_id=account.id,
+            )
+
+            if legacy_summary(user.id) != build_user_summary(user.id):
+                self.stderr.write("WARNING: legacy and consolidated summaries differ.")
+
+            iterations = options["iterations"]
+            for latency in (float(v) for v in options["latency_ms"].split(",")):
+                self.stdout.write(f"--- simulated round trip = {latency:g} ms")
+                with latency_proxy(latency):
+                    self.stdout.write(format_stats(
+                        "legacy (per-section queries)",
+                        time_calls(lambda: legacy_summary(user.id), iterations),
+                    ))
+                    self.stdout.write(format_stats(
+                        "consolidated (1 statement)",
+                        time_calls(lambda: build_user_summary(user.id), iterations),
+                    ))
@@ -0,0 +1,54 @@
+"""Export a user's ledger to a file (or stdout) for support/offline analysis."""
+
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from features.crud.exports.service import (
+    EXPORT_COMPRESSIONS,
+    EXPORT_FORMATS,
+    export_chunks,
+    parse_datasets,
+)
+
+
+class Command(BaseCommand):
+    help = "Stream a user's transactions/budgets/goals/income through a server-side cursor."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, required=True)
+        parser.add_argument("--datasets", help="Comma-separated; default: all.")
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+        parser.add_argument("--compression", choices=EXPORT_COMPRESSIONS)
+        parser.add_argument("--output", "-o", help="File path; default: stdout.")
+
+    def handle(self, *args, **options):
+        datasets = options["datasets"]
+        if not datasets and options["format"] == "csv":
+            datasets = "transactions"
+        try:
+            chunks = export_chunks(
+                options["user"],
+                parse_datasets(datasets),
+                options["format"],
+                options["compression"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        start = time.perf_counter()
+        written = 0
+        output = open(options["output"], "wb") if options["output"] else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if options["output"]:
+                output.close()
+        elapsed = time.perf_counter() - start
+
+        self.stderr.write(self.style.SUCCESS(
+            f"Exported {written / 1024:.1f} KiB in {elapsed:.2f}s."
+        ))
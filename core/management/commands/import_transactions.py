@@ -0,0 +1,41 @@
+"""Import a CSV/OFX bank statement for a user."""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from features.crud.transactions.imports.parsers import iter_statement_rows
+from features.crud.transactions.imports.service import import_statement
+
+
+class Command(BaseCommand):
+    help = "Stream a CSV or OFX statement into core_transaction (COPY + set-based merge)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--user", type=int, required=True)
+        parser.add_argument("--account", type=int, help="Account whose balance is adjusted.")
+        parser.add_argument("--format", choices=["csv", "ofx"], help="Defaults to the file extension.")
+        parser.add_argument("--date-format", default="%Y-%m-%d", help="CSV date format.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or path.rsplit(".", 1)[-1].lower()
+        extra = {"date_format": options["date_format"]} if file_format == "csv" else {}
+
+        start = time.perf_counter()
+        try:
+            with open(path, encoding="utf-8-sig", newline="") as stream:
+                rows = iter_statement_rows(stream, file_format, **extra)
+                report = import_statement(options["user"], options["account"], rows)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+        elapsed = time.perf_counter() - start
+
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['imported']} transactions in {elapsed:.2f}s "
+            f"({report['skipped']} skipped, {report['unbudgeted_expenses']} expenses "
+            f"without a budget, {report['budget_months_updated']} budget-months updated)."
+        ))
@@ -0,0 +1,90 @@
+"""Profile worker cold start: import time and baseline RSS per process role."""
+
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter; the last stdout line is the JSON result
+STARTUP_SCRIPT = """
+import json, os, time
+start = time.perf_counter()
+import django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+import config.urls  # builds the API and imports every mounted router
+ready = time.perf_counter()
+if os.environ.get("PROFILE_EAGER_AGENTS") == "1":
+    from features.agent_registry import AGENTS, get_agent
+    for name in AGENTS:
+        get_agent(name)
+loaded = time.perf_counter()
+import psutil
+print(json.dumps({
+    "startup_s": ready - start,
+    "agents_s": loaded - ready,
+    "rss_mb": psutil.Process().memory_info().rss / 2**20,
+}))
+"""
+
+MODES = {
+    # What every worker paid before agents were loaded lazily
+    "eager (all agents at start)": {"ENABLE_AGENTS": "True", "PROFILE_EAGER_AGENTS": "1"},
+    "lazy (agents on first use)": {"ENABLE_AGENTS": "True"},
+    "crud-only (ENABLE_AGENTS=False)": {"ENABLE_AGENTS": "False"},
+}
+
+
+def top_level_imports(importtime_log: str, limit: int) -> list:
+    """Heaviest top-level packages from a `-X importtime` log (cumulative us)."""
+    totals = defaultdict(int)
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative_us = int(cumulative)
+        except ValueError:
+            continue  # header line
+        # Only outermost imports (no indentation) so nothing is counted twice
+        if name.startswith(" ") and not name.startswith("  "):
+            totals[name.strip().split(".")[0]] += cumulative_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+class Command(BaseCommand):
+    help = "Measure cold-start import time and idle RSS with eager, lazy and no agents."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per mode.")
+        parser.add_argument("--top", type=int, default=10, help="Heaviest imports to list.")
+
+    def handle(self, *args, **options):
+        for label, env in MODES.items():
+            results = []
+            log = ""
+            for _ in range(options["runs"]):
+                proc = subprocess.run(
+                    [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+                    cwd=settings.BASE_DIR,
+                    env={**os.environ, **env},
+                    capture_output=True,
+                    text=True,
+                )
+                if proc.returncode != 0:
+                    raise CommandError(f"{label}: {proc.stderr.strip().splitlines()[-1]}")
+                results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+                log = proc.stderr
+
+            best = min(results, key=lambda r: r["startup_s"] + r["agents_s"])
+            self.stdout.write(
+                f"--- {label}: start-up {best['startup_s'] * 1000:.0f}ms "
+                f"+ agents {best['agents_s'] * 1000:.0f}ms, RSS {best['rss_mb']:.1f} MB "
+                f"(best of {options['runs']})"
+            )
+            for name, cumulative_us in top_level_imports(log, options["top"]):
+                self.stdout.write(f"    {name:<28} {cumulative_us / 1000:>8.1f}ms")
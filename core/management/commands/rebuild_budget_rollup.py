@@ -0,0 +1,35 @@
+"""Rebuild and/or verify the monthly budget spend rollup."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from features.crud.budgets.service import rebuild_budget_rollup, verify_budget_rollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild core_budgetmonthlyspend from raw transactions and verify it."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="Limit to a single user id.")
+        parser.add_argument(
+            "--verify-only",
+            action="store_true",
+            help="Only compare the rollup against raw transactions; do not rebuild.",
+        )
+
+    def handle(self, *args, **options):
+        user_id = options.get("user")
+
+        if not options["verify_only"]:
+            written = rebuild_budget_rollup(user_id)
+            self.stdout.write(f"Rebuilt rollup: {written} rows written.")
+
+        mismatches = verify_budget_rollup(user_id)
+        for row in mismatches[:50]:
+            self.stdout.write(
+                f"budget={row['budget_id']} month={row['month']} "
+                f"spent expected={row['expected_spent']} actual={row['actual_spent']} "
+                f"count expected={row['expected_count']} actual={row['actual_count']}"
+            )
+        if mismatches:
+            raise CommandError(f"Rollup verification failed: {len(mismatches)} mismatches.")
+        self.stdout.write(self.style.SUCCESS("Rollup verified: no mismatches."))
@@ -0,0 +1,41 @@
+"""Train the fast-path router's classifier from logged routing decisions."""
+
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from features.orchestrator.fast_router import (
+    NaiveBayesRouter,
+    logged_routing_decisions,
+    read_routing_dataset,
+)
+
+
+class Command(BaseCommand):
+    help = "Fit the naive Bayes router on recorded decisions and write it to FAST_ROUTER_MODEL."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=None, help="Defaults to settings.FAST_ROUTER_MODEL.")
+        parser.add_argument(
+            "--dataset", default=None, help="JSON-lines file of {message, agent} (default: chat log)."
+        )
+        parser.add_argument("--limit", type=int, default=50_000, help="Most recent logged turns.")
+
+    def handle(self, *args, **options):
+        output = options["output"] or settings.FAST_ROUTER_MODEL
+        if not output:
+            raise CommandError("Pass --output or set FAST_ROUTER_MODEL.")
+        samples = (
+            read_routing_dataset(options["dataset"])
+            if options["dataset"]
+            else logged_routing_decisions(options["limit"])
+        )
+        if not samples:
+            raise CommandError("No recorded routing decisions to train on.")
+
+        NaiveBayesRouter().fit(samples).save(output)
+        per_agent = Counter(agent for _, agent in samples)
+        self.stdout.write(
+            f"Trained on {len(samples)} turns ({dict(per_agent)}); wrote {output}"
+        )
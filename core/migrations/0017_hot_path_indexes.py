@@ -0,0 +1,61 @@
+# Generated by Django 5.0.14 on 2026-10-15 09:12
+#
+# Indexes are built CONCURRENTLY so the migration does not lock
+# core_transaction for writes on large tables.
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0016_transaction_income_source'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('active', True)), fields=['user', 'transaction_type', '-date'], name='txn_user_type_date_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('active', True), ('transaction_type', 'EXPENSE')), fields=['budget', 'date'], name='txn_budget_date_expense'),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-date', '-created_at'], name='txn_user_date_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='budget',
+            index=models.Index(condition=models.Q(('active', True)), fields=['user', '-priority_level_int'], name='budget_user_priority_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='goal',
+            index=models.Index(condition=models.Q(('active', True)), fields=['user', 'due_date'], name='goal_user_due_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='income',
+            index=models.Index(condition=models.Q(('active', True)), fields=['user'], name='income_user_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='income',
+            index=models.Index(condition=models.Q(('active', True), ('payment_day__isnull', False)), fields=['next_payment_date'], name='income_due_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='account',
+            index=models.Index(condition=models.Q(('active', True)), fields=['user', 'type'], name='account_user_type_active'),
+        ),
+        AddIndexConcurrently(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at'], name='notif_user_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['user', 'notification_type'], name='notif_user_type_unread'),
+        ),
+    ]
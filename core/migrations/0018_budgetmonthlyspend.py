@@ -0,0 +1,44 @@
+# Generated by Django 5.0.14 on 2026-10-15 10:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BudgetMonthlySpend',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('spent', models.DecimalField(decimal_places=2, default=0.0, max_digits=14)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('budget', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to='core.budget')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'month'], name='budget_spend_user_month')],
+                'constraints': [models.UniqueConstraint(fields=('budget', 'month'), name='budget_spend_budget_month')],
+            },
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO core_budgetmonthlyspend (user_id, budget_id, month, spent, count, updated_at)
+                SELECT b.user_id, t.budget_id, date_trunc('month', t.date)::date,
+                       SUM(t.amount), COUNT(*), NOW()
+                FROM core_transaction t
+                JOIN core_budget b ON b.id = t.budget_id
+                WHERE t.active AND t.transaction_type = 'EXPENSE'
+                GROUP BY b.user_id, t.budget_id, date_trunc('month', t.date);
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-15 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_budgetmonthlyspend'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='budgetmonthlyspend',
+            name='alert_level',
+            field=models.SmallIntegerField(default=0),
+        ),
+        # Seed the threshold state from current spend so existing budgets that
+        # are already over a threshold do not re-alert on their next write.
+        migrations.RunSQL(
+            sql="""
+                UPDATE core_budgetmonthlyspend r
+                SET alert_level = CASE
+                    WHEN r.spent >= b.total_limit THEN 100
+                    WHEN r.spent >= b.total_limit * 0.80 THEN 80
+                    ELSE 0
+                END
+                FROM core_budget b
+                WHERE b.id = r.budget_id AND b.total_limit > 0;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
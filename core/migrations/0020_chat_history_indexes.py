@@ -0,0 +1,30 @@
+# Generated by Django 5.0.14 on 2026-10-15 12:41
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0019_budgetmonthlyspend_alert_level'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='chatmessage',
+            index=models.Index(fields=['conversation', 'id'], name='chatmsg_conv_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='chatmessage',
+            index=models.Index(condition=models.Q(('content_type', 'json')), fields=['conversation', 'id'], name='chatmsg_conv_json_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='chatconversation',
+            index=models.Index(fields=['user', '-last_message_at', '-id'], name='chatconv_user_recent'),
+        ),
+    ]
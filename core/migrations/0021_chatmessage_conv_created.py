@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-15 14:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0020_chat_history_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='chatmessage',
+            index=models.Index(fields=['conversation', 'created_at', 'id'], name='chatmsg_conv_created'),
+        ),
+    ]
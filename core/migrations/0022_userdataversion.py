@@ -0,0 +1,98 @@
+# Generated by Django 5.0.14 on 2026-10-15 15:20
+#
+# Statement-level triggers with transition tables bump a user's data version
+# once per statement (not once per row), so bulk writes stay cheap.
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+VERSIONED_TABLES = [
+    "core_transaction",
+    "core_budget",
+    "core_goal",
+    "core_income",
+    "core_account",
+    "core_profile",
+]
+
+BUMP_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION core_bump_user_data_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO core_userdataversion (user_id, version, updated_at)
+        SELECT DISTINCT user_id, 1, NOW() FROM new_rows WHERE user_id IS NOT NULL
+        ON CONFLICT (user_id) DO UPDATE SET
+            version = core_userdataversion.version + 1,
+            updated_at = EXCLUDED.updated_at;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO core_userdataversion (user_id, version, updated_at)
+        SELECT DISTINCT user_id, 1, NOW() FROM old_rows WHERE user_id IS NOT NULL
+        ON CONFLICT (user_id) DO UPDATE SET
+            version = core_userdataversion.version + 1,
+            updated_at = EXCLUDED.updated_at;
+    ELSE
+        INSERT INTO core_userdataversion (user_id, version, updated_at)
+        SELECT user_id, 1, NOW() FROM (
+            SELECT user_id FROM new_rows
+            UNION
+            SELECT user_id FROM old_rows
+        ) touched
+        WHERE user_id IS NOT NULL
+        ON CONFLICT (user_id) DO UPDATE SET
+            version = core_userdataversion.version + 1,
+            updated_at = EXCLUDED.updated_at;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = [
+    ("ins", "INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    ("upd", "UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("del", "DELETE", "REFERENCING OLD TABLE AS old_rows"),
+]
+
+
+def _create_triggers_sql():
+    statements = [BUMP_FUNCTION_SQL]
+    for table in VERSIONED_TABLES:
+        for suffix, event, referencing in TRIGGERS:
+            statements.append(
+                f"CREATE TRIGGER {table}_data_version_{suffix} "
+                f"AFTER {event} ON {table} {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION core_bump_user_data_version();"
+            )
+    return "\n".join(statements)
+
+
+def _drop_triggers_sql():
+    statements = [
+        f"DROP TRIGGER IF EXISTS {table}_data_version_{suffix} ON {table};"
+        for table in VERSIONED_TABLES
+        for suffix, _, _ in TRIGGERS
+    ]
+    statements.append("DROP FUNCTION IF EXISTS core_bump_user_data_version();")
+    return "\n".join(statements)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_chatmessage_conv_created'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDataVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('version', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunSQL(_create_triggers_sql(), _drop_triggers_sql()),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-15 18:02
+#
+# Existing rows are fingerprinted by `manage.py backfill_transaction_fingerprints`.
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0023_transaction_search_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='fingerprint',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        AddIndexConcurrently(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('active', True), ('fingerprint__isnull', False)), fields=['user', 'fingerprint'], name='txn_user_fingerprint'),
+        ),
+    ]
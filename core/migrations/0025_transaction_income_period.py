@@ -0,0 +1,41 @@
+# Generated by Django 5.0.14 on 2026-10-15 19:10
+#
+# The unique index is built CONCURRENTLY so core_transaction stays writable;
+# the state operation records it as the model's UniqueConstraint.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('core', '0024_transaction_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='income_period',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=(
+                        'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "txn_income_period_uniq" '
+                        'ON "core_transaction" ("income_source_id", "income_period") '
+                        'WHERE "income_period" IS NOT NULL'
+                    ),
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "txn_income_period_uniq"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='transaction',
+                    constraint=models.UniqueConstraint(condition=models.Q(('income_period__isnull', False)), fields=('income_source', 'income_period'), name='txn_income_period_uniq'),
+                ),
+            ],
+        ),
+    ]
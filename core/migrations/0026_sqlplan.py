@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-15 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_transaction_income_period'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SqlPlan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=40, unique=True)),
+                ('request_text', models.TextField()),
+                ('sql_template', models.TextField()),
+                ('message', models.TextField(blank=True, default='')),
+                ('llm_ms', models.FloatField(default=0.0)),
+                ('hits', models.IntegerField(default=0)),
+                ('successes', models.IntegerField(default=0)),
+                ('failures', models.IntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField()),
+                ('last_used_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['last_used_at'], name='sqlplan_last_used')],
+            },
+        ),
+    ]
@@ -2,16 +2,20 @@
 
 from .user import Profile, EMPLOYMENT_OPTIONS, EDUCATION_OPTIONS, GENDER_OPTIONS
 from .budget import Budget
+from .budget_spend import BudgetMonthlySpend
 from .transaction import Transaction
 from .goal import Goal
 from .income import Income
 from .account import Account
 from .conversation import ChatConversation, ChatMessage
 from .notification import Notification
+from .data_version import UserDataVersion
+from .sql_plan import SqlPlan
 
 __all__ = [
     "Profile",
     "Budget",
+    "BudgetMonthlySpend",
     "Transaction",
     "Goal",
     "Income",
@@ -19,6 +23,8 @@ __all__ = [
     "ChatConversation",
     "ChatMessage",
     "Notification",
+    "UserDataVersion",
+    "SqlPlan",
     "EMPLOYMENT_OPTIONS",
     "EDUCATION_OPTIONS",
     "GENDER_OPTIONS",
@@ -1,6 +1,7 @@
 """Account model."""
 
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 
 
@@ -20,3 +21,10 @@ class Account(models.Model):
 
     class Meta:
         app_label = "core"
+        indexes = [
+            models.Index(
+                fields=["user", "type"],
+                condition=Q(active=True),
+                name="account_user_type_active",
+            ),
+        ]
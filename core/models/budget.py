@@ -1,6 +1,7 @@
 """Budget model."""
 
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 
 
@@ -18,3 +19,10 @@ class Budget(models.Model):
 
     class Meta:
         app_label = "core"
+        indexes = [
+            models.Index(
+                fields=["user", "-priority_level_int"],
+                condition=Q(active=True),
+                name="budget_user_priority_active",
+            ),
+        ]
@@ -0,0 +1,34 @@
+"""Monthly budget spend rollup model."""
+
+from django.db import models
+from django.contrib.auth.models import User
+
+from .budget import Budget
+
+
+class BudgetMonthlySpend(models.Model):
+    """Per-budget, per-month total of active EXPENSE transactions.
+
+    Maintained incrementally by the expense write paths so readers fetch one
+    row per budget instead of re-aggregating the month's transactions.
+    """
+
+    user = models.ForeignKey(User, models.DO_NOTHING)
+    budget = models.ForeignKey(Budget, models.DO_NOTHING)
+    month = models.DateField()  # First day of the month
+    spent = models.DecimalField(max_digits=14, decimal_places=2, default=0.00)
+    count = models.IntegerField(default=0)
+    # Highest alert threshold (percent of limit) already notified this month
+    alert_level = models.SmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "core"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["budget", "month"], name="budget_spend_budget_month"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user", "month"], name="budget_spend_user_month"),
+        ]
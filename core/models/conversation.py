@@ -15,6 +15,11 @@ class ChatConversation(models.Model):
 
     class Meta:
         app_label = "core"
+        indexes = [
+            models.Index(
+                fields=["user", "-last_message_at", "-id"], name="chatconv_user_recent"
+            ),
+        ]
 
 
 class ChatMessage(models.Model):
@@ -28,3 +33,18 @@ class ChatMessage(models.Model):
 
     class Meta:
         app_label = "core"
+        indexes = [
+            # Newest-first history window per conversation (scanned backwards)
+            models.Index(fields=["conversation", "id"], name="chatmsg_conv_id"),
+            # Latest structured (json) state per conversation
+            models.Index(
+                fields=["conversation", "id"],
+                condition=models.Q(content_type="json"),
+                name="chatmsg_conv_json_id",
+            ),
+            # Messages not yet folded into the rolling summary
+            models.Index(
+                fields=["conversation", "created_at", "id"],
+                name="chatmsg_conv_created",
+            ),
+        ]
@@ -0,0 +1,20 @@
+"""Per-user data version model."""
+
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class UserDataVersion(models.Model):
+    """Counter bumped on every write to a user's financial data.
+
+    Maintained by statement-level database triggers on transactions, budgets,
+    goals, income, accounts and profiles (migration 0022), so every write path
+    (ORM, raw SQL, bulk loads) invalidates derived per-user caches.
+    """
+
+    user = models.OneToOneField(User, models.DO_NOTHING, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "core"
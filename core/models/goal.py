@@ -1,6 +1,7 @@
 """Goal model."""
 
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 
 
@@ -21,3 +22,10 @@ class Goal(models.Model):
 
     class Meta:
         app_label = "core"
+        indexes = [
+            models.Index(
+                fields=["user", "due_date"],
+                condition=Q(active=True),
+                name="goal_user_due_active",
+            ),
+        ]
@@ -1,6 +1,7 @@
 """Income model."""
 
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 
 
@@ -21,3 +22,16 @@ class Income(models.Model):
 
     class Meta:
         app_label = "core"
+        indexes = [
+            models.Index(
+                fields=["user"],
+                condition=Q(active=True),
+                name="income_user_active",
+            ),
+            # Recurring income cron: due incomes across all users
+            models.Index(
+                fields=["next_payment_date"],
+                condition=Q(active=True, payment_day__isnull=False),
+                name="income_due_active",
+            ),
+        ]
@@ -9,5 +9,15 @@ class Notification(models.Model):
     notification_type = models.CharField(max_length=50, default="info") # e.g. 'budget_alert'
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="notif_user_created"),
+            models.Index(
+                fields=["user", "notification_type"],
+                condition=models.Q(is_read=False),
+                name="notif_user_type_unread",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title} - {self.user}"
@@ -0,0 +1,31 @@
+"""Cached natural-language-to-SQL plans of the database agent."""
+
+from django.db import models
+
+
+class SqlPlan(models.Model):
+    """A parameterised SELECT the database agent wrote for a request text.
+
+    `sql_template` takes %(user_id)s and named date-window parameters (see
+    features.database_agent.plan_cache). Internal: hidden from the LLM's
+    schema prompt.
+    """
+
+    key = models.CharField(max_length=40, unique=True)  # sha1 of request_text
+    request_text = models.TextField()  # normalised
+    sql_template = models.TextField()
+    message = models.TextField(blank=True, default="")
+    # Latency of the LLM call that produced the plan (saved on every hit)
+    llm_ms = models.FloatField(default=0.0)
+    hits = models.IntegerField(default=0)
+    successes = models.IntegerField(default=0)
+    failures = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField()
+    last_used_at = models.DateTimeField()
+
+    class Meta:
+        app_label = "core"
+        indexes = [
+            models.Index(fields=["last_used_at"], name="sqlplan_last_used"),
+        ]
@@ -1,6 +1,11 @@
 """Transaction model."""
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Upper
+
+from core.utils.fingerprint import transaction_fingerprint
 from django.contrib.auth.models import User
 from .budget import Budget
 from .account import Account
@@ -40,6 +45,71 @@ class Transaction(models.Model):
     active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(blank=True, null=True)
+    # xxh3 of (user, date, amount, description, account, type); see
+    # core.utils.fingerprint. Kept current by save() and set-based writers.
+    fingerprint = models.BigIntegerField(blank=True, null=True)
+    # Scheduled payment date a recurring-income deposit covers (idempotency key)
+    income_period = models.DateField(blank=True, null=True)
 
     class Meta:
         app_label = "core"
+        indexes = [
+            # Dashboard, analytics and CRUD listings: user + type + date window
+            models.Index(
+                fields=["user", "transaction_type", "-date"],
+                condition=Q(active=True),
+                name="txn_user_type_date_active",
+            ),
+            # Per-budget monthly spend (stats, overspend, budget alerts)
+            models.Index(
+                fields=["budget", "date"],
+                condition=Q(active=True, transaction_type="EXPENSE"),
+                name="txn_budget_date_expense",
+            ),
+            # Generic listing ordered by (-date, -created_at)
+            models.Index(
+                fields=["user", "-date", "-created_at"],
+                name="txn_user_date_created",
+            ),
+            # Description search (ILIKE contains/prefix and trigram similarity).
+            # UPPER() matches Django's icontains/istartswith SQL; user_id is
+            # part of the GIN key (btree_gin) so scans stay within one tenant.
+            GinIndex(
+                F("user"),
+                OpClass(Upper("description"), name="gin_trgm_ops"),
+                condition=Q(active=True),
+                name="txn_user_desc_trgm",
+            ),
+            # Duplicate detection: O(1) lookup of a user's matching rows
+            models.Index(
+                fields=["user", "fingerprint"],
+                condition=Q(active=True, fingerprint__isnull=False),
+                name="txn_user_fingerprint",
+            ),
+        ]
+        constraints = [
+            # One deposit per recurring income per period, however often or
+            # concurrently the recurring income job runs
+            models.UniqueConstraint(
+                fields=["income_source", "income_period"],
+                condition=Q(income_period__isnull=False),
+                name="txn_income_period_uniq",
+            ),
+        ]
+
+    def compute_fingerprint(self) -> int:
+        return transaction_fingerprint(
+            self.user_id,
+            self.date,
+            self.amount,
+            self.description,
+            self.account_id,
+            self.transaction_type,
+        )
+
+    def save(self, *args, **kwargs):
+        self.fingerprint = self.compute_fingerprint()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "fingerprint" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "fingerprint"]
+        super().save(*args, **kwargs)
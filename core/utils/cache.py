@@ -0,0 +1,118 @@
+"""
+Per-user caches keyed on the user's data version.
+
+Entries are never invalidated explicitly: any write to a user's financial
+data bumps UserDataVersion (database triggers), which changes the cache key.
+Stale entries simply age out of the cache backend.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Sequence
+
+from django.core.cache import cache
+
+from core.models import UserDataVersion
+
+# Seconds an entry may outlive its version before the backend evicts it
+VERSIONED_CACHE_TIMEOUT = 60 * 60
+
+# Tables whose writes bump UserDataVersion (triggers from migration 0022).
+# Only data read from these can be cached on the version alone.
+VERSIONED_TABLES = frozenset(
+    {
+        "core_transaction",
+        "core_budget",
+        "core_goal",
+        "core_income",
+        "core_account",
+        "core_profile",
+    }
+)
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for one named cache (per process)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+_stats: Dict[str, CacheStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_cache_stats(name: str) -> CacheStats:
+    """Return (creating if needed) the counters for cache `name`."""
+    with _stats_lock:
+        if name not in _stats:
+            _stats[name] = CacheStats(name)
+        return _stats[name]
+
+
+def all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every registered cache's counters."""
+    with _stats_lock:
+        return {name: stats.as_dict() for name, stats in _stats.items()}
+
+
+def get_data_version(user_id: int) -> int:
+    """Current data version of a user (0 if they never wrote anything)."""
+    version = (
+        UserDataVersion.objects.filter(user_id=user_id)
+        .values_list("version", flat=True)
+        .first()
+    )
+    return version or 0
+
+
+def versioned_get_or_set(
+    name: str,
+    user_id: int,
+    build: Callable[[], Any],
+    key_parts: Sequence[Hashable] = (),
+) -> Any:
+    """
+    Return the cached value of `build()` for the user's current data version.
+
+    Args:
+        name: Cache name (key prefix and stats bucket).
+        user_id: Owner of the data.
+        build: Computes the value on a miss.
+        key_parts: Extra inputs the value depends on (e.g. today's date).
+    """
+    stats = get_cache_stats(name)
+    version = get_data_version(user_id)
+    key = ":".join(str(part) for part in (name, user_id, version, *key_parts))
+
+    value = cache.get(key)
+    if value is not None:
+        stats.record(hit=True)
+        return value
+
+    stats.record(hit=False)
+    value = build()
+    cache.set(key, value, VERSIONED_CACHE_TIMEOUT)
+    return value
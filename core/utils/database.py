@@ -1,11 +1,13 @@
 """Core database utilities."""
 
+import functools
 import json
 import logging
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from django.db import connection
+from django.db import close_old_connections, connection, transaction
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +59,43 @@ def execute_modify(
         return 0
 
 
+@contextmanager
+def thread_connection() -> Iterator[None]:
+    """
+    Database access from a thread outside Django's request cycle
+    (asyncio.to_thread, executors). Stale connections are dropped on entry and
+    the connection is released on exit - back to the pool when pooling is
+    enabled, kept for reuse when CONN_MAX_AGE allows it. A no-op inside an
+    atomic block, which owns its connection until it exits.
+    """
+    if connection.in_atomic_block:
+        yield
+        return
+    close_old_connections()
+    try:
+        yield
+    finally:
+        close_old_connections()
+
+
+def atomic_outcome(func: Callable[..., Tuple[Any, Optional[str]]]) -> Callable:
+    """
+    transaction.atomic for functions that report failure as a `(result, error)`
+    tuple instead of raising: the block is rolled back whenever `error` is set,
+    so writes made before the failure are not committed.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with transaction.atomic():
+            result, error = func(*args, **kwargs)
+            if error:
+                transaction.set_rollback(True)
+            return result, error
+
+    return wrapper
+
+
 # ============================================================================
 # JSON utilities
 # ============================================================================
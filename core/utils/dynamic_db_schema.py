@@ -1,10 +1,17 @@
+from functools import lru_cache
+
 from django.apps import apps
 from django.db import models
 
-def get_dynamic_schema(app_names_list=['core']):
+# Internal tables the database agent must not see or query
+EXCLUDED_TABLES = frozenset({"core_sqlplan"})
+
+@lru_cache(maxsize=None)
+def get_dynamic_schema(app_names_list=('core',)):
     """
     Generates a rich text schema of Django models for LLM prompts.
     Handles Foreign Keys, OneToOneFields, and Choices automatically.
+    Models do not change at runtime, so each process builds it once.
     """
     schema_text = []
 
@@ -19,6 +26,8 @@ def get_dynamic_schema(app_names_list=['core']):
             model_name = model.__name__
             # Use the actual DB table name so the LLM writes correct SQL
             table_name = model._meta.db_table 
+            if table_name in EXCLUDED_TABLES:
+                continue
             
             fields_desc = []
 
@@ -0,0 +1,41 @@
+"""Transaction fingerprints for duplicate detection."""
+
+import re
+from decimal import Decimal
+from typing import Optional
+
+import xxhash
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(description: Optional[str]) -> str:
+    """Lowercase and collapse whitespace so cosmetic differences still match."""
+    return _WHITESPACE.sub(" ", (description or "").strip().lower())
+
+
+def transaction_fingerprint(
+    user_id: Optional[int],
+    date,
+    amount,
+    description: Optional[str],
+    account_id: Optional[int],
+    transaction_type: str = "EXPENSE",
+) -> int:
+    """
+    64-bit xxh3 hash of a transaction's identifying fields.
+
+    Returned as a signed integer so it fits a PostgreSQL bigint column.
+    """
+    key = "|".join(
+        (
+            str(user_id or ""),
+            str(date),
+            str(Decimal(str(amount)).quantize(Decimal("0.01"))),
+            normalize_description(description),
+            str(account_id or ""),
+            transaction_type,
+        )
+    )
+    value = xxhash.xxh3_64_intdigest(key.encode())
+    return value - (1 << 64) if value >= (1 << 63) else value
@@ -0,0 +1,154 @@
+"""Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe token holding the ordering and the ordering
+values of the last row of a page. The next page is fetched with a WHERE clause
+that seeks past that row, including a plain range on the leading column that
+the index scan can start from, so every page costs the same regardless of
+depth.
+Orderings must end in a unique column (usually `id`) to be deterministic.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Q, QuerySet
+from ninja.errors import HttpError
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        # isoformat keeps microseconds, which created_at/updated_at rely on
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(ordering: Sequence[str], row: Dict[str, Any]) -> str:
+    """Build an opaque cursor pointing just after `row`."""
+    field_names = [field.lstrip("-") for field in ordering]
+    payload = {"o": list(ordering), "v": [row[name] for name in field_names]}
+    raw = json.dumps(payload, default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, ordering: Sequence[str]) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor` for the same ordering.
+
+    Raises:
+        ValueError: if the token is malformed or was built for another ordering.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["v"]
+        cursor_ordering = payload["o"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+    if cursor_ordering != list(ordering) or len(values) != len(ordering):
+        raise ValueError("Cursor does not match this listing")
+    return values
+
+
+def _after(field: str, descending: bool, value: Any) -> Q:
+    """Rows strictly after `value` on one column (PostgreSQL NULL ordering)."""
+    if descending:
+        # DESC sorts NULLS FIRST
+        if value is None:
+            return Q(**{f"{field}__isnull": False})
+        return Q(**{f"{field}__lt": value})
+    # ASC sorts NULLS LAST
+    if value is None:
+        return Q(pk__in=[])
+    return Q(**{f"{field}__gt": value}) | Q(**{f"{field}__isnull": True})
+
+
+def _equal(field: str, value: Any) -> Q:
+    if value is None:
+        return Q(**{f"{field}__isnull": True})
+    return Q(**{field: value})
+
+
+def _nullable(model: Optional[type[Model]], field: str) -> bool:
+    if model is None:
+        return True
+    try:
+        return model._meta.get_field(field).null
+    except FieldDoesNotExist:
+        return True
+
+
+def _leading_bound(
+    field: str, descending: bool, value: Any, model: Optional[type[Model]]
+) -> Q:
+    """
+    Redundant range on the first ordering column. The OR-expanded keyset
+    filter alone is not an index range bound, so without it PostgreSQL reads
+    every row past the cursor and top-N sorts them; with it, the index scan
+    starts at the cursor.
+    """
+    if value is None:
+        return Q()
+    if descending:
+        return Q(**{f"{field}__lte": value})
+    bound = Q(**{f"{field}__gte": value})
+    if _nullable(model, field):
+        bound |= Q(**{f"{field}__isnull": True})
+    return bound
+
+
+def keyset_filter(
+    ordering: Sequence[str], values: Sequence[Any], model: Optional[type[Model]] = None
+) -> Q:
+    """
+    Lexicographic "after this row" filter for a multi-column ordering.
+
+    `model` lets the leading-column bound skip the NULL branch on NOT NULL
+    columns (which would keep it from being an index range).
+    """
+    condition = Q(pk__in=[])
+    prefix = Q()
+    for order_field, value in zip(ordering, values):
+        descending = order_field.startswith("-")
+        field = order_field.lstrip("-")
+        condition |= prefix & _after(field, descending, value)
+        prefix &= _equal(field, value)
+    if not ordering:
+        return condition
+    first = ordering[0]
+    return _leading_bound(first.lstrip("-"), first.startswith("-"), values[0], model) & condition
+
+
+async def apaginate(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch one keyset page from a `.values()` queryset.
+
+    The queryset must select every ordering column.
+
+    Returns:
+        (rows, next_cursor) where next_cursor is None on the last page.
+
+    Raises:
+        HttpError: 400 if the cursor is invalid.
+    """
+    if cursor:
+        try:
+            values = decode_cursor(cursor, ordering)
+        except ValueError as exc:
+            raise HttpError(400, f"Invalid cursor: {exc}")
+        queryset = queryset.filter(keyset_filter(ordering, values, queryset.model))
+
+    # Fetch one extra row to know whether another page exists
+    rows = [row async for row in queryset.order_by(*ordering)[: limit + 1]]
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(ordering, rows[-1])
@@ -4,12 +4,20 @@ from typing import Any, Dict, Optional
 
 
 def success_response(
-    data: Any = None, message: str = "Success", count: Optional[int] = None
+    data: Any = None,
+    message: str = "Success",
+    count: Optional[int] = None,
+    next_cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Return a standardized success response."""
+    """Return a standardized success response.
+
+    `next_cursor` is set on paginated listings when another page exists.
+    """
     response = {"status": "success", "message": message, "data": data}
     if count is not None:
         response["count"] = count
+    if next_cursor is not None:
+        response["next_cursor"] = next_cursor
     return response
 
 
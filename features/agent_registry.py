@@ -0,0 +1,50 @@
+"""
+Lazy access to the LLM agents.
+
+Importing an agent pulls in LangChain/LangGraph, the LLM client and its
+prompts (and introspects the DB schema), which dominates worker start-up time
+and idle memory. Endpoints therefore resolve agents by name on first use
+instead of importing them at module level. Workers that only serve CRUD
+(ENABLE_AGENTS=False) never load them at all.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict
+
+from django.utils.module_loading import import_string
+
+# name -> dotted path of the compiled graph / runnable
+AGENTS = {
+    "orchestrator": "features.orchestrator.graph.main_orchestrator_graph",
+    "budget_maker": "features.budget_maker.agent.Budget_maker_agent",
+    "goal_maker": "features.goal_maker.agent.Goal_maker_agent",
+    "transaction_maker": "features.transaction_maker.agent.Transaction_maker_agent",
+}
+
+_loaded: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def get_agent(name: str) -> Any:
+    """Return agent `name`, importing it on the first call."""
+    agent = _loaded.get(name)
+    if agent is None:
+        with _lock:
+            agent = _loaded.get(name)
+            if agent is None:
+                agent = _loaded[name] = import_string(AGENTS[name])
+    return agent
+
+
+async def aget_agent(name: str) -> Any:
+    """get_agent for async views: the first (importing) call runs off the event loop."""
+    agent = _loaded.get(name)
+    if agent is None:
+        agent = await asyncio.to_thread(get_agent, name)
+    return agent
+
+
+def loaded_agents() -> list[str]:
+    """Names of the agents this process has loaded so far."""
+    return sorted(_loaded)
@@ -1,4 +1,4 @@
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from core.utils.dynamic_db_schema import get_dynamic_schema
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import Field, BaseModel
@@ -102,4 +102,4 @@ def parse_output(message: BaseMessage | str) -> AnalyserOutput | None:
         return None
 
 
-Analyser = analyser_prompt | gpt_oss_120b_digital_ocean | parse_output
+Analyser = analyser_prompt | get_llm() | parse_output
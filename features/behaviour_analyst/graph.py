@@ -34,7 +34,7 @@ class BehaviourAnalystState(TypedDict):
     current_date: str  # Current date for context
 
 
-def analyser(state: BehaviourAnalystState) -> dict:
+async def analyser(state: BehaviourAnalystState) -> dict:
     """Node that analyzes the current state and acquired data."""
     print("===> (Node) Analyser Invoked <===")
     data_acquired = state.get("data_acquired", [])
@@ -42,7 +42,7 @@ def analyser(state: BehaviourAnalystState) -> dict:
     message = state.get("message", "")
     analysis = state.get("analysis", "")
 
-    Output = Analyser.invoke(
+    Output = await Analyser.ainvoke(
         {
             "data_acquired": data_acquired,
             "message": message,
@@ -64,7 +64,7 @@ def analyser(state: BehaviourAnalystState) -> dict:
     }
 
 
-def orchestrator(state: BehaviourAnalystState) -> dict:
+async def orchestrator(state: BehaviourAnalystState) -> dict:
     """
     The central router of the graph. It decides which node to call next
     based on the overall state.
@@ -72,7 +72,7 @@ def orchestrator(state: BehaviourAnalystState) -> dict:
     message = state.get("message", [])
 
     print("===> (Node) Orchestrator Invoked <===")
-    Output = Behaviour_analyser_orchestrator.invoke(
+    Output = await Behaviour_analyser_orchestrator.ainvoke(
         {
             "request": state.get("request", ""),
             "analysis": state.get("analysis", ""),
@@ -95,14 +95,14 @@ def orchestrator(state: BehaviourAnalystState) -> dict:
     }
 
 
-def query_planner(state: BehaviourAnalystState) -> dict:
+async def query_planner(state: BehaviourAnalystState) -> dict:
     """
     Node that plans which database queries are needed to fulfill the request.
     """
     message = state.get("message", [])
 
     print("===> (Node) Query Planner Invoked <===")
-    Output = Query_planner.invoke(
+    Output = await Query_planner.ainvoke(
         {
             "request": state.get("request", ""),
             "message": message,
@@ -1,5 +1,5 @@
 from typing import Literal
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import Field, BaseModel
 from langchain_core.messages import BaseMessage
@@ -63,4 +63,4 @@ def parse_output(message: BaseMessage | str) -> orchestratorOutput | None:
         print(f"Raw Output: {text}")
         return None  
 
-Behaviour_analyser_orchestrator = prompt | gpt_oss_120b_digital_ocean | parse_output
+Behaviour_analyser_orchestrator = prompt | get_llm() | parse_output
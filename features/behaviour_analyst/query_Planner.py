@@ -2,7 +2,7 @@ from typing import List
 from core.utils.dynamic_db_schema import get_dynamic_schema
 
 from langchain_core.prompts import ChatPromptTemplate
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from pydantic import Field, BaseModel
 from langchain_core.messages import BaseMessage
 import json
@@ -105,4 +105,4 @@ def parse_output(message: BaseMessage | str) -> query_plannerOutput | None:
         return None
 
 
-Query_planner = prompt | gpt_oss_120b_digital_ocean | parse_output
+Query_planner = prompt | get_llm() | parse_output
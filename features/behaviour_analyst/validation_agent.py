@@ -1,5 +1,5 @@
 from langchain_core.prompts import ChatPromptTemplate
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from pydantic import BaseModel, Field
 from core.utils.dynamic_db_schema import get_dynamic_schema
 
@@ -70,6 +70,6 @@ validation_prompt = ChatPromptTemplate.from_messages(
 ).partial(schema=get_dynamic_schema())
 
 # 4. Build the final agent chain using LangChain Expression Language (LCEL)
-ValidationAgent = validation_prompt | gpt_oss_120b_digital_ocean.with_structured_output(
+ValidationAgent = validation_prompt | get_llm().with_structured_output(
     ValidationAgentOutput, method="function_calling"
 )
@@ -1,4 +1,4 @@
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from langchain_core.prompts import ChatPromptTemplate
 from typing import Literal
 from pydantic import Field, BaseModel
@@ -234,4 +234,4 @@ def parse_output(message: BaseMessage | str) -> Budget_maker | None:
         return None
 
 
-Budget_maker_agent = prompt | gpt_oss_120b_digital_ocean | parse_output
+Budget_maker_agent = prompt | get_llm() | parse_output
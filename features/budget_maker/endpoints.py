@@ -8,7 +8,7 @@ from asgiref.sync import sync_to_async
 from ninja import Router
 from django.db import transaction
 
-from features.budget_maker.agent import Budget_maker_agent
+from features.agent_registry import aget_agent
 from features.orchestrator.schemas import (
     BudgetMakerRequestSchema,
     BudgetMakerResponseSchema,
@@ -17,6 +17,7 @@ from features.crud.users.service import get_user_summary
 from features.crud.conversations.service import (
     get_conversation_context,
     insert_chat_message,
+    schedule_summary_fold,
 )
 from core.models import ChatConversation
 
@@ -53,7 +54,8 @@ async def budget_assist(request, payload: BudgetMakerRequestSchema):
 
     # 2. Invoke Agent using native async (.ainvoke)
     try:
-        budget_result = await Budget_maker_agent.ainvoke(
+        agent = await aget_agent("budget_maker")
+        budget_result = await agent.ainvoke(
             {
                 "user_info": user_summary,
                 "user_request": user_request,
@@ -127,6 +129,7 @@ async def budget_assist(request, payload: BudgetMakerRequestSchema):
             logger.exception("Failed to store BudgetMaker interaction")
 
     await store_interaction()
+    schedule_summary_fold(conversation_id)
 
     return {
         "conversation_id": conversation_id,
@@ -6,12 +6,15 @@ from asgiref.sync import sync_to_async
 
 from ninja import Router, Query
 from django.db.models import Sum, DecimalField, Count, Q
-from django.db.models.functions import Coalesce, TruncMonth
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models.functions import Coalesce, TruncMonth, Upper
 from django.utils import timezone
 
-from core.models import Transaction, Budget, Income, Goal, Account
+from core.models import Transaction, Budget, Income, Goal
 from core.utils.responses import success_response, error_response
 from features.auth.api import AuthBearer
+from features.crud.budgets.service import annotate_month_spend
+from features.dashboard.service import fetch_overview, project_overspend
 from .schemas import (
     MonthlyBreakdownSchema,
     OverspendResponseSchema,
@@ -67,9 +70,6 @@ async def get_budget_stats(request, active: Optional[bool] = Query(None)):
         if active is not None:
             filters["active"] = active
 
-        now = timezone.now()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
         queryset = Budget.objects.filter(**filters)
 
         if active is False:
@@ -77,28 +77,8 @@ async def get_budget_stats(request, active: Optional[bool] = Query(None)):
         else:
             queryset = queryset.order_by("-priority_level_int")
 
-        budgets = queryset.annotate(
-            monthly_spent=Coalesce(
-                Sum(
-                    "transaction__amount",
-                    filter=Q(
-                        transaction__date__gte=month_start,
-                        transaction__active=True,
-                        transaction__transaction_type="EXPENSE",
-                    ),
-                ),
-                0,
-                output_field=DecimalField(),
-            ),
-            monthly_count=Count(
-                "transaction__id",
-                filter=Q(
-                    transaction__date__gte=month_start,
-                    transaction__active=True,
-                    transaction__transaction_type="EXPENSE",
-                ),
-            ),
-        )
+        # One rollup row per budget instead of re-aggregating the month
+        budgets = annotate_month_spend(queryset, timezone.now().date())
 
         return [
             _compute_budget_stats(b, b.monthly_spent, b.monthly_count) for b in budgets
@@ -114,35 +94,10 @@ async def get_single_budget_stats(request, budget_id: int):
 
     @sync_to_async
     def fetch_single_budget_stats():
-        now = timezone.now()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        budget = (
-            Budget.objects.filter(id=budget_id, user_id=request.user.id)
-            .annotate(
-                monthly_spent=Coalesce(
-                    Sum(
-                        "transaction__amount",
-                        filter=Q(
-                            transaction__date__gte=month_start,
-                            transaction__active=True,
-                            transaction__transaction_type="EXPENSE",
-                        ),
-                    ),
-                    0,
-                    output_field=DecimalField(),
-                ),
-                monthly_count=Count(
-                    "transaction__id",
-                    filter=Q(
-                        transaction__date__gte=month_start,
-                        transaction__active=True,
-                        transaction__transaction_type="EXPENSE",
-                    ),
-                ),
-            )
-            .first()
-        )
+        budget = annotate_month_spend(
+            Budget.objects.filter(id=budget_id, user_id=request.user.id),
+            timezone.now().date(),
+        ).first()
 
         if not budget:
             return None
@@ -269,10 +224,17 @@ async def get_transaction_summary(
     return await fetch_transaction_summary()
 
 
+# contains: substring match (ILIKE '%q%'); prefix: typeahead (ILIKE 'q%');
+# fuzzy: trigram word similarity, ranked by relevance. All three are served by
+# the txn_user_desc_trgm GIN index on (user_id, UPPER(description)).
+SEARCH_MODES = ("contains", "prefix", "fuzzy")
+
+
 @router.get("/transactions/search", response=Dict[str, Any])
 async def search_transactions(
     request,
     query_text: Optional[str] = Query(None, alias="query"),
+    mode: str = Query("contains"),
     category: Optional[str] = Query(None),
     min_amount: Optional[float] = Query(None),
     max_amount: Optional[float] = Query(None),
@@ -283,16 +245,35 @@ async def search_transactions(
     limit: int = Query(100, le=1000),
 ):
     """Advanced transaction search."""
+    if mode not in SEARCH_MODES:
+        return error_response(f"mode must be one of: {', '.join(SEARCH_MODES)}")
 
     @sync_to_async
     def perform_search():
-        queryset = Transaction.objects.filter(user_id=request.user.id, active=True)
+        user_id = request.user.id
+        queryset = Transaction.objects.filter(user_id=user_id, active=True)
+        ordering = ["-date", "-id"]
 
         if query_text:
-            queryset = queryset.filter(
-                Q(description__icontains=query_text)
-                | Q(budget__budget_name__icontains=query_text)
+            # Budget names are matched on the (small) budget table first so the
+            # transaction filter stays an index-friendly OR on own columns
+            budget_ids = list(
+                Budget.objects.filter(
+                    user_id=user_id, budget_name__icontains=query_text
+                ).values_list("id", flat=True)
             )
+            if mode == "fuzzy":
+                queryset = queryset.annotate(
+                    description_upper=Upper("description"),
+                    score=TrigramWordSimilarity(query_text, Upper("description")),
+                )
+                text_match = Q(description_upper__trigram_word_similar=query_text)
+                ordering = ["-score"] + ordering
+            elif mode == "prefix":
+                text_match = Q(description__istartswith=query_text)
+            else:
+                text_match = Q(description__icontains=query_text)
+            queryset = queryset.filter(text_match | Q(budget_id__in=budget_ids))
 
         if category:
             queryset = queryset.filter(Q(budget__budget_name__icontains=category))
@@ -315,7 +296,7 @@ async def search_transactions(
         if neighbourhood:
             queryset = queryset.filter(neighbourhood__icontains=neighbourhood)
 
-        transactions = queryset.order_by("-date").values(
+        fields = [
             "id",
             "date",
             "amount",
@@ -325,23 +306,27 @@ async def search_transactions(
             "neighbourhood",
             "account_id",
             "transaction_type",
-        )[:limit]
+        ]
+        if mode == "fuzzy" and query_text:
+            fields.append("score")
+        transactions = queryset.order_by(*ordering).values(*fields)[:limit]
 
         result = []
         for txn in transactions:
-            result.append(
-                {
-                    "id": txn["id"],
-                    "date": txn["date"],
-                    "amount": float(txn["amount"]),
-                    "description": txn.get("description"),
-                    "budget_name": txn.get("budget__budget_name"),
-                    "city": txn.get("city"),
-                    "neighbourhood": txn.get("neighbourhood"),
-                    "account_id": txn.get("account_id"),
-                    "transaction_type": txn.get("transaction_type"),
-                }
-            )
+            row = {
+                "id": txn["id"],
+                "date": txn["date"],
+                "amount": float(txn["amount"]),
+                "description": txn.get("description"),
+                "budget_name": txn.get("budget__budget_name"),
+                "city": txn.get("city"),
+                "neighbourhood": txn.get("neighbourhood"),
+                "account_id": txn.get("account_id"),
+                "transaction_type": txn.get("transaction_type"),
+            }
+            if "score" in txn:
+                row["score"] = round(txn["score"], 4)
+            result.append(row)
 
         return {
             "status": "success",
@@ -398,92 +383,10 @@ async def get_monthly_spend(request):
 @router.get("/overspend", response=OverspendResponseSchema)
 async def get_overspend(request):
     """Identify categories where spending exceeds the budget limit."""
-
-    @sync_to_async
-    def fetch_overspend():
-        current_month_start = timezone.now().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-
-        budgets = (
-            Budget.objects.filter(user_id=request.user.id, active=True)
-            .annotate(
-                spent=Coalesce(
-                    Sum(
-                        "transaction__amount",
-                        filter=Q(transaction__date__gte=current_month_start),
-                    ),
-                    0,
-                    output_field=DecimalField(),
-                )
-            )
-            .values("budget_name", "spent", "total_limit")
-        )
-
-        overspend_data = []
-        total_spent_all = 0.0
-
-        for r in budgets:
-            spent = float(r["spent"])
-            limit_val = float(r["total_limit"])
-            total_spent_all += spent
-
-            pct = (spent / limit_val * 100) if limit_val > 0 else 0
-            row_data = {
-                "budget_name": r["budget_name"],
-                "spent": spent,
-                "total_limit": limit_val,
-                "pct_of_limit": round(pct, 2),
-                "is_overspent": pct > 100,
-            }
-            overspend_data.append(row_data)
-
-        income_total = Income.objects.filter(user_id=request.user.id).aggregate(
-            total=Coalesce(Sum("amount"), 0, output_field=DecimalField())
-        )["total"]
-        total_income = float(income_total) if income_total else 0.0
-
-        accounts = Account.objects.filter(user_id=request.user.id, active=True)
-
-        total_assets = 0.0
-        total_liabilities = 0.0
-        total_regular = 0.0
-        total_savings = 0.0
-        account_breakdown = []
-
-        for acc in accounts:
-            bal = float(acc.balance)
-            account_breakdown.append(
-                {"id": acc.id, "name": acc.name, "type": acc.type, "balance": bal}
-            )
-
-            if acc.type == Account.AccountType.SAVINGS:
-                total_savings += bal
-            else:
-                total_regular += bal
-
-            if bal >= 0:
-                total_assets += bal
-            else:
-                total_liabilities += abs(bal)
-
-        net_worth = total_assets - total_liabilities
-
-        summary = {
-            "total_income": total_income,
-            "total_spent": total_spent_all,
-            "net_position": net_worth,
-            "total_assets": total_assets,
-            "total_liabilities": total_liabilities,
-            "total_regular": total_regular,
-            "total_savings": total_savings,
-            "is_deficit": (total_spent_all > total_income),
-            "accounts": account_breakdown,
-        }
-
-        return {"data": overspend_data, "summary": summary}
-
-    return await fetch_overspend()
+    overview = await sync_to_async(fetch_overview)(
+        request.user.id, timezone.now().date()
+    )
+    return project_overspend(overview)
 
 
 @router.get("/income-total", response=Dict[str, Any])
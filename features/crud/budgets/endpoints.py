@@ -12,6 +12,7 @@ from asgiref.sync import sync_to_async
 
 from core.models import Budget, Income
 from core.utils.responses import success_response, error_response
+from features.crud.budgets.service import recheck_budget_alerts
 from .schemas import (
     BudgetCreateSchema,
     BudgetUpdateSchema,
@@ -201,6 +202,8 @@ async def update_budget(request, budget_id: int, payload: BudgetUpdateSchema):
         ).aupdate(**updates)
         if rows_affected == 0:
             return error_response("Budget not found", code=404)
+        if "total_limit" in updates:
+            await sync_to_async(recheck_budget_alerts)(budget_id)
         budget = (
             await Budget.objects.filter(id=budget_id).values(*BUDGET_FIELDS).afirst()
         )
@@ -1,5 +1,15 @@
-from typing import List, Dict, Any
-from core.models import Budget
+from datetime import date
+from decimal import Decimal
+from typing import List, Dict, Any, Optional
+
+from django.db import connection, transaction
+from django.db.models import DecimalField, IntegerField, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.models import Budget, BudgetMonthlySpend
+from core.utils.database import dictfetchall
+from features.notifications.budget_alerts import check_budget_limit
 
 
 def fetch_active_budgets(user_id: int) -> List[Dict[str, Any]]:
@@ -10,3 +20,210 @@ def fetch_active_budgets(user_id: int) -> List[Dict[str, Any]]:
         .values("id", "budget_name", "total_limit", "priority_level_int")
     )
     return list(budgets)
+
+
+# =============================================================================
+# Monthly Spend Rollup
+# =============================================================================
+
+
+def month_start(value: date) -> date:
+    """Return the first day of the month containing `value`."""
+    return value.replace(day=1)
+
+
+def apply_budget_spend(
+    user_id: int, budget_id: int, month: date, amount: Decimal, count: int
+) -> Optional[Dict[str, Any]]:
+    """
+    Add `amount`/`count` to a budget's monthly rollup row (upsert).
+
+    Returns:
+        dict with the row's new spent, count and alert_level.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_budgetmonthlyspend
+                (user_id, budget_id, month, spent, count, alert_level, updated_at)
+            VALUES (%s, %s, %s, %s, %s, 0, NOW())
+            ON CONFLICT (budget_id, month) DO UPDATE SET
+                spent = core_budgetmonthlyspend.spent + EXCLUDED.spent,
+                count = core_budgetmonthlyspend.count + EXCLUDED.count,
+                updated_at = EXCLUDED.updated_at
+            RETURNING spent, count, alert_level
+            """,
+            [user_id, budget_id, month_start(month), amount, count],
+        )
+        row = cursor.fetchone()
+    if not row:
+        return None
+    return {"spent": row[0], "count": row[1], "alert_level": row[2]}
+
+
+def _expense_contribution(txn) -> Optional[tuple]:
+    """(user_id, budget_id, month, amount) an expense adds to the rollup, or None."""
+    if txn is None or not txn.active or not txn.budget_id:
+        return None
+    if txn.transaction_type != "EXPENSE":
+        return None
+    return (
+        txn.user_id,
+        txn.budget_id,
+        month_start(txn.date),
+        Decimal(str(txn.amount)),
+    )
+
+
+def record_expense_change(old_txn=None, new_txn=None) -> None:
+    """
+    Move an expense's contribution in the rollup from its old to its new state.
+
+    Pass `old_txn=None` for a create and a `new_txn` that is inactive for a
+    soft delete. Must run inside the same transaction as the expense write.
+    Each touched month is then checked against the budget alert thresholds.
+
+    This is the only hook that keeps the rollup and budget alerts current:
+    there is no Transaction signal, so every expense write (endpoints,
+    imports, scripts) must call it.
+    """
+    old = _expense_contribution(old_txn)
+    new = _expense_contribution(new_txn)
+    if old == new:
+        return
+
+    touched = []
+    if old:
+        user_id, budget_id, month, amount = old
+        row = apply_budget_spend(user_id, budget_id, month, -amount, -1)
+        touched.append((budget_id, month, row))
+    if new:
+        user_id, budget_id, month, amount = new
+        row = apply_budget_spend(user_id, budget_id, month, amount, 1)
+        touched.append((budget_id, month, row))
+
+    for budget_id, month, row in touched:
+        check_budget_limit(
+            budget_id, month, spent=row["spent"], alert_level=row["alert_level"]
+        )
+
+
+def recheck_budget_alerts(budget_id: int, today: Optional[date] = None) -> int:
+    """
+    Re-evaluate the current month's alert level after a budget's limit changed.
+
+    Lowering the limit can cross a threshold without any new expense; raising
+    it re-arms thresholds that no longer apply.
+
+    Returns:
+        The month's new alert level.
+    """
+    return check_budget_limit(budget_id, month_start(today or timezone.now().date()))
+
+
+def annotate_month_spend(queryset: QuerySet, month: date) -> QuerySet:
+    """Annotate budgets with `monthly_spent`/`monthly_count` from the rollup."""
+    rollup = BudgetMonthlySpend.objects.filter(
+        budget_id=OuterRef("pk"), month=month_start(month)
+    )
+    return queryset.annotate(
+        monthly_spent=Coalesce(
+            Subquery(rollup.values("spent")[:1]),
+            Value(Decimal("0.00")),
+            output_field=DecimalField(),
+        ),
+        monthly_count=Coalesce(
+            Subquery(rollup.values("count")[:1]),
+            Value(0),
+            output_field=IntegerField(),
+        ),
+    )
+
+
+ROLLUP_SOURCE_SQL = """
+    SELECT b.user_id, t.budget_id, date_trunc('month', t.date)::date AS month,
+           SUM(t.amount) AS spent, COUNT(*) AS count
+    FROM core_transaction t
+    JOIN core_budget b ON b.id = t.budget_id
+    WHERE t.active AND t.transaction_type = 'EXPENSE' {user_filter}
+    GROUP BY b.user_id, t.budget_id, date_trunc('month', t.date)
+"""
+
+
+def _rollup_source(user_id: Optional[int]) -> tuple[str, list]:
+    if user_id is None:
+        return ROLLUP_SOURCE_SQL.format(user_filter=""), []
+    return ROLLUP_SOURCE_SQL.format(user_filter="AND b.user_id = %s"), [user_id]
+
+
+def verify_budget_rollup(user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Compare the rollup against raw transactions.
+
+    Returns:
+        List of mismatching (budget_id, month) rows with expected and actual values.
+    """
+    source_sql, params = _rollup_source(user_id)
+    user_filter = "WHERE r.user_id = %s" if user_id is not None else ""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH expected AS ({source_sql}),
+            actual AS (
+                SELECT r.budget_id, r.month, r.spent, r.count
+                FROM core_budgetmonthlyspend r {user_filter}
+            )
+            SELECT COALESCE(e.budget_id, a.budget_id) AS budget_id,
+                   COALESCE(e.month, a.month) AS month,
+                   COALESCE(e.spent, 0) AS expected_spent,
+                   COALESCE(a.spent, 0) AS actual_spent,
+                   COALESCE(e.count, 0) AS expected_count,
+                   COALESCE(a.count, 0) AS actual_count
+            FROM expected e
+            FULL OUTER JOIN actual a
+                ON a.budget_id = e.budget_id AND a.month = e.month
+            WHERE COALESCE(e.spent, 0) <> COALESCE(a.spent, 0)
+               OR COALESCE(e.count, 0) <> COALESCE(a.count, 0)
+            ORDER BY 1, 2
+            """,
+            params + ([user_id] if user_id is not None else []),
+        )
+        return dictfetchall(cursor)
+
+
+def rebuild_budget_rollup(user_id: Optional[int] = None) -> int:
+    """
+    Recompute the rollup from raw transactions (all users or one user).
+
+    Alert levels are re-seeded from each month's spend against the limit.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    source_sql, params = _rollup_source(user_id)
+    with transaction.atomic():
+        rollup = BudgetMonthlySpend.objects.all()
+        if user_id is not None:
+            rollup = rollup.filter(user_id=user_id)
+        rollup.delete()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO core_budgetmonthlyspend
+                    (user_id, budget_id, month, spent, count, alert_level, updated_at)
+                SELECT src.user_id, src.budget_id, src.month, src.spent, src.count,
+                       -- Same seeding as migration 0019: budgets already past a
+                       -- threshold must not alert again on their next expense
+                       CASE
+                           WHEN b.total_limit <= 0 THEN 0
+                           WHEN src.spent >= b.total_limit THEN 100
+                           WHEN src.spent >= b.total_limit * 0.80 THEN 80
+                           ELSE 0
+                       END,
+                       NOW()
+                FROM ({source_sql}) src
+                JOIN core_budget b ON b.id = src.budget_id
+                """,
+                params,
+            )
+            return cursor.rowcount
@@ -1,12 +1,13 @@
 """Conversation management endpoints (CRUD + Manual)."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from asgiref.sync import sync_to_async
 
 from ninja import Router, Query
 
 from core.models import ChatConversation, ChatMessage
+from core.utils.pagination import apaginate
 from core.utils.responses import success_response, error_response
 from django.utils import timezone
 from .schemas import ConversationStartSchema, ConversationResponseSchema
@@ -47,21 +48,17 @@ async def start_conversation(request, payload: ConversationStartSchema = None):
 
 
 @router.get("/", response=Dict[str, Any])
-async def get_conversations(request, limit: int = Query(50)):
-    """Retrieve chat conversations for a user."""
-    conversations = []
-    count = 0
-    async for conv in (
-        ChatConversation.objects.filter(user_id=request.user.id)
-        .order_by("-last_message_at")
-        .values("id", "title", "channel", "started_at", "last_message_at")
-    ):
-        if count >= limit:
-            break
-        conversations.append(conv)
-        count += 1
-
-    return success_response(conversations)
+async def get_conversations(
+    request, limit: int = Query(50, le=1000), cursor: Optional[str] = Query(None)
+):
+    """Retrieve chat conversations for a user (most recent activity first)."""
+    queryset = ChatConversation.objects.filter(user_id=request.user.id).values(
+        "id", "title", "channel", "started_at", "last_message_at"
+    )
+    conversations, next_cursor = await apaginate(
+        queryset, ("-last_message_at", "-id"), limit, cursor
+    )
+    return success_response(conversations, next_cursor=next_cursor)
 
 
 @router.get("/{conversation_id}", response=Dict[str, Any])
@@ -78,8 +75,13 @@ async def get_conversation(request, conversation_id: int):
 
 
 @router.get("/{conversation_id}/messages", response=Dict[str, Any])
-async def get_messages(request, conversation_id: int, limit: int = Query(100)):
-    """Retrieve messages for a conversation."""
+async def get_messages(
+    request,
+    conversation_id: int,
+    limit: int = Query(100, le=1000),
+    cursor: Optional[str] = Query(None),
+):
+    """Retrieve messages for a conversation (oldest first)."""
     # Ensure conversation belongs to user
     conv_exists = await ChatConversation.objects.filter(
         id=conversation_id, user_id=request.user.id
@@ -87,27 +89,17 @@ async def get_messages(request, conversation_id: int, limit: int = Query(100)):
     if not conv_exists:
         return error_response("Conversation not found", code=404)
 
-    messages = []
-    count = 0
-    async for msg in (
-        ChatMessage.objects.filter(conversation_id=conversation_id)
-        .order_by("id")
-        .values(
-            "id",
-            "conversation_id",
-            "sender_type",
-            "source_agent",
-            "content",
-            "content_type",
-            "created_at",
-        )
-    ):
-        if count >= limit:
-            break
-        messages.append(msg)
-        count += 1
-
-    return success_response(messages)
+    queryset = ChatMessage.objects.filter(conversation_id=conversation_id).values(
+        "id",
+        "conversation_id",
+        "sender_type",
+        "source_agent",
+        "content",
+        "content_type",
+        "created_at",
+    )
+    messages, next_cursor = await apaginate(queryset, ("id",), limit, cursor)
+    return success_response(messages, next_cursor=next_cursor)
 
 
 # --- Manual/Testing Endpoints ---
@@ -1,11 +1,34 @@
+import asyncio
+import inspect
 import logging
 from datetime import datetime
 from typing import Optional
 
-from core.models import ChatMessage
+from asgiref.sync import sync_to_async
+
+from core.models import ChatConversation, ChatMessage
+
+from .summarizer import get_summarizer
 
 logger = logging.getLogger(__name__)
 
+# Per-message cap when formatting history for prompts
+MAX_MESSAGE_CHARS = 2000
+
+# After a turn is stored, text messages older than the newest SUMMARY_WINDOW
+# are folded into ChatConversation.summary_text in the background, at least
+# SUMMARY_BATCH_SIZE and at most SUMMARY_MAX_BATCH per summarizer call.
+# Prompts show the summary plus every message it does not cover yet.
+SUMMARY_WINDOW = 20
+SUMMARY_BATCH_SIZE = 10
+SUMMARY_MAX_BATCH = 200
+# Most messages shown verbatim when folding has fallen behind (e.g. the
+# summarizer is failing, or a long conversation predates summaries)
+MAX_UNSUMMARIZED = SUMMARY_WINDOW + SUMMARY_MAX_BATCH
+
+# get_conversation_summary's text for a conversation with no messages yet
+NO_MESSAGES = "No previous messages in this conversation."
+
 
 # =============================================================================
 # Data Operations
@@ -56,19 +79,26 @@ def fetch_recent_messages(
     conversation_id: int,
     limit: int = 20,
     exclude_content_types: Optional[list[str]] = None,
+    after: Optional[datetime] = None,
 ) -> list[dict]:
     """
     Fetch the last N messages for a conversation.
 
+    The LIMIT is applied in SQL over the (conversation_id, id) index, so the
+    cost does not grow with the length of the conversation.
+
     Args:
         conversation_id: The conversation ID.
         limit: Maximum number of messages to fetch.
         exclude_content_types: Content types to exclude (e.g., ['json']).
+        after: Only messages created after this time.
 
     Returns:
-        List of message dicts in chronological order (oldest first).
+        List of message dicts (with id) in chronological order (oldest first).
     """
     queryset = ChatMessage.objects.filter(conversation_id=conversation_id)
+    if after is not None:
+        queryset = queryset.filter(created_at__gt=after)
 
     # Apply content type exclusions
     if exclude_content_types:
@@ -77,14 +107,146 @@ def fetch_recent_messages(
     # Get last N messages by ordering descending, then reverse for chronological order
     messages = list(
         queryset.order_by("-id").values(
-            "content_type", "source_agent", "sender_type", "content"
-        )
+            "id", "content_type", "source_agent", "sender_type", "content"
+        )[:limit]
     )
 
     # Reverse to get chronological order (oldest first)
     return list(reversed(messages))
 
 
+# =============================================================================
+# Rolling Summary
+# =============================================================================
+
+
+def _pending_fold(conversation_id: int) -> Optional[tuple]:
+    """
+    (summary, summarized_until, messages) for the next fold, or None.
+
+    Only text messages outside the newest SUMMARY_WINDOW and created after
+    summary_created_at are read, so each fold costs O(new messages), not
+    O(conversation). None until at least SUMMARY_BATCH_SIZE are pending.
+    """
+    window_ids = list(
+        ChatMessage.objects.filter(conversation_id=conversation_id)
+        .exclude(content_type__in=["json"])
+        .order_by("-id")
+        .values_list("id", flat=True)[:SUMMARY_WINDOW]
+    )
+    if len(window_ids) < SUMMARY_WINDOW:
+        return None
+    conversation = (
+        ChatConversation.objects.filter(id=conversation_id)
+        .values("summary_text", "summary_created_at")
+        .first()
+    )
+    if conversation is None:
+        return None
+    summarized_until = conversation["summary_created_at"]
+
+    pending_qs = ChatMessage.objects.filter(
+        conversation_id=conversation_id, id__lt=window_ids[-1]
+    ).exclude(content_type__in=["json"])
+    if summarized_until is not None:
+        pending_qs = pending_qs.filter(created_at__gt=summarized_until)
+
+    pending = list(
+        pending_qs.order_by("created_at", "id").values(
+            "source_agent", "sender_type", "content", "created_at"
+        )[: SUMMARY_MAX_BATCH + 1]
+    )
+    if len(pending) < SUMMARY_BATCH_SIZE:
+        return None
+
+    if len(pending) > SUMMARY_MAX_BATCH:
+        # End the batch on a timestamp boundary so the created_at filter of
+        # the next fold does not skip rows sharing the last folded timestamp
+        next_created_at = pending.pop()["created_at"]
+        pending = [
+            m for m in pending if m["created_at"] != next_created_at
+        ] or pending
+    return conversation["summary_text"], summarized_until, pending
+
+
+def _store_summary(
+    conversation_id: int,
+    summarized_until: Optional[datetime],
+    summary: str,
+    folded_until: datetime,
+) -> bool:
+    # Conditional on the old marker so concurrent folds do not fold twice
+    return bool(
+        ChatConversation.objects.filter(
+            id=conversation_id, summary_created_at=summarized_until
+        ).update(summary_text=summary, summary_created_at=folded_until)
+    )
+
+
+async def afold_conversation_summary(conversation_id: int) -> bool:
+    """
+    Fold one batch of old messages into the conversation summary.
+
+    Returns:
+        True if the summary advanced, False if nothing was due (or it failed).
+    """
+    batch = await sync_to_async(_pending_fold)(conversation_id)
+    if batch is None:
+        return False
+    summary, summarized_until, pending = batch
+
+    try:
+        new_summary = get_summarizer()(summary or "", pending)
+        if inspect.isawaitable(new_summary):
+            new_summary = await new_summary
+    except Exception as exc:
+        logger.warning(
+            "Failed to summarize conversation %s: %s", conversation_id, exc
+        )
+        return False
+
+    return await sync_to_async(_store_summary)(
+        conversation_id, summarized_until, new_summary, pending[-1]["created_at"]
+    )
+
+
+async def afold_until_current(conversation_id: int) -> int:
+    """Fold batches until fewer than SUMMARY_BATCH_SIZE are due; number of folds."""
+    folds = 0
+    while await afold_conversation_summary(conversation_id):
+        folds += 1
+    return folds
+
+
+# Background folds of this process: conversation ids, and task references
+# (the event loop only keeps weak ones)
+_folding: set[int] = set()
+_fold_tasks: set[asyncio.Task] = set()
+
+
+def schedule_summary_fold(conversation_id: int) -> None:
+    """
+    Fold the conversation's old messages after the reply has been sent, off
+    the turn's critical path. Call from the event loop once the turn's
+    messages are stored.
+    """
+    if not conversation_id or conversation_id in _folding:
+        return
+
+    async def fold() -> None:
+        try:
+            await afold_until_current(conversation_id)
+        except Exception:
+            logger.exception("Summary fold failed for conversation %s", conversation_id)
+        finally:
+            _folding.discard(conversation_id)
+
+    _folding.add(conversation_id)
+    task = asyncio.get_running_loop().create_task(fold())
+    _fold_tasks.add(task)
+    task.add_done_callback(_fold_tasks.discard)
+
+
 # =============================================================================
 # Formatting Functions
 # =============================================================================
@@ -104,7 +266,10 @@ def format_message(index: int, message: dict) -> str:
     sender_label = (
         message.get("source_agent") or message.get("sender_type") or "Unknown"
     )
-    return f"{index}. [{sender_label}] {message['content']}"
+    content = message["content"] or ""
+    if len(content) > MAX_MESSAGE_CHARS:
+        content = content[:MAX_MESSAGE_CHARS] + "... [truncated]"
+    return f"{index}. [{sender_label}] {content}"
 
 
 def format_messages_list(messages: list[dict]) -> str:
@@ -132,27 +297,56 @@ def format_messages_list(messages: list[dict]) -> str:
 
 def get_conversation_summary(conversation_id: int, limit: int = 20) -> str:
     """
-    Retrieve the last N messages formatted as 'Sender: Content'.
+    Retrieve the rolling summary plus every message it does not cover yet.
     Useful for LLM memory context.
 
+    Read-only: old messages are folded into the summary in the background
+    after each turn (schedule_summary_fold), so no message is ever missing
+    from the prompt and loading history never waits on the summarizer.
+
     Args:
         conversation_id: The conversation ID.
-        limit: Maximum number of messages to include.
+        limit: Minimum number of recent messages to include verbatim.
 
     Returns:
         Formatted conversation summary string.
     """
     try:
-        messages = fetch_recent_messages(
+        conversation = (
+            ChatConversation.objects.filter(id=conversation_id)
+            .values("summary_text", "summary_created_at")
+            .first()
+        ) or {"summary_text": None, "summary_created_at": None}
+        summary = conversation["summary_text"]
+
+        window = fetch_recent_messages(
             conversation_id=conversation_id,
-            limit=limit,
+            limit=MAX_UNSUMMARIZED + 1,
             exclude_content_types=["json"],
+            after=conversation["summary_created_at"],
+        )
+        behind = len(window) > MAX_UNSUMMARIZED
+        if behind:
+            window = window[-MAX_UNSUMMARIZED:]
+        elif len(window) < limit:
+            window = fetch_recent_messages(
+                conversation_id=conversation_id,
+                limit=limit,
+                exclude_content_types=["json"],
+            )
+
+        if not window:
+            return NO_MESSAGES
+
+        history = format_messages_list(window)
+        if behind:
+            history = "(Older messages are not summarized yet.)\n" + history
+        if not summary:
+            return history
+        return (
+            f"Summary of earlier conversation:\n{summary}\n\n"
+            f"Recent messages:\n{history}"
         )
-
-        if not messages:
-            return "No previous messages in this conversation."
-
-        return format_messages_list(messages)
 
     except Exception as exc:
         logger.warning(
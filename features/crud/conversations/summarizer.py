@@ -0,0 +1,97 @@
+"""
+Conversation summarizers.
+
+A summarizer is any callable `(previous_summary, messages) -> str` that folds
+`messages` (oldest first, dicts with source_agent/sender_type/content) into
+`previous_summary` and returns the new rolling summary; it may also be a
+coroutine function. The active one is chosen by the CONVERSATION_SUMMARIZER
+setting (dotted path). Folds run in the background after a turn is stored
+(see service.schedule_summary_fold).
+"""
+
+from functools import lru_cache
+from typing import Awaitable, Callable, Union
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+Summarizer = Callable[[str, list[dict]], Union[str, Awaitable[str]]]
+
+# Upper bound on stored summary length, whichever summarizer is used
+MAX_SUMMARY_CHARS = 4000
+
+# Per-message cap for the extractive summarizer
+EXTRACT_CHARS = 160
+
+
+def _sender(message: dict) -> str:
+    return message.get("source_agent") or message.get("sender_type") or "Unknown"
+
+
+def _clip(summary: str) -> str:
+    """Keep the newest MAX_SUMMARY_CHARS of a summary, cut on a line boundary."""
+    if len(summary) <= MAX_SUMMARY_CHARS:
+        return summary
+    clipped = summary[-MAX_SUMMARY_CHARS:]
+    newline = clipped.find("\n")
+    return clipped[newline + 1 :] if newline != -1 else clipped
+
+
+def summarize_extractive(previous_summary: str, messages: list[dict]) -> str:
+    """
+    Deterministic summarizer: one clipped line per message appended to the
+    previous summary. No model call, so it is cheap and reproducible in tests.
+    """
+    lines = [previous_summary] if previous_summary else []
+    for message in messages:
+        content = " ".join((message.get("content") or "").split())
+        if len(content) > EXTRACT_CHARS:
+            content = content[:EXTRACT_CHARS] + "..."
+        lines.append(f"- [{_sender(message)}] {content}")
+    return _clip("\n".join(lines))
+
+
+async def summarize_with_llm(previous_summary: str, messages: list[dict]) -> str:
+    """Fold messages into the summary with the default chat model."""
+    from langchain_core.prompts import ChatPromptTemplate
+    from core.llm_providers.registry import get_llm
+
+    system_prompt = """
+    You maintain a rolling summary of a conversation between a user and a
+    personal finance assistant.
+
+    Update the existing summary with the new messages. Keep facts the user
+    stated (names, amounts, dates, budgets, goals, preferences), decisions that
+    were made and open questions. Drop greetings and small talk. Do NOT invent
+    information. Return plain text only, at most 15 short bullet points.
+    """
+    human_prompt = """
+    Existing summary:
+    {previous_summary}
+
+    New messages:
+    {messages}
+    """
+    prompt = ChatPromptTemplate.from_messages(
+        [("system", system_prompt), ("human", human_prompt)]
+    )
+    chain = prompt | get_llm()
+    response = await chain.ainvoke(
+        {
+            "previous_summary": previous_summary or "(empty)",
+            "messages": "\n".join(
+                f"[{_sender(m)}] {m.get('content') or ''}" for m in messages
+            ),
+        }
+    )
+    return _clip(response.content.strip())
+
+
+@lru_cache(maxsize=None)
+def _load(path: str) -> Summarizer:
+    return import_string(path)
+
+
+def get_summarizer() -> Summarizer:
+    """Return the summarizer configured by CONVERSATION_SUMMARIZER."""
+    return _load(settings.CONVERSATION_SUMMARIZER)
@@ -0,0 +1,5 @@
+"""Streaming per-user ledger exports."""
+
+from .endpoints import router
+
+__all__ = ["router"]
@@ -0,0 +1,71 @@
+"""Streaming ledger export endpoint."""
+
+from typing import AsyncIterator, Iterator, Optional
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from ninja import Query, Router
+
+from core.utils.responses import error_response
+from features.auth.api import AuthBearer
+from .service import export_chunks, export_filename, parse_datasets
+
+router = Router(auth=AuthBearer())
+
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+_DONE = object()
+
+
+async def _aiter_sync(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Drive a sync chunk generator from the event loop one chunk at a time.
+
+    Django buffers sync iterators completely under ASGI, which would defeat
+    streaming. thread_sensitive keeps every step (and the open server-side
+    cursor) on the request's database thread.
+    """
+    step = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await step(chunks, _DONE)) is not _DONE:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+@router.get("/")
+async def export_ledger(
+    request,
+    datasets: Optional[str] = Query(
+        None, description="Comma-separated: transactions,budgets,goals,income"
+    ),
+    export_format: str = Query("ndjson", alias="format"),
+    compression: Optional[str] = Query(None),
+):
+    """
+    Stream the user's full history (inactive rows included) as NDJSON or CSV,
+    optionally zstd-compressed. CSV exports hold a single dataset.
+    """
+    export_format = export_format.lower()
+    if not datasets and export_format == "csv":
+        datasets = "transactions"
+    try:
+        names = parse_datasets(datasets)
+        chunks = export_chunks(request.user.id, names, export_format, compression)
+    except ValueError as e:
+        return error_response(str(e))
+
+    streaming_content = (
+        _aiter_sync(chunks) if isinstance(request, ASGIRequest) else chunks
+    )
+    response = StreamingHttpResponse(
+        streaming_content,
+        content_type="application/zstd"
+        if compression == "zstd"
+        else CONTENT_TYPES[export_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export_filename(names, export_format, compression)}"'
+    )
+    return response
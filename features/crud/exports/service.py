@@ -0,0 +1,239 @@
+"""
+Streaming ledger export.
+
+Each dataset is read with `QuerySet.iterator()`, which on PostgreSQL declares a
+named server-side cursor and fetches EXPORT_FETCH_SIZE rows at a time. Rows
+are encoded (NDJSON or CSV), optionally zstd-compressed, and yielded in
+~EXPORT_CHUNK_BYTES pieces, so memory use does not depend on history size.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from django.db import transaction
+
+from core.models import Budget, Goal, Income, Transaction
+
+# Rows fetched per server-side cursor round trip
+EXPORT_FETCH_SIZE = 2000
+
+# Approximate size of each yielded (uncompressed) chunk
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+ZSTD_LEVEL = 3
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_COMPRESSIONS = ("zstd",)
+
+# dataset -> (model, exported fields, ordering); inactive rows are included
+EXPORT_DATASETS = {
+    "transactions": (
+        Transaction,
+        (
+            "id",
+            "date",
+            "transaction_type",
+            "amount",
+            "description",
+            "city",
+            "neighbourhood",
+            "budget_id",
+            "account_id",
+            "transfer_to_id",
+            "income_source_id",
+            "income_period",
+            "active",
+            "created_at",
+            "updated_at",
+        ),
+        ("date", "id"),
+    ),
+    "budgets": (
+        Budget,
+        (
+            "id",
+            "budget_name",
+            "description",
+            "total_limit",
+            "priority_level_int",
+            "icon",
+            "color",
+            "active",
+            "created_at",
+            "updated_at",
+        ),
+        ("id",),
+    ),
+    "goals": (
+        Goal,
+        (
+            "id",
+            "goal_name",
+            "description",
+            "target",
+            "saved_amount",
+            "start_date",
+            "due_date",
+            "plan",
+            "icon",
+            "color",
+            "active",
+            "created_at",
+            "updated_at",
+        ),
+        ("id",),
+    ),
+    "income": (
+        Income,
+        (
+            "id",
+            "type_income",
+            "description",
+            "amount",
+            "payment_day",
+            "next_payment_date",
+            "account_id",
+            "active",
+            "created_at",
+            "updated_at",
+        ),
+        ("id",),
+    ),
+}
+
+
+def parse_datasets(value: Optional[str]) -> list[str]:
+    """
+    Parse a comma-separated dataset list (None/empty means all of them).
+
+    Raises:
+        ValueError: on an unknown dataset name.
+    """
+    if not value:
+        return list(EXPORT_DATASETS)
+    names = [name.strip().lower() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in EXPORT_DATASETS]
+    if unknown:
+        raise ValueError(
+            f"Unknown dataset(s): {', '.join(unknown)}. "
+            f"Choose from: {', '.join(EXPORT_DATASETS)}"
+        )
+    return list(dict.fromkeys(names))
+
+
+def iter_dataset_rows(user_id: int, dataset: str) -> Iterator[Dict[str, Any]]:
+    """Yield a user's rows of one dataset through a server-side cursor."""
+    model, fields, ordering = EXPORT_DATASETS[dataset]
+    queryset = model.objects.filter(user_id=user_id).order_by(*ordering)
+    yield from queryset.values(*fields).iterator(chunk_size=EXPORT_FETCH_SIZE)
+
+
+def _plain(value: Any) -> Any:
+    """JSON/CSV-friendly scalar (Decimals keep their exact text)."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _ndjson_lines(user_id: int, datasets: Sequence[str]) -> Iterator[str]:
+    for dataset in datasets:
+        for row in iter_dataset_rows(user_id, dataset):
+            record = {"dataset": dataset}
+            record.update((key, _plain(value)) for key, value in row.items())
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _csv_lines(user_id: int, dataset: str) -> Iterator[str]:
+    _, fields, _ = EXPORT_DATASETS[dataset]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values: Iterable[Any]) -> str:
+        writer.writerow(values)
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    yield line(fields)
+    for row in iter_dataset_rows(user_id, dataset):
+        yield line(_plain(row[field]) for field in fields)
+
+
+def _batched(lines: Iterable[str]) -> Iterator[bytes]:
+    """Join encoded lines into ~EXPORT_CHUNK_BYTES chunks."""
+    parts = []
+    size = 0
+    for text in lines:
+        parts.append(text)
+        size += len(text)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield "".join(parts).encode("utf-8")
+            parts = []
+            size = 0
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+def _zstd(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_chunks(
+    user_id: int,
+    datasets: Sequence[str],
+    export_format: str = "ndjson",
+    compression: Optional[str] = None,
+) -> Iterator[bytes]:
+    """
+    Stream a user's export as byte chunks.
+
+    NDJSON tags every record with its "dataset"; CSV holds a single dataset.
+    All cursors run inside one transaction, so PostgreSQL streams them lazily
+    instead of materialising WITH HOLD cursors at commit.
+
+    Raises:
+        ValueError: on an unsupported format/compression, or CSV with several datasets.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if compression is not None and compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(
+            f"compression must be one of: {', '.join(EXPORT_COMPRESSIONS)}"
+        )
+    if export_format == "csv" and len(datasets) != 1:
+        raise ValueError("CSV exports hold exactly one dataset")
+
+    def generate() -> Iterator[bytes]:
+        with transaction.atomic():
+            if export_format == "csv":
+                lines = _csv_lines(user_id, datasets[0])
+            else:
+                lines = _ndjson_lines(user_id, datasets)
+            chunks = _batched(lines)
+            if compression == "zstd":
+                chunks = _zstd(chunks)
+            yield from chunks
+
+    return generate()
+
+
+def export_filename(
+    datasets: Sequence[str], export_format: str, compression: Optional[str]
+) -> str:
+    stem = datasets[0] if len(datasets) == 1 else "ledger"
+    suffix = ".zst" if compression == "zstd" else ""
+    return f"{stem}-{date.today().isoformat()}.{export_format}{suffix}"
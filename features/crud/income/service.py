@@ -0,0 +1,175 @@
+"""
+Recurring income processing.
+
+Due incomes are paid in chunks by one SQL statement per chunk. The statement
+claims the chunk with `FOR UPDATE SKIP LOCKED`, so several workers can run the
+job at once without waiting on each other. It then expands every missed
+period up to today, inserts one DEPOSIT per (income, period), credits the
+accounts and moves next_payment_date past today. The unique
+(income_source, income_period) constraint makes each period idempotent.
+"""
+
+import logging
+from datetime import date
+from typing import Any, Dict, Optional
+
+from django.db import connection, transaction
+
+from core.utils.fingerprint import transaction_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Incomes claimed per statement/transaction
+INCOME_CHUNK_SIZE = 1000
+
+# Monthly schedule anchored on payment_day: period 0 is next_payment_date,
+# period k is month k after it on min(payment_day, last day of that month)
+# (Feb 28 for an anchor of 31, then Mar 31). The series runs one month past
+# today so every income also gets its next future date.
+PROCESS_DUE_SQL = """
+    WITH due AS (
+        SELECT id, user_id, account_id, amount, type_income, payment_day,
+               next_payment_date
+        FROM core_income
+        WHERE active AND payment_day IS NOT NULL
+          AND next_payment_date <= %(today)s
+          AND account_id IS NOT NULL AND amount IS NOT NULL
+          AND (%(user_id)s::integer IS NULL OR user_id = %(user_id)s::integer)
+        ORDER BY next_payment_date, id
+        LIMIT %(chunk_size)s
+        FOR UPDATE SKIP LOCKED
+    ),
+    schedule AS (
+        SELECT d.id, d.user_id, d.account_id, d.amount, d.type_income,
+               CASE WHEN k = 0 THEN d.next_payment_date
+                    ELSE (m + LEAST(GREATEST(d.payment_day, 1),
+                                    EXTRACT(DAY FROM m + INTERVAL '1 month - 1 day')::int)
+                          - 1)
+               END AS period
+        FROM due d
+        CROSS JOIN LATERAL generate_series(
+            0,
+            (EXTRACT(YEAR FROM %(today)s::date) - EXTRACT(YEAR FROM d.next_payment_date))::int * 12
+            + (EXTRACT(MONTH FROM %(today)s::date) - EXTRACT(MONTH FROM d.next_payment_date))::int
+            + 1
+        ) AS k
+        CROSS JOIN LATERAL (
+            SELECT (date_trunc('month', d.next_payment_date)
+                    + k * INTERVAL '1 month')::date AS m
+        ) months
+    ),
+    inserted AS (
+        INSERT INTO core_transaction
+            (transaction_type, date, amount, description, user_id, account_id,
+             income_source_id, income_period, active, created_at)
+        SELECT 'DEPOSIT', period, amount, type_income || ' Recurring Income',
+               user_id, account_id, id, period, TRUE, NOW()
+        FROM schedule
+        WHERE period <= %(today)s
+        ORDER BY id, period
+        ON CONFLICT (income_source_id, income_period)
+            WHERE income_period IS NOT NULL
+            DO NOTHING
+        RETURNING id, user_id, date, amount, description, account_id
+    ),
+    credited AS (
+        UPDATE core_account a SET balance = a.balance + c.total
+        FROM (
+            SELECT account_id, SUM(amount) AS total FROM inserted GROUP BY account_id
+        ) c
+        WHERE a.id = c.account_id
+        RETURNING a.id
+    ),
+    rescheduled AS (
+        UPDATE core_income i SET next_payment_date = n.next_date, updated_at = NOW()
+        FROM (
+            SELECT id, MIN(period) AS next_date
+            FROM schedule WHERE period > %(today)s GROUP BY id
+        ) n
+        WHERE i.id = n.id
+        RETURNING i.id
+    )
+    SELECT
+        (SELECT COUNT(*) FROM due) AS claimed,
+        (SELECT COUNT(*) FROM rescheduled) AS rescheduled,
+        (SELECT COUNT(*) FROM credited) AS accounts,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'user_id', user_id, 'date', date::text,
+                    'amount', amount::text, 'description', description,
+                    'account_id', account_id)), '[]')
+         FROM inserted) AS deposits
+"""
+
+FINGERPRINT_SQL = """
+    UPDATE core_transaction t SET fingerprint = v.fingerprint
+    FROM unnest(%s::bigint[], %s::bigint[]) AS v(id, fingerprint)
+    WHERE t.id = v.id
+"""
+
+
+def process_due_income_chunk(
+    today: date, chunk_size: int = INCOME_CHUNK_SIZE, user_id: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Pay every missed period of up to `chunk_size` due incomes in one transaction.
+
+    Returns:
+        dict with claimed (incomes locked), deposits (rows inserted) and
+        accounts (accounts credited). claimed == 0 means nothing is left
+        that this worker can take.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            PROCESS_DUE_SQL,
+            {"today": today, "chunk_size": chunk_size, "user_id": user_id},
+        )
+        claimed, rescheduled, accounts, deposits = cursor.fetchone()
+
+        if deposits:
+            cursor.execute(
+                FINGERPRINT_SQL,
+                [
+                    [d["id"] for d in deposits],
+                    [
+                        transaction_fingerprint(
+                            d["user_id"],
+                            d["date"],
+                            d["amount"],
+                            d["description"],
+                            d["account_id"],
+                            "DEPOSIT",
+                        )
+                        for d in deposits
+                    ],
+                ],
+            )
+
+    return {"claimed": claimed, "deposits": len(deposits), "accounts": accounts}
+
+
+def process_due_incomes(
+    today: date, chunk_size: int = INCOME_CHUNK_SIZE, user_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Process due incomes chunk by chunk until none are left.
+
+    Args:
+        today: Periods on or before this date are paid.
+        chunk_size: Incomes per transaction.
+        user_id: Restrict to one user's incomes (benchmarks, support).
+    """
+    totals = {"incomes": 0, "deposits": 0, "chunks": 0}
+    while True:
+        chunk = process_due_income_chunk(today, chunk_size, user_id)
+        if not chunk["claimed"]:
+            break
+        totals["incomes"] += chunk["claimed"]
+        totals["deposits"] += chunk["deposits"]
+        totals["chunks"] += 1
+        logger.info(
+            "Recurring income chunk %s: %s incomes, %s deposits",
+            totals["chunks"],
+            chunk["claimed"],
+            chunk["deposits"],
+        )
+    return totals
@@ -9,8 +9,9 @@ from ninja import Router, Query
 from django.utils import timezone
 
 from core.models import Transaction, Account
+from core.utils.pagination import apaginate
 from core.utils.responses import success_response, error_response
-from ..utils import TRANSACTION_FIELDS, format_transaction
+from ..utils import TRANSACTION_FIELDS, format_transaction, transaction_ordering
 from ..schemas import TransactionResponse, TransactionListResponse
 from .schemas import DepositCreateSchema, DepositUpdateSchema
 from features.auth.api import AuthBearer
@@ -26,6 +27,7 @@ async def get_deposits(
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     limit: int = Query(100, le=1000),
+    cursor: Optional[str] = Query(None),
 ):
     """Retrieve deposit transactions for a user."""
     filters = {"user_id": request.user.id, "transaction_type": "DEPOSIT"}
@@ -36,23 +38,15 @@ async def get_deposits(
     if end_date:
         filters["date__lte"] = end_date
 
-    queryset = Transaction.objects.filter(**filters)
-    if active is False:
-        ordering = ("-updated_at",)
-    else:
-        ordering = ("-date", "-created_at")
-
-    # Use async for with limit
-    transactions = []
-    count = 0
-    async for txn in queryset.order_by(*ordering).values(*TRANSACTION_FIELDS):
-        if count >= limit:
-            break
-        transactions.append(txn)
-        count += 1
+    queryset = Transaction.objects.filter(**filters).values(*TRANSACTION_FIELDS)
+
+    # Keyset page: constant cost however deep the client scrolls
+    transactions, next_cursor = await apaginate(
+        queryset, transaction_ordering(active), limit, cursor
+    )
 
     result = [format_transaction(txn) for txn in transactions]
-    return success_response(result)
+    return success_response(result, next_cursor=next_cursor)
 
 
 @router.get("/{deposit_id}", response=TransactionResponse)
@@ -166,6 +160,9 @@ async def update_deposit(request, deposit_id: int, payload: DepositUpdateSchema)
             if rows_affected == 0:
                 return None, "Deposit not found"
 
+            # Queryset updates bypass save(); refresh the fingerprint
+            Transaction.objects.get(id=deposit_id).save(update_fields=["fingerprint"])
+
             txn = (
                 Transaction.objects.filter(id=deposit_id)
                 .values(*TRANSACTION_FIELDS)
@@ -13,8 +13,9 @@ from typing import Optional
 from ninja import Router, Query
 
 from core.models import Transaction
+from core.utils.pagination import apaginate
 from core.utils.responses import success_response, error_response
-from .utils import TRANSACTION_FIELDS, format_transaction
+from .utils import TRANSACTION_FIELDS, format_transaction, transaction_ordering
 from .schemas import TransactionResponse, TransactionListResponse
 from features.auth.api import AuthBearer
 
@@ -30,6 +31,7 @@ async def get_transactions(
     end_date: Optional[str] = Query(None),
     transaction_type: Optional[str] = Query(None),
     limit: int = Query(100, le=1000),
+    cursor: Optional[str] = Query(None),
 ):
     """Retrieve all transactions for a user (all types)."""
     filters = {"user_id": request.user.id}
@@ -42,23 +44,15 @@ async def get_transactions(
     if transaction_type:
         filters["transaction_type"] = transaction_type
 
-    queryset = Transaction.objects.filter(**filters)
-    if active is False:
-        ordering = ("-updated_at",)
-    else:
-        ordering = ("-date", "-created_at")
+    queryset = Transaction.objects.filter(**filters).values(*TRANSACTION_FIELDS)
 
-    # Use async for with slicing via list comprehension
-    transactions = []
-    count = 0
-    async for txn in queryset.order_by(*ordering).values(*TRANSACTION_FIELDS):
-        if count >= limit:
-            break
-        transactions.append(txn)
-        count += 1
+    # Keyset page: constant cost however deep the client scrolls
+    transactions, next_cursor = await apaginate(
+        queryset, transaction_ordering(active), limit, cursor
+    )
 
     result = [format_transaction(txn) for txn in transactions]
-    return success_response(result)
+    return success_response(result, next_cursor=next_cursor)
 
 
 @router.get("/{transaction_id}", response=TransactionResponse)
@@ -9,8 +9,18 @@ from ninja import Router, Query
 from django.utils import timezone
 
 from core.models import Transaction, Account
+from core.utils.database import atomic_outcome
+from core.utils.pagination import apaginate
 from core.utils.responses import success_response, error_response
-from ..utils import TRANSACTION_FIELDS, format_transaction
+from features.crud.budgets.service import record_expense_change
+from core.utils.fingerprint import transaction_fingerprint
+from ..utils import (
+    DUPLICATE_ERROR,
+    TRANSACTION_FIELDS,
+    find_duplicate,
+    format_transaction,
+    transaction_ordering,
+)
 from ..schemas import TransactionResponse, TransactionListResponse
 from .schemas import ExpenseCreateSchema, ExpenseUpdateSchema
 from features.auth.api import AuthBearer
@@ -26,6 +36,7 @@ async def get_expenses(
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     limit: int = Query(100, le=1000),
+    cursor: Optional[str] = Query(None),
 ):
     """Retrieve expense transactions for a user."""
     filters = {"user_id": request.user.id, "transaction_type": "EXPENSE"}
@@ -36,23 +47,15 @@ async def get_expenses(
     if end_date:
         filters["date__lte"] = end_date
 
-    queryset = Transaction.objects.filter(**filters)
-    if active is False:
-        ordering = ("-updated_at",)
-    else:
-        ordering = ("-date", "-created_at")
-
-    # Use async for with limit
-    transactions = []
-    count = 0
-    async for txn in queryset.order_by(*ordering).values(*TRANSACTION_FIELDS):
-        if count >= limit:
-            break
-        transactions.append(txn)
-        count += 1
+    queryset = Transaction.objects.filter(**filters).values(*TRANSACTION_FIELDS)
+
+    # Keyset page: constant cost however deep the client scrolls
+    transactions, next_cursor = await apaginate(
+        queryset, transaction_ordering(active), limit, cursor
+    )
 
     result = [format_transaction(txn) for txn in transactions]
-    return success_response(result)
+    return success_response(result, next_cursor=next_cursor)
 
 
 @router.get("/{expense_id}", response=TransactionResponse)
@@ -76,6 +79,7 @@ async def create_expense(request, payload: ExpenseCreateSchema):
 
     # Complex transactional logic - keep in sync_to_async for atomicity
     @sync_to_async
+    @atomic_outcome
     def create_expense_record():
         try:
             account = None
@@ -93,6 +97,18 @@ async def create_expense(request, payload: ExpenseCreateSchema):
                         f"Insufficient balance. Available: {float(account.balance):.2f}, Required: {payload.amount:.2f}",
                     )
 
+            if not payload.allow_duplicate:
+                fingerprint = transaction_fingerprint(
+                    request.user.id,
+                    payload.date,
+                    payload.amount,
+                    payload.description,
+                    payload.account_id,
+                )
+                duplicate_id = find_duplicate(request.user.id, [fingerprint])
+                if duplicate_id:
+                    return None, DUPLICATE_ERROR.format(id=duplicate_id)
+
             txn = Transaction.objects.create(
                 user_id=request.user.id,
                 date=payload.date,
@@ -104,6 +120,7 @@ async def create_expense(request, payload: ExpenseCreateSchema):
                 account_id=payload.account_id,
                 transaction_type="EXPENSE",
             )
+            record_expense_change(new_txn=txn)
 
             # Deduct from account balance
             if account:
@@ -121,6 +138,8 @@ async def create_expense(request, payload: ExpenseCreateSchema):
             return None, str(e)
 
     result, error = await create_expense_record()
+    if error and "duplicate" in error:
+        return error_response(error, code=409)
     if error:
         return error_response(
             error
@@ -140,10 +159,15 @@ async def update_expense(request, expense_id: int, payload: ExpenseUpdateSchema)
 
     # Complex transactional logic - keep in sync_to_async for atomicity
     @sync_to_async
+    @atomic_outcome
     def update_expense_record():
-        current_txn = Transaction.objects.filter(
-            id=expense_id, user_id=request.user.id, transaction_type="EXPENSE"
-        ).first()
+        # Locked so concurrent edits compute the rollup/balance change from
+        # the committed state instead of both applying it from the same one
+        current_txn = (
+            Transaction.objects.select_for_update()
+            .filter(id=expense_id, user_id=request.user.id, transaction_type="EXPENSE")
+            .first()
+        )
 
         if not current_txn:
             return None, "Expense not found"
@@ -177,6 +201,10 @@ async def update_expense(request, expense_id: int, payload: ExpenseUpdateSchema)
             if rows_affected == 0:
                 return None, "Expense not found"
 
+            updated_txn = Transaction.objects.get(id=expense_id)
+            updated_txn.save(update_fields=["fingerprint"])
+            record_expense_change(old_txn=current_txn, new_txn=updated_txn)
+
             txn = (
                 Transaction.objects.filter(id=expense_id)
                 .values(*TRANSACTION_FIELDS)
@@ -199,14 +227,20 @@ async def delete_expense(request, expense_id: int):
 
     # Complex transactional logic - keep in sync_to_async for atomicity
     @sync_to_async
+    @atomic_outcome
     def soft_delete_expense():
         try:
-            txn = Transaction.objects.filter(
-                id=expense_id,
-                user_id=request.user.id,
-                transaction_type="EXPENSE",
-                active=True,
-            ).first()
+            # Locked so a concurrent delete waits and then finds it inactive
+            txn = (
+                Transaction.objects.select_for_update()
+                .filter(
+                    id=expense_id,
+                    user_id=request.user.id,
+                    transaction_type="EXPENSE",
+                    active=True,
+                )
+                .first()
+            )
 
             if not txn:
                 return False, "Expense not found"
@@ -217,6 +251,8 @@ async def delete_expense(request, expense_id: int):
                 account.balance += txn.amount
                 account.save(update_fields=["balance"])
 
+            record_expense_change(old_txn=txn)
+
             txn.active = False
             txn.updated_at = timezone.now()
             txn.save(update_fields=["active", "updated_at"])
@@ -14,6 +14,8 @@ class ExpenseCreateSchema(Schema):
     budget_id: Optional[int] = None
     neighbourhood: Optional[str] = None
     account_id: Optional[int] = None
+    # Skip the duplicate check (e.g. two identical coffees on the same day)
+    allow_duplicate: bool = False
 
 
 class ExpenseUpdateSchema(Schema):
@@ -0,0 +1,5 @@
+"""Bulk statement imports submodule."""
+
+from .endpoints import router
+
+__all__ = ["router"]
@@ -0,0 +1,57 @@
+"""Bulk statement import endpoint."""
+
+import io
+import logging
+from typing import Optional
+from asgiref.sync import sync_to_async
+
+from ninja import File, Query, Router
+from ninja.files import UploadedFile
+
+from core.utils.responses import success_response, error_response
+from features.auth.api import AuthBearer
+from .parsers import iter_statement_rows
+from .service import import_statement
+
+logger = logging.getLogger(__name__)
+router = Router(auth=AuthBearer())
+
+STATEMENT_FORMATS = ("csv", "ofx")
+
+
+@router.post("/")
+async def import_transactions(
+    request,
+    file: UploadedFile = File(...),
+    account_id: Optional[int] = Query(None),
+    file_format: Optional[str] = Query(None, alias="format"),
+    date_format: str = Query("%Y-%m-%d"),
+):
+    """
+    Import a CSV or OFX bank statement in one set-based pass.
+
+    The format defaults to the file extension. Unparseable rows are skipped
+    and listed in the report.
+    """
+    file_format = (file_format or (file.name or "").rsplit(".", 1)[-1]).lower()
+    if file_format not in STATEMENT_FORMATS:
+        return error_response(f"format must be one of: {', '.join(STATEMENT_FORMATS)}")
+
+    @sync_to_async
+    def run_import():
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        options = {"date_format": date_format} if file_format == "csv" else {}
+        rows = iter_statement_rows(stream, file_format, **options)
+        return import_statement(request.user.id, account_id, rows)
+
+    try:
+        report = await run_import()
+    except ValueError as e:
+        return error_response(str(e))
+    except Exception as e:
+        logger.exception("Statement import failed")
+        return error_response(f"Failed to import statement: {e}", code=500)
+
+    return success_response(
+        report, f"Imported {report['imported']} transactions", count=report["imported"]
+    )
@@ -0,0 +1,156 @@
+"""
+Streaming bank statement parsers.
+
+Each parser reads a text stream lazily and yields one item per statement
+line: a `ParsedRow`, or a `RowError` for a line that cannot be parsed (the
+importer records the error and carries on).
+"""
+
+import csv
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Iterator, Optional, TextIO, Union
+
+MAX_DESCRIPTION_CHARS = 255
+
+
+@dataclass
+class ParsedRow:
+    line: int
+    date: date
+    amount: Decimal  # Always positive; the direction is in transaction_type
+    transaction_type: str  # EXPENSE or DEPOSIT
+    description: Optional[str] = None
+    city: Optional[str] = None
+    neighbourhood: Optional[str] = None
+    budget_name: Optional[str] = None
+
+
+@dataclass
+class RowError:
+    line: int
+    message: str
+
+
+ParseResult = Union[ParsedRow, RowError]
+
+
+def _clean(value: Optional[str]) -> Optional[str]:
+    value = (value or "").strip()
+    return value[:MAX_DESCRIPTION_CHARS] or None
+
+
+def _signed_amount(raw: str) -> Decimal:
+    """Parse '1,234.50', '-12.00' or '(12.00)' into a signed Decimal."""
+    text = (raw or "").strip().replace(",", "")
+    negative = text.startswith("(") and text.endswith(")")
+    if negative:
+        text = text[1:-1]
+    amount = Decimal(text)
+    return -amount if negative else amount
+
+
+def _direction(signed: Decimal, explicit_type: Optional[str]) -> str:
+    if explicit_type:
+        kind = explicit_type.strip().upper()
+        if kind not in ("EXPENSE", "DEPOSIT"):
+            raise ValueError(f"unsupported type '{explicit_type}'")
+        return kind
+    # Bank convention: debits are negative
+    return "EXPENSE" if signed < 0 else "DEPOSIT"
+
+
+# =============================================================================
+# CSV
+# =============================================================================
+
+
+def iter_csv_rows(stream: TextIO, date_format: str = "%Y-%m-%d") -> Iterator[ParseResult]:
+    """
+    Parse a CSV statement with a header row.
+
+    Required columns: date, amount. Optional: description, city,
+    neighbourhood, budget (budget name) and type (EXPENSE/DEPOSIT; when
+    missing, negative amounts are expenses and positive ones deposits).
+    """
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None:
+        return
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    missing = {"date", "amount"} - set(reader.fieldnames)
+    if missing:
+        yield RowError(1, f"missing required columns: {', '.join(sorted(missing))}")
+        return
+
+    for record in reader:
+        line = reader.line_num
+        try:
+            signed = _signed_amount(record["amount"])
+            yield ParsedRow(
+                line=line,
+                date=datetime.strptime(record["date"].strip(), date_format).date(),
+                amount=abs(signed),
+                transaction_type=_direction(signed, record.get("type")),
+                description=_clean(record.get("description")),
+                city=_clean(record.get("city")),
+                neighbourhood=_clean(record.get("neighbourhood")),
+                budget_name=_clean(record.get("budget")),
+            )
+        except (ValueError, InvalidOperation, AttributeError) as exc:
+            yield RowError(line, f"invalid row: {exc}")
+
+
+# =============================================================================
+# OFX
+# =============================================================================
+
+OFX_TAG = re.compile(r"<(/?)([A-Z0-9.]+)>([^<\r\n]*)", re.IGNORECASE)
+
+
+def _ofx_date(value: str) -> date:
+    # YYYYMMDD[HHMMSS[.XXX]][[+-TZ]] - only the date part matters here
+    return datetime.strptime(value.strip()[:8], "%Y%m%d").date()
+
+
+def iter_ofx_rows(stream: TextIO) -> Iterator[ParseResult]:
+    """
+    Parse the <STMTTRN> entries of an OFX 1.x (SGML) or 2.x (XML) statement.
+
+    Uses DTPOSTED, TRNAMT and NAME/MEMO; the sign of TRNAMT gives the direction.
+    """
+    current = None
+    start_line = 0
+    for line_no, line in enumerate(stream, start=1):
+        for closing, tag, value in OFX_TAG.findall(line):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if not closing:
+                    current, start_line = {}, line_no
+                    continue
+                if current is None:
+                    continue
+                entry, current = current, None
+                try:
+                    signed = _signed_amount(entry["TRNAMT"])
+                    yield ParsedRow(
+                        line=start_line,
+                        date=_ofx_date(entry["DTPOSTED"]),
+                        amount=abs(signed),
+                        transaction_type=_direction(signed, None),
+                        description=_clean(entry.get("NAME") or entry.get("MEMO")),
+                    )
+                except (KeyError, ValueError, InvalidOperation) as exc:
+                    yield RowError(start_line, f"invalid STMTTRN: {exc}")
+            elif current is not None and not closing and value.strip():
+                current[tag] = value.strip()
+
+
+def iter_statement_rows(stream: TextIO, file_format: str, **options) -> Iterator[ParseResult]:
+    """Dispatch to the parser for `file_format` ('csv' or 'ofx')."""
+    if file_format == "csv":
+        return iter_csv_rows(stream, **options)
+    if file_format == "ofx":
+        return iter_ofx_rows(stream)
+    raise ValueError(f"Unsupported statement format '{file_format}'")
@@ -0,0 +1,225 @@
+"""
+Set-based statement import.
+
+Rows are streamed with COPY into a temporary staging table, then merged into
+core_transaction by one statement that also assigns budgets, adjusts the
+account balance and updates the monthly spend rollup. Rows whose fingerprint
+matches an existing active transaction (e.g. an overlapping re-import) are
+skipped. Budget alerts are evaluated once per touched (budget, month) at the
+end, not per row.
+"""
+
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional
+
+from django.db import connection, transaction
+
+from core.models import Account
+from core.utils.fingerprint import transaction_fingerprint
+from features.notifications.budget_alerts import check_budget_limit
+from .parsers import ParseResult, RowError
+
+logger = logging.getLogger(__name__)
+
+# Errors echoed back in the import report (the count is always exact)
+MAX_REPORTED_ERRORS = 50
+
+STAGING_COLUMNS = (
+    "line",
+    "date",
+    "amount",
+    "transaction_type",
+    "description",
+    "city",
+    "neighbourhood",
+    "budget_name",
+    "fingerprint",
+)
+
+CREATE_STAGING_SQL = """
+    CREATE TEMP TABLE transaction_import_staging (
+        line integer,
+        date date NOT NULL,
+        amount numeric(12, 2) NOT NULL,
+        transaction_type text NOT NULL,
+        description text,
+        city text,
+        neighbourhood text,
+        budget_name text,
+        fingerprint bigint
+    ) ON COMMIT DROP
+"""
+
+# Budget assignment, in order: the budget named in the file (case-insensitive),
+# else the budget most recently used for the same description.
+MERGE_SQL = """
+    WITH named AS (
+        SELECT DISTINCT ON (lower(budget_name)) id, lower(budget_name) AS key
+        FROM core_budget
+        WHERE user_id = %(user_id)s AND active
+        ORDER BY lower(budget_name), priority_level_int DESC NULLS LAST, id
+    ),
+    history AS (
+        SELECT DISTINCT ON (t.description) t.description, t.budget_id
+        FROM core_transaction t
+        JOIN core_budget b ON b.id = t.budget_id AND b.active
+        WHERE t.user_id = %(user_id)s AND t.active
+          AND t.transaction_type = 'EXPENSE'
+          AND t.description IN (
+              SELECT description FROM transaction_import_staging
+              WHERE budget_name IS NULL
+          )
+        ORDER BY t.description, t.date DESC, t.id DESC
+    ),
+    inserted AS (
+        INSERT INTO core_transaction
+            (transaction_type, date, amount, description, city, user_id,
+             budget_id, account_id, neighbourhood, active, created_at,
+             fingerprint)
+        SELECT s.transaction_type, s.date, s.amount, s.description, s.city,
+               %(user_id)s,
+               CASE WHEN s.transaction_type = 'EXPENSE'
+                    THEN COALESCE(n.id, h.budget_id) END,
+               %(account_id)s, s.neighbourhood, TRUE, NOW(), s.fingerprint
+        FROM transaction_import_staging s
+        LEFT JOIN named n ON n.key = lower(s.budget_name)
+        LEFT JOIN history h
+            ON h.description = s.description AND s.budget_name IS NULL
+        WHERE NOT EXISTS (
+            SELECT 1 FROM core_transaction t
+            WHERE t.user_id = %(user_id)s AND t.active
+              AND t.fingerprint = s.fingerprint
+        )
+        ORDER BY s.line
+        RETURNING transaction_type, amount, budget_id, date
+    ),
+    balance AS (
+        UPDATE core_account SET balance = balance + (
+            SELECT COALESCE(SUM(CASE WHEN transaction_type = 'DEPOSIT'
+                                     THEN amount ELSE -amount END), 0)
+            FROM inserted
+        )
+        WHERE id = %(account_id)s
+        RETURNING balance
+    ),
+    rollup AS (
+        INSERT INTO core_budgetmonthlyspend
+            (user_id, budget_id, month, spent, count, alert_level, updated_at)
+        SELECT %(user_id)s, budget_id, date_trunc('month', date)::date,
+               SUM(amount), COUNT(*), 0, NOW()
+        FROM inserted
+        WHERE transaction_type = 'EXPENSE' AND budget_id IS NOT NULL
+        GROUP BY budget_id, date_trunc('month', date)
+        ON CONFLICT (budget_id, month) DO UPDATE SET
+            spent = core_budgetmonthlyspend.spent + EXCLUDED.spent,
+            count = core_budgetmonthlyspend.count + EXCLUDED.count,
+            updated_at = EXCLUDED.updated_at
+        RETURNING budget_id, month, spent, alert_level
+    )
+    SELECT
+        (SELECT COUNT(*) FROM inserted) AS imported,
+        (SELECT COUNT(*) FROM inserted WHERE transaction_type = 'EXPENSE') AS expenses,
+        (SELECT COUNT(*) FROM inserted
+         WHERE transaction_type = 'EXPENSE' AND budget_id IS NULL) AS unbudgeted,
+        (SELECT balance FROM balance) AS balance,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'budget_id', budget_id, 'month', month::text,
+                    'spent', spent::text, 'alert_level', alert_level)), '[]')
+         FROM rollup) AS touched
+"""
+
+
+def import_statement(
+    user_id: int, account_id: Optional[int], rows: Iterable[ParseResult]
+) -> Dict[str, Any]:
+    """
+    Import parsed statement rows for a user in one database transaction.
+
+    Args:
+        user_id: Owner of the imported transactions.
+        account_id: Account the statement belongs to (balance is adjusted), or None.
+        rows: Parser output; RowError entries are skipped and reported.
+
+    Returns:
+        Import report with imported/skipped/duplicate counts, the new account balance
+        and the first MAX_REPORTED_ERRORS errors.
+
+    Raises:
+        ValueError: if the account does not belong to the user.
+    """
+    if account_id is not None and not Account.objects.filter(
+        id=account_id, user_id=user_id, active=True
+    ).exists():
+        raise ValueError("Account not found or does not belong to user")
+
+    errors = []
+    error_count = 0
+    staged = 0
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(CREATE_STAGING_SQL)
+            with cursor.copy(
+                f"COPY transaction_import_staging ({', '.join(STAGING_COLUMNS)}) "
+                "FROM STDIN"
+            ) as copy:
+                for row in rows:
+                    if isinstance(row, RowError):
+                        error_count += 1
+                        if len(errors) < MAX_REPORTED_ERRORS:
+                            errors.append({"line": row.line, "error": row.message})
+                        continue
+                    copy.write_row(
+                        (
+                            row.line,
+                            row.date,
+                            row.amount,
+                            row.transaction_type,
+                            row.description,
+                            row.city,
+                            row.neighbourhood,
+                            row.budget_name,
+                            transaction_fingerprint(
+                                user_id,
+                                row.date,
+                                row.amount,
+                                row.description,
+                                account_id,
+                                row.transaction_type,
+                            ),
+                        )
+                    )
+                    staged += 1
+
+            cursor.execute(
+                MERGE_SQL, {"user_id": user_id, "account_id": account_id}
+            )
+            imported, expenses, unbudgeted, balance, touched = cursor.fetchone()
+
+        # One threshold evaluation per touched budget-month
+        for row in touched:
+            check_budget_limit(
+                row["budget_id"],
+                date.fromisoformat(row["month"]),
+                spent=Decimal(row["spent"]),
+                alert_level=row["alert_level"],
+            )
+
+    logger.info(
+        "Imported %s transactions for user %s (%s rows skipped)",
+        imported,
+        user_id,
+        error_count,
+    )
+    return {
+        "imported": imported,
+        "expenses": expenses,
+        "unbudgeted_expenses": unbudgeted,
+        "skipped": error_count,
+        "duplicates": staged - imported,
+        "account_balance": float(balance) if balance is not None else None,
+        "budget_months_updated": len(touched),
+        "errors": errors,
+    }
@@ -39,3 +39,4 @@ class TransactionListResponse(Schema):
     status: str
     message: str
     data: list[TransactionOutSchema]
+    next_cursor: Optional[str] = None
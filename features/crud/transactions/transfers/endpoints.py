@@ -10,8 +10,9 @@ from django.db import transaction as db_transaction
 from django.db.models import F
 
 from core.models import Transaction, Account
+from core.utils.pagination import apaginate
 from core.utils.responses import success_response, error_response
-from ..utils import TRANSACTION_FIELDS, format_transaction
+from ..utils import TRANSACTION_FIELDS, format_transaction, transaction_ordering
 from ..schemas import TransactionResponse, TransactionListResponse
 from .schemas import TransferCreateSchema
 from features.auth.api import AuthBearer
@@ -27,6 +28,7 @@ async def get_transfers(
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
     limit: int = Query(100, le=1000),
+    cursor: Optional[str] = Query(None),
 ):
     """Retrieve transfer transactions for a user."""
     filters = {"user_id": request.user.id, "transaction_type": "TRANSFER"}
@@ -37,23 +39,15 @@ async def get_transfers(
     if end_date:
         filters["date__lte"] = end_date
 
-    queryset = Transaction.objects.filter(**filters)
-    if active is False:
-        ordering = ("-updated_at",)
-    else:
-        ordering = ("-date", "-created_at")
-
-    # Use async for with limit
-    transactions = []
-    count = 0
-    async for txn in queryset.order_by(*ordering).values(*TRANSACTION_FIELDS):
-        if count >= limit:
-            break
-        transactions.append(txn)
-        count += 1
+    queryset = Transaction.objects.filter(**filters).values(*TRANSACTION_FIELDS)
+
+    # Keyset page: constant cost however deep the client scrolls
+    transactions, next_cursor = await apaginate(
+        queryset, transaction_ordering(active), limit, cursor
+    )
 
     result = [format_transaction(txn) for txn in transactions]
-    return success_response(result)
+    return success_response(result, next_cursor=next_cursor)
 
 
 @router.get("/{transfer_id}", response=TransactionResponse)
@@ -1,6 +1,8 @@
 """Shared utilities for transaction endpoints."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from core.models import Transaction
 
 # Fields to retrieve for transaction queries
 TRANSACTION_FIELDS = (
@@ -21,6 +23,23 @@ TRANSACTION_FIELDS = (
     "income_source_id",
 )
 
+# Returned with HTTP 409 when a create matches an existing transaction
+DUPLICATE_ERROR = (
+    "Possible duplicate of transaction {id}. "
+    "Resend with allow_duplicate=true to record it anyway."
+)
+
+# Keyset orderings for listings (must end in a unique column)
+TRANSACTION_ORDERING = ("-date", "-created_at", "-id")
+DELETED_TRANSACTION_ORDERING = ("-updated_at", "-id")
+
+
+def transaction_ordering(active: Optional[bool]) -> Tuple[str, ...]:
+    """Listing order: soft-deleted rows by deletion time, others by date."""
+    if active is False:
+        return DELETED_TRANSACTION_ORDERING
+    return TRANSACTION_ORDERING
+
 
 def format_transaction(txn: Dict[str, Any]) -> Dict[str, Any]:
     """Format transaction dict for JSON response."""
@@ -41,3 +60,15 @@ def format_transaction(txn: Dict[str, Any]) -> Dict[str, Any]:
         "created_at": txn["created_at"],
         "updated_at": txn.get("updated_at"),
     }
+
+
+def find_duplicate(user_id: int, fingerprints: Iterable[int]) -> Optional[int]:
+    """Id of an active transaction of the user matching any of `fingerprints`."""
+    return (
+        Transaction.objects.filter(
+            user_id=user_id, active=True, fingerprint__in=list(fingerprints)
+        )
+        .order_by("-id")
+        .values_list("id", flat=True)
+        .first()
+    )
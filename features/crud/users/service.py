@@ -4,12 +4,14 @@ from decimal import Decimal
 from typing import Optional
 
 from django.contrib.auth.models import User
+from django.db import connection
 from django.db.models import Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from core.models import Goal, Income, Profile, Transaction, Account
-from features.crud.budgets.service import fetch_active_budgets
+from core.utils.cache import versioned_get_or_set
+from core.utils.database import dictfetchall
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +92,20 @@ def fetch_user_accounts(user_id: int) -> list[dict]:
     )
 
 
+def spending_period(months_back: int) -> tuple:
+    """
+    Return (current_month_start, period_start, today) for spending stats.
+
+    The period covers the current month plus the previous (months_back - 1).
+    """
+    today = timezone.now().date()
+    current_month_start = today.replace(day=1)
+    period_start = current_month_start
+    for _ in range(months_back - 1):
+        period_start = (period_start - timedelta(days=1)).replace(day=1)
+    return current_month_start, period_start, today
+
+
 def fetch_spending_stats(user_id: int, months_back: int = 3) -> dict:
     """
     Get spending statistics based on complete months.
@@ -111,19 +127,8 @@ def fetch_spending_stats(user_id: int, months_back: int = 3) -> dict:
         - monthly_average = (Oct + Nov + Dec) / 3
         - current_month_spent = Jan 1-17 spending
     """
-    today = timezone.now().date()
-
-    # Current month boundaries (for current month spending)
-    current_month_start = today.replace(day=1)
-
-    # Calculate start of period: Current Month + Previous (N-1) Months
-    # e.g., if months_back=3: Current + Last 2
-    period_start = current_month_start
-    if months_back > 1:
-        for _ in range(months_back - 1):
-            period_start = (period_start - timedelta(days=1)).replace(day=1)
-    
-    # End is today (include current spending)
+    # Current month + previous (N-1) months, ending today
+    current_month_start, period_start, today = spending_period(months_back)
     period_end = today
 
     # --- Current month spending ---
@@ -186,6 +191,130 @@ def fetch_spending_stats(user_id: int, months_back: int = 3) -> dict:
     }
 
 
+USER_SUMMARY_SQL = """
+    WITH txn AS (
+        SELECT t.amount, t.date, t.description, t.budget_id, b.budget_name
+        FROM core_transaction t
+        LEFT JOIN core_budget b ON b.id = t.budget_id
+        WHERE t.user_id = %(user_id)s AND t.active
+          AND t.date BETWEEN %(period_start)s AND %(today)s
+    ),
+    spend AS (
+        SELECT COALESCE(SUM(amount) FILTER (WHERE date >= %(month_start)s), 0)
+                   AS current_month_spent,
+               COALESCE(SUM(amount), 0) AS historical_total
+        FROM txn
+    ),
+    categories AS (
+        SELECT budget_name, SUM(amount) AS total
+        FROM txn WHERE budget_id IS NOT NULL
+        GROUP BY budget_name
+    ),
+    stores AS (
+        SELECT description, SUM(amount) AS total
+        FROM txn
+        GROUP BY description
+        ORDER BY total DESC
+        LIMIT 10
+    )
+    SELECT
+        u.first_name,
+        u.last_name,
+        p.job_title,
+        p.employment_status,
+        (SELECT COALESCE(SUM(amount), 0) FROM core_income
+         WHERE user_id = u.id AND active) AS income,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'name', name, 'type', type, 'balance', balance)
+                    ORDER BY type), '[]')
+         FROM core_account
+         WHERE user_id = u.id AND active AND type IN ('REGULAR', 'SAVINGS')
+        ) AS accounts,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'goal_name', goal_name, 'target', target,
+                    'due_date', due_date)
+                    ORDER BY due_date), '[]')
+         FROM core_goal WHERE user_id = u.id AND active) AS goals,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'budget_name', budget_name,
+                    'total_limit', total_limit,
+                    'priority_level_int', priority_level_int)
+                    ORDER BY priority_level_int DESC), '[]')
+         FROM core_budget WHERE user_id = u.id AND active) AS budgets,
+        s.current_month_spent,
+        s.historical_total,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'budget__budget_name', budget_name, 'total', total)
+                    ORDER BY total DESC), '[]')
+         FROM categories) AS top_categories,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'description', description, 'total', total)
+                    ORDER BY total DESC), '[]')
+         FROM stores) AS top_stores
+    FROM auth_user u
+    LEFT JOIN core_profile p ON p.user_id = u.id
+    CROSS JOIN spend s
+    WHERE u.id = %(user_id)s
+"""
+
+
+def fetch_user_summary_data(user_id: int, months_back: int = 3) -> Optional[dict]:
+    """
+    Fetch everything the user summary needs in a single statement.
+
+    Equivalent to fetch_user_profile, fetch_income_total, fetch_user_accounts,
+    fetch_active_goals, fetch_active_budgets and fetch_spending_stats, but the
+    transaction window is scanned once (FILTER clauses and CTEs) and the whole
+    dataset comes back in one round trip.
+
+    Returns:
+        dict with profile, income, accounts, goals, budgets and spending_stats
+        (shaped like the individual fetchers), or None if the user is missing.
+    """
+    month_start, period_start, today = spending_period(months_back)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            USER_SUMMARY_SQL,
+            {
+                "user_id": user_id,
+                "month_start": month_start,
+                "period_start": period_start,
+                "today": today,
+            },
+        )
+        rows = dictfetchall(cursor)
+
+    if not rows:
+        return None
+    row = rows[0]
+
+    historical_total = row["historical_total"]
+    return {
+        "profile": {
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "job_title": row["job_title"],
+            "employment_status": row["employment_status"],
+        },
+        "income": row["income"],
+        "accounts": row["accounts"],
+        "goals": row["goals"],
+        "budgets": row["budgets"],
+        "spending_stats": {
+            "monthly_average": (
+                historical_total / Decimal(months_back)
+                if months_back > 0
+                else Decimal("0.00")
+            ),
+            "current_month_spent": row["current_month_spent"],
+            "historical_total": historical_total,
+            "months_back": months_back,
+            "top_categories": row["top_categories"],
+            "top_stores": row["top_stores"],
+        },
+    }
+
+
 # =============================================================================
 # Formatting Functions
 # =============================================================================
@@ -352,11 +481,30 @@ def format_user_summary(
 # =============================================================================
 
 
+def build_user_summary(user_id: int) -> str:
+    """
+    Run the summary queries and format the result (uncached).
+
+    Args:
+        user_id: The user's ID.
+
+    Returns:
+        A formatted summary string.
+    """
+    data = fetch_user_summary_data(user_id, months_back=3)
+    if not data:
+        return f"User {user_id} (no profile found)."
+
+    return format_user_summary(user_id=user_id, **data)
+
+
 def get_user_summary(user_id: int) -> str:
     """
     Fetch a brief user summary string tuned for goal-making/budgeting.
 
     Includes profile, income, active goals, active budgets, and recent spending.
+    The snapshot is cached per user data version (and day, since spending
+    windows are date-relative), so repeated maker turns cost one lookup.
 
     Args:
         user_id: The user's ID.
@@ -365,26 +513,11 @@ def get_user_summary(user_id: int) -> str:
         A formatted summary string, or an error message if something fails.
     """
     try:
-        # Fetch all data
-        profile = fetch_user_profile(user_id)
-        if not profile:
-            return f"User {user_id} (no profile found)."
-
-        income = fetch_income_total(user_id)
-        accounts = fetch_user_accounts(user_id)
-        goals = fetch_active_goals(user_id)
-        budgets = fetch_active_budgets(user_id)
-        spending_stats = fetch_spending_stats(user_id, months_back=3)
-
-        # Format and return
-        return format_user_summary(
-            user_id=user_id,
-            profile=profile,
-            income=income,
-            accounts=accounts,
-            goals=goals,
-            budgets=budgets,
-            spending_stats=spending_stats,
+        return versioned_get_or_set(
+            "user_summary",
+            user_id,
+            lambda: build_user_summary(user_id),
+            key_parts=(timezone.now().date().isoformat(),),
         )
 
     except Exception as exc:
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 from ninja import Schema
 
+from features.crud.analytics.schemas import OverspendResponseSchema
+
 
 class DashboardBudgetSchema(Schema):
     id: int
@@ -26,3 +28,9 @@ class DashboardSummarySchema(Schema):
     total_budgeted_amount: float
     budget_allocation_percentage: float
     total_assets: float
+
+
+class DashboardOverviewSchema(Schema):
+    summary: DashboardSummarySchema
+    budgets: List[DashboardBudgetSchema]
+    overspend: OverspendResponseSchema
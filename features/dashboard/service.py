@@ -0,0 +1,188 @@
+"""
+Dashboard data.
+
+Every home-screen figure (income, month spend, budget progress, accounts) is
+computed by one SQL statement in `fetch_overview`. The /dashboard/summary,
+/dashboard/budgets, /dashboard/overview and /database/analytic/overspend
+endpoints are projections of its result.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+from django.db import connection
+
+from core.models import Account
+from core.utils.database import dictfetchall
+from features.crud.budgets.service import month_start
+
+
+OVERVIEW_SQL = """
+    WITH budgets AS (
+        SELECT b.id, b.budget_name, b.description, b.total_limit,
+               b.priority_level_int, b.color, b.icon,
+               COALESCE(r.spent, 0) AS spent
+        FROM core_budget b
+        LEFT JOIN core_budgetmonthlyspend r
+            ON r.budget_id = b.id AND r.month = %(month_start)s
+        WHERE b.user_id = %(user_id)s AND b.active
+    ),
+    income AS (
+        SELECT COALESCE(SUM(amount) FILTER (WHERE active), 0) AS active_total,
+               COALESCE(SUM(amount), 0) AS total
+        FROM core_income
+        WHERE user_id = %(user_id)s
+    ),
+    spend AS (
+        SELECT COALESCE(SUM(amount), 0) AS month_spent
+        FROM core_transaction
+        WHERE user_id = %(user_id)s AND active
+          AND transaction_type = 'EXPENSE' AND date >= %(month_start)s
+    )
+    SELECT
+        i.active_total AS active_income,
+        i.total AS all_income,
+        s.month_spent,
+        (SELECT COALESCE(SUM(total_limit), 0) FROM budgets) AS budgeted_total,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'name', budget_name, 'description', description,
+                    'limit', total_limit, 'priority', priority_level_int,
+                    'color', color, 'icon', icon, 'spent', spent)
+                    ORDER BY priority_level_int DESC, id), '[]')
+         FROM budgets) AS budgets,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'name', name, 'type', type, 'balance', balance)
+                    ORDER BY id), '[]')
+         FROM core_account
+         WHERE user_id = %(user_id)s AND active) AS accounts
+    FROM income i
+    CROSS JOIN spend s
+"""
+
+
+def fetch_overview(user_id: int, today: date) -> Dict[str, Any]:
+    """
+    Compute the raw dashboard dataset in one round trip.
+
+    Returns:
+        dict with active_income, all_income, month_spent, budgeted_total
+        (Decimals), budgets (list with this month's rollup spend) and accounts.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            OVERVIEW_SQL, {"user_id": user_id, "month_start": month_start(today)}
+        )
+        return dictfetchall(cursor)[0]
+
+
+# =============================================================================
+# Projections
+# =============================================================================
+
+
+def project_budgets(overview: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Budget progress rows (DashboardBudgetSchema)."""
+    results = []
+    for b in overview["budgets"]:
+        limit = float(b["limit"])
+        spent = float(b["spent"])
+        percentage_used = (spent / limit * 100) if limit > 0 else 0.0
+        results.append(
+            {
+                "id": b["id"],
+                "name": b["name"],
+                "limit": limit,
+                "spent": spent,
+                "remaining": max(0, limit - spent),
+                "percentage_used": round(percentage_used, 1),
+                "priority": b["priority"],
+                "color": b["color"],
+                "icon": b["icon"],
+                "description": b["description"],
+            }
+        )
+    return results
+
+
+def project_summary(overview: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """Net position for the current month (DashboardSummarySchema)."""
+    total_income = float(overview["active_income"])
+    total_spent = float(overview["month_spent"])
+    total_budgeted_amount = float(overview["budgeted_total"])
+    total_assets = sum(float(a["balance"]) for a in overview["accounts"])
+
+    day_of_month = now.day
+    daily_average_spend = (total_spent / day_of_month) if day_of_month > 0 else 0.0
+    spend_percentage = (total_spent / total_income * 100) if total_income > 0 else 0.0
+    budget_allocation_percentage = (
+        (total_budgeted_amount / total_income * 100) if total_income > 0 else 0.0
+    )
+
+    return {
+        "total_income": total_income,
+        "total_spent": total_spent,
+        "net_position": total_income - total_spent,
+        "is_deficit": total_spent > total_income,
+        "month_label": now.strftime("%B %Y"),  # e.g. "October 2025"
+        "daily_average_spend": round(daily_average_spend, 2),
+        "spend_percentage": round(spend_percentage, 1),
+        "total_budgeted_amount": total_budgeted_amount,
+        "budget_allocation_percentage": round(budget_allocation_percentage, 1),
+        "total_assets": total_assets,
+    }
+
+
+def project_overspend(overview: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-budget overspend plus account breakdown (OverspendResponseSchema)."""
+    overspend_data = []
+    total_spent_all = 0.0
+    for b in overview["budgets"]:
+        spent = float(b["spent"])
+        limit_val = float(b["limit"])
+        total_spent_all += spent
+        pct = (spent / limit_val * 100) if limit_val > 0 else 0
+        overspend_data.append(
+            {
+                "budget_name": b["name"],
+                "spent": spent,
+                "total_limit": limit_val,
+                "pct_of_limit": round(pct, 2),
+                "is_overspent": pct > 100,
+            }
+        )
+
+    total_income = float(overview["all_income"])
+    total_assets = 0.0
+    total_liabilities = 0.0
+    total_regular = 0.0
+    total_savings = 0.0
+    account_breakdown = []
+
+    for acc in overview["accounts"]:
+        bal = float(acc["balance"])
+        account_breakdown.append(
+            {"id": acc["id"], "name": acc["name"], "type": acc["type"], "balance": bal}
+        )
+
+        if acc["type"] == Account.AccountType.SAVINGS:
+            total_savings += bal
+        else:
+            total_regular += bal
+
+        if bal >= 0:
+            total_assets += bal
+        else:
+            total_liabilities += abs(bal)
+
+    summary = {
+        "total_income": total_income,
+        "total_spent": total_spent_all,
+        "net_position": total_assets - total_liabilities,
+        "total_assets": total_assets,
+        "total_liabilities": total_liabilities,
+        "total_regular": total_regular,
+        "total_savings": total_savings,
+        "is_deficit": (total_spent_all > total_income),
+        "accounts": account_breakdown,
+    }
+    return {"data": overspend_data, "summary": summary}
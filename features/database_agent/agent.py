@@ -1,4 +1,4 @@
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import Field, BaseModel
 from core.utils.dynamic_db_schema import get_dynamic_schema
@@ -54,6 +54,6 @@ prompt = ChatPromptTemplate.from_messages(
     ]
 ).partial(schema=get_dynamic_schema())
 
-DatabaseAgent = prompt | gpt_oss_120b_digital_ocean.with_structured_output(
+DatabaseAgent = prompt | get_llm().with_structured_output(
     DatabaseAgentOutput
 )
@@ -1,11 +1,23 @@
 import asyncio
-from typing import TypedDict, List
+import time
+from typing import Optional, TypedDict, List
 
-from django.db import connection, close_old_connections
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
 from langgraph.graph import StateGraph, END, START
 
 from features.database_agent.agent import DatabaseAgent
-from core.utils.database import dictfetchall
+from features.database_agent.plan_cache import get_plan_cache
+from features.database_agent.result_cache import get_result_cache
+from core.utils.database import dictfetchall, thread_connection
+
+
+# Prefixes of the `data` text execute_single_query returns when a step fails
+DB_ERROR = "Database error: "
+EDIT_ERROR = "Error Executing Edit Query: "
+LLM_ERROR = "LLM Error: "
+FAILURE_PREFIXES = (DB_ERROR, EDIT_ERROR, LLM_ERROR)
 
 
 def _prepare_select_sql(query: str, *, limit: int = 100) -> str:
@@ -18,18 +30,63 @@ def _prepare_select_sql(query: str, *, limit: int = 100) -> str:
     return cleaned
 
 
-def _execute_select_query(query: str) -> List[dict]:
-    # Ensure fresh connection in this thread
-    close_old_connections()
+def _execute_select_query(
+    query: str, params: Optional[dict] = None, user_id: object = None
+) -> List[dict]:
+    """Run a SELECT; with `user_id`, repeats on unchanged data come from the result cache."""
     normalized_query = _prepare_select_sql(query)
-    with connection.cursor() as cursor:
-        cursor.execute(normalized_query)
-        return dictfetchall(cursor)
+
+    def run() -> List[dict]:
+        with connection.cursor() as cursor:
+            cursor.execute(normalized_query, params)
+            return dictfetchall(cursor)
+
+    with thread_connection():
+        if user_id is None or not settings.QUERY_RESULT_CACHE:
+            return run()
+        return get_result_cache().fetch(normalized_query, params, user_id, run)
+
+
+def _in_thread_db(func, *args):
+    """Run an ORM call from the event loop on a pooled thread connection."""
+
+    def run():
+        with thread_connection():
+            return func(*args)
+
+    return asyncio.to_thread(run)
+
+
+async def _run_cached_plan(request: str, user_id: object) -> Optional[dict]:
+    """Result of the cached SQL plan for `request`, or None to ask the LLM."""
+    if not settings.SQL_PLAN_CACHE:
+        return None
+    cache = get_plan_cache()
+    try:
+        found = await _in_thread_db(cache.lookup, request, user_id, timezone.localdate())
+    except Exception:
+        return None
+    if found is None:
+        return None
+    plan, params = found
+    try:
+        results = await asyncio.to_thread(
+            _execute_select_query, plan.sql_template, params, user_id
+        )
+    except Exception as e:
+        await _in_thread_db(cache.record, plan, False, str(e))
+        return None
+    await _in_thread_db(cache.record, plan, True)
+    return {
+        "step": request,
+        "query": plan.sql_template,
+        "data": results,
+        "edit": False,
+        "message": plan.message,
+    }
 
 
 def _execute_modify_query(query: str) -> str:
-    # Ensure fresh connection in this thread
-    close_old_connections()
     cleaned = (query or "").strip()
     # Normalize whitespace to single spaces for robust checking
     normalized = " ".join(cleaned.split()).upper()
@@ -38,10 +95,11 @@ def _execute_modify_query(query: str) -> str:
             "Security Restriction: Only INSERT queries for the 'transactions' table are allowed. "
             "UPDATE, DELETE, and other modifications are forbidden."
         )
-    with connection.cursor() as cursor:
-        cursor.execute(cleaned)
-        rows_affected = cursor.rowcount
-    connection.commit()
+    with thread_connection():
+        with connection.cursor() as cursor:
+            cursor.execute(cleaned)
+            rows_affected = cursor.rowcount
+        connection.commit()
     return f"Write operation successful. Rows affected: {rows_affected}"
 
 
@@ -55,12 +113,17 @@ class DatabaseAgentState(TypedDict):
 async def execute_single_query(request: str, user_id: object) -> dict:
     """
     Execute a single database query: LLM generation + API execution.
+    A request seen before reuses its cached SQL plan and skips the LLM.
     """
+    cached = await _run_cached_plan(request, user_id)
+    if cached is not None:
+        return cached
+
     try:
         # Generate SQL query using LLM
-        out = await asyncio.to_thread(
-            DatabaseAgent.invoke, {"request": request, "user_id": user_id}
-        )
+        started = time.perf_counter()
+        out = await DatabaseAgent.ainvoke({"request": request, "user_id": user_id})
+        llm_ms = (time.perf_counter() - started) * 1000
         query = out.query
         edit = out.edit
         message = getattr(out, "message", "")
@@ -72,7 +135,15 @@ async def execute_single_query(request: str, user_id: object) -> dict:
         if not edit:
             # SELECT query handled directly via Django connection
             try:
-                results = await asyncio.to_thread(_execute_select_query, query)
+                results = await asyncio.to_thread(_execute_select_query, query, None, user_id)
+                if settings.SQL_PLAN_CACHE:
+                    try:
+                        await _in_thread_db(
+                            get_plan_cache().store,
+                            request, query, message, user_id, timezone.localdate(), llm_ms,
+                        )
+                    except Exception:
+                        pass  # caching is best effort
                 # Append confirmation message if available
                 final_data = results
                 return {
@@ -86,7 +157,7 @@ async def execute_single_query(request: str, user_id: object) -> dict:
                 return {
                     "step": request,
                     "query": query,
-                    "data": f"Database error: {str(e)}",
+                    "data": f"{DB_ERROR}{str(e)}",
                     "edit": False,
                 }
         else:
@@ -104,7 +175,7 @@ async def execute_single_query(request: str, user_id: object) -> dict:
                 return {
                     "step": request,
                     "query": query,
-                    "data": f"Error Executing Edit Query: {str(e)}",
+                    "data": f"{EDIT_ERROR}{str(e)}",
                     "edit": True,
                 }
 
@@ -112,7 +183,7 @@ async def execute_single_query(request: str, user_id: object) -> dict:
         return {
             "step": request,
             "query": None,
-            "data": f"LLM Error: {str(e)}",
+            "data": f"{LLM_ERROR}{str(e)}",
             "edit": False,
         }
 
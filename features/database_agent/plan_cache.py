@@ -0,0 +1,286 @@
+"""
+Natural-language-to-SQL plan cache for the database agent.
+
+Many users send the same request text ("total spending for Food last month").
+After the LLM writes a SELECT for it, and the SELECT runs successfully, the
+SQL is stored as a template keyed on the normalised request text:
+
+- the requesting user's id becomes %(user_id)s;
+- date literals equal to a relative window of the request day (month start,
+  last month start, year start, ...) become named parameters, recomputed on
+  every hit, so "last month" keeps meaning last month.
+
+SQL that cannot be parameterised safely is not cached: another user's id,
+the user's id outside a user_id filter, a date or year that matches no
+single window and is not in the request text, or a date part compared to a
+number (EXTRACT(MONTH FROM date) = 9).
+
+A hit skips the LLM call. Entries keep validation stats (hits, successes,
+failures, last error). A plan that fails more often than it succeeds is
+dropped. Entries expire SQL_PLAN_CACHE_TTL seconds after creation. Each
+process keeps the SQL_PLAN_CACHE_SIZE most recently used plans in memory.
+The SqlPlan table keeps them across restarts, trimmed to
+SQL_PLAN_CACHE_MAX_ROWS by last use.
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import SqlPlan
+from core.utils.cache import get_cache_stats
+
+_WORDS = re.compile(r"[^\w%$.-]+")
+_DATE_LITERAL = re.compile(r"'(\d{4}-\d{2}-\d{2})'")
+_USER_FILTER = re.compile(r"(\buser_id\s*=\s*)'?(\d+)'?", re.IGNORECASE)
+# Literals pinning a query to the day it was written: any date or year that
+# is not a bound window, and date parts compared to numbers (month = 9)
+_DATE_LIKE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b|\b(?:19|20)\d{2}\b")
+_DATE_PART_LITERAL = re.compile(
+    r"\b(?:extract|date_part)\s*\([^)]*\)\s*(?:=|<|>|in\b|between\b)\s*\(?\s*'?\d",
+    re.IGNORECASE,
+)
+
+
+def normalize_request(text: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a request."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _WORDS.sub(" ", text).strip(" .")
+
+
+def plan_key(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def date_windows(today: date) -> Dict[str, date]:
+    """Relative dates an LLM writes as literals, by parameter name."""
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    last_month_start = (month_start - timedelta(days=1)).replace(day=1)
+    year_start = today.replace(month=1, day=1)
+    return {
+        "today": today,
+        "yesterday": today - timedelta(days=1),
+        "tomorrow": today + timedelta(days=1),
+        "days_7_ago": today - timedelta(days=7),
+        "days_30_ago": today - timedelta(days=30),
+        "days_90_ago": today - timedelta(days=90),
+        "month_start": month_start,
+        "month_end": next_month_start - timedelta(days=1),
+        "next_month_start": next_month_start,
+        "last_month_start": last_month_start,
+        "last_month_end": month_start - timedelta(days=1),
+        "year_start": year_start,
+        "year_end": year_start.replace(month=12, day=31),
+        "next_year_start": year_start.replace(year=today.year + 1),
+        "last_year_start": year_start.replace(year=today.year - 1),
+        "last_year_end": year_start - timedelta(days=1),
+    }
+
+
+def parameterize(
+    sql: str, request_text: str, user_id: Any, today: date
+) -> Optional[str]:
+    """`sql` as a template with %(user_id)s and date-window parameters, or None."""
+    user_id = str(user_id)
+    template = sql.replace("%", "%%")
+
+    filters = _USER_FILTER.findall(template)
+    if not filters or any(found != user_id for _, found in filters):
+        return None
+    template = _USER_FILTER.sub(lambda m: f"{m.group(1)}%(user_id)s", template)
+
+    by_date: Dict[str, list] = {}
+    for name, value in date_windows(today).items():
+        by_date.setdefault(value.isoformat(), []).append(name)
+
+    def bind(match: re.Match) -> str:
+        literal = match.group(1)
+        if literal in request_text:
+            return match.group(0)  # the user asked for this exact date
+        names = by_date.get(literal, [])
+        if len(names) != 1:
+            raise ValueError(literal)
+        return f"%({names[0]})s"
+
+    try:
+        template = _DATE_LITERAL.sub(bind, template)
+    except ValueError:
+        return None
+    if re.search(rf"\b{re.escape(user_id)}\b", _DATE_LIKE.sub("", template)):
+        return None  # the id is used some other way we cannot rebind
+    if _DATE_PART_LITERAL.search(template) or any(
+        literal not in request_text for literal in _DATE_LIKE.findall(template)
+    ):
+        return None
+    return template
+
+
+def bind_params(user_id: Any, today: date) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        name: value.isoformat() for name, value in date_windows(today).items()
+    }
+    params["user_id"] = int(user_id) if str(user_id).isdigit() else user_id
+    return params
+
+
+class CachedPlan(NamedTuple):
+    key: str
+    sql_template: str
+    message: str
+    llm_ms: float
+    created_at: Any
+
+
+class PlanCache:
+    """Process-local LRU in front of the SqlPlan table."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int, max_rows: int):
+        self.max_entries = max_entries
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_rows = max_rows
+        self.stats = get_cache_stats("sql_plan")
+        self.saved_llm_ms = 0.0
+        self._entries: "OrderedDict[str, CachedPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, plan: CachedPlan) -> None:
+        with self._lock:
+            self._entries[plan.key] = plan
+            self._entries.move_to_end(plan.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def lookup(
+        self, request: str, user_id: Any, today: date
+    ) -> Optional[Tuple[CachedPlan, Dict[str, Any]]]:
+        """(plan, bind params) for `request`, or None. Counts a hit or miss."""
+        key = plan_key(normalize_request(request))
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is not None:
+                self._entries.move_to_end(key)
+        if plan is None:
+            row = (
+                SqlPlan.objects.filter(key=key)
+                .values_list("sql_template", "message", "llm_ms", "created_at")
+                .first()
+            )
+            if row is not None:
+                plan = CachedPlan(key, *row)
+                self._remember(plan)
+
+        if plan is not None and timezone.now() - plan.created_at > self.ttl:
+            self.evict(key)
+            plan = None
+        self.stats.record(plan is not None)
+        if plan is None:
+            return None
+        return plan, bind_params(user_id, today)
+
+    def store(
+        self, request: str, sql: str, message: str, user_id: Any, today: date, llm_ms: float
+    ) -> bool:
+        """Cache a SELECT that just ran successfully; False if it cannot be parameterised."""
+        normalized = normalize_request(request)
+        template = parameterize(sql, request, user_id, today)
+        if not normalized or template is None:
+            return False
+        now = timezone.now()
+        key = plan_key(normalized)
+        SqlPlan.objects.update_or_create(
+            key=key,
+            defaults={
+                "request_text": normalized,
+                "sql_template": template,
+                "message": message or "",
+                "llm_ms": llm_ms,
+                "successes": 1,
+                "failures": 0,
+                "last_error": "",
+                "created_at": now,
+                "last_used_at": now,
+            },
+        )
+        self._remember(CachedPlan(key, template, message or "", llm_ms, now))
+        self.prune()
+        return True
+
+    def record(self, plan: CachedPlan, ok: bool, error: str = "") -> None:
+        """Validation outcome of running a cached plan; drops plans that mostly fail."""
+        if ok:
+            with self._lock:
+                self.saved_llm_ms += plan.llm_ms
+            SqlPlan.objects.filter(key=plan.key).update(
+                hits=F("hits") + 1, successes=F("successes") + 1, last_used_at=timezone.now()
+            )
+            return
+        SqlPlan.objects.filter(key=plan.key).update(
+            hits=F("hits") + 1, failures=F("failures") + 1, last_error=error[:1000]
+        )
+        SqlPlan.objects.filter(key=plan.key, failures__gt=F("successes")).delete()
+        self._forget(plan.key)
+
+    def evict(self, key: str) -> None:
+        self._forget(key)
+        SqlPlan.objects.filter(key=key).delete()
+
+    def prune(self) -> None:
+        """Delete expired rows and the least recently used beyond max_rows."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                DELETE FROM core_sqlplan
+                WHERE created_at < %s
+                   OR id IN (
+                       SELECT id FROM core_sqlplan
+                       ORDER BY last_used_at DESC
+                       OFFSET %s
+                   )
+                """,
+                [timezone.now() - self.ttl, self.max_rows],
+            )
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "in_memory": len(self._entries),
+            "saved_llm_ms": round(self.saved_llm_ms, 1),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self.saved_llm_ms = 0.0
+        self.stats.reset()
+
+
+_cache: Optional[PlanCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_plan_cache() -> PlanCache:
+    """The process-wide plan cache, configured from settings."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PlanCache(
+                    settings.SQL_PLAN_CACHE_SIZE,
+                    settings.SQL_PLAN_CACHE_TTL,
+                    settings.SQL_PLAN_CACHE_MAX_ROWS,
+                )
+    return _cache
@@ -0,0 +1,188 @@
+"""
+Per-user result cache for the database agent's SELECTs.
+
+A behaviour-analyst run, and consecutive turns of one conversation, often
+execute the same aggregate against data that has not changed. Results are
+cached per process under (normalised SQL, bind params, user_id, the user's
+data version, today's date):
+
+- any write to the user's transactions, budgets, goals, income, accounts or
+  profile bumps UserDataVersion (database triggers), so the next lookup
+  misses and the user's older entries are dropped;
+- the date covers CURRENT_DATE and the date-window parameters of cached
+  SQL plans.
+
+Only SQL that filters on user_id and reads nothing but versioned tables is
+cached; volatile functions (NOW(), random(), ...) are never cached. Entries
+are evicted least recently used first once their estimated size exceeds
+QUERY_RESULT_CACHE_BYTES.
+"""
+
+import hashlib
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from core.utils.cache import VERSIONED_TABLES, get_cache_stats, get_data_version
+
+_IDENTIFIER = re.compile(r"[a-z_][a-z0-9_]*")
+_USER_FILTER = re.compile(r"\buser_id\b", re.IGNORECASE)
+_VOLATILE = re.compile(
+    r"\b(now|current_time|current_timestamp|localtime|localtimestamp|clock_timestamp|"
+    r"statement_timestamp|transaction_timestamp|timeofday|random|gen_random_uuid|"
+    r"nextval|currval|setval)\b",
+    re.IGNORECASE,
+)
+
+_tables: Optional[FrozenSet[str]] = None
+
+
+def database_tables() -> FrozenSet[str]:
+    """Table and view names of the database (read once per process)."""
+    global _tables
+    if _tables is None:
+        _tables = frozenset(connection.introspection.table_names(include_views=True))
+    return _tables
+
+
+def normalize_sql(sql: str) -> str:
+    return " ".join(sql.split()).rstrip(";")
+
+
+def cacheable(sql: str) -> bool:
+    """Whether the result of `sql` depends only on versioned per-user data."""
+    if not _USER_FILTER.search(sql) or _VOLATILE.search(sql):
+        return False
+    tables = set(_IDENTIFIER.findall(sql.lower())) & database_tables()
+    return bool(tables) and tables <= VERSIONED_TABLES
+
+
+def result_key(
+    sql: str, params: Optional[dict], user_id: Any, version: int, today: date
+) -> str:
+    parts = (
+        str(user_id),
+        str(version),
+        today.isoformat(),
+        normalize_sql(sql),
+        repr(sorted((params or {}).items())),
+    )
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class _Entry(NamedTuple):
+    user_id: str
+    rows: List[dict]
+    size: int
+
+
+class ResultCache:
+    """Process-local LRU of query results, bounded by their estimated size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.stats = get_cache_stats("sql_result")
+        self.bytes = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        keys = self._by_user.get(entry.user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry.user_id]
+                self._versions.pop(entry.user_id, None)
+
+    def _see_version(self, user_id: str, version: int) -> None:
+        """Drop the user's entries once a newer data version shows up."""
+        if self._versions.get(user_id, version) < version:
+            for key in list(self._by_user.get(user_id, ())):
+                self._pop(key)
+
+    def get(self, key: str, user_id: Any, version: int) -> Optional[List[dict]]:
+        user_id = str(user_id)
+        with self._lock:
+            self._see_version(user_id, version)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        # Copies, so callers cannot change the cached rows
+        return [dict(row) for row in entry.rows]
+
+    def put(self, key: str, user_id: Any, version: int, rows: List[dict]) -> bool:
+        """Cache `rows`; False when they alone would take over a quarter of the budget."""
+        size = len(pickle.dumps(rows, pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes // 4:
+            return False
+        user_id = str(user_id)
+        with self._lock:
+            self._see_version(user_id, version)
+            if self._versions.get(user_id, version) > version:
+                return False  # a newer version was seen while this query ran
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = _Entry(user_id, [dict(row) for row in rows], size)
+            self._by_user.setdefault(user_id, set()).add(key)
+            self._versions[user_id] = version
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+        return True
+
+    def fetch(
+        self, sql: str, params: Optional[dict], user_id: Any, run: Callable[[], List[dict]]
+    ) -> List[dict]:
+        """Cached result of `sql` for the user's current data, else `run()`."""
+        if not cacheable(sql):
+            return run()
+        version = get_data_version(user_id)
+        key = result_key(sql, params, user_id, version, timezone.localdate())
+        rows = self.get(key, user_id, version)
+        self.stats.record(rows is not None)
+        if rows is None:
+            rows = run()
+            self.put(key, user_id, version, rows)
+        return rows
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            **self.stats.as_dict(),
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+            self._versions.clear()
+            self.bytes = 0
+        self.stats.reset()
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """The process-wide result cache, sized from settings."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResultCache(settings.QUERY_RESULT_CACHE_BYTES)
+    return _cache
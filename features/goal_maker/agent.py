@@ -1,4 +1,4 @@
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import Field, BaseModel
 from typing import Literal
@@ -176,4 +176,4 @@ def parse_output(message: BaseMessage | str) -> Goal_maker | None:
         print(f"Raw Output: {text}")
         return None
 
-Goal_maker_agent = prompt | gpt_oss_120b_digital_ocean | parse_output
+Goal_maker_agent = prompt | get_llm() | parse_output
@@ -8,7 +8,7 @@ from asgiref.sync import sync_to_async
 from ninja import Router
 from django.db import transaction
 
-from features.goal_maker.agent import Goal_maker_agent
+from features.agent_registry import aget_agent
 from features.orchestrator.schemas import (
     GoalMakerRequestSchema,
     GoalMakerResponseSchema,
@@ -17,6 +17,7 @@ from features.crud.users.service import get_user_summary
 from features.crud.conversations.service import (
     get_conversation_summary,
     insert_chat_message,
+    schedule_summary_fold,
 )
 from core.models import ChatConversation
 
@@ -50,7 +51,8 @@ async def goals_assist(request, payload: GoalMakerRequestSchema):
 
     # 2. Invoke Agent using native async (.ainvoke)
     try:
-        goal_result = await Goal_maker_agent.ainvoke(
+        agent = await aget_agent("goal_maker")
+        goal_result = await agent.ainvoke(
             {
                 "user_info": user_summary,
                 "user_request": user_request,
@@ -125,6 +127,7 @@ async def goals_assist(request, payload: GoalMakerRequestSchema):
             logger.exception("Failed to store GoalMaker interaction")
 
     await store_interaction()
+    schedule_summary_fold(conversation_id)
 
     return {
         "conversation_id": conversation_id,
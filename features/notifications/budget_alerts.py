@@ -0,0 +1,126 @@
+"""Budget threshold alerts.
+
+Evaluated incrementally from the monthly spend rollup (see
+features.crud.budgets.service): each expense write hands over the budget's new
+month total and the last threshold already notified, so checking a write is
+O(1) regardless of how much history the budget has.
+
+There is no Transaction signal behind this: expense writes must go through
+record_expense_change, and limit edits through recheck_budget_alerts.
+"""
+
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.models import Budget, BudgetMonthlySpend, Notification
+
+logger = logging.getLogger(__name__)
+
+# Warning thresholds
+WARNING_THRESHOLD = Decimal('0.80')  # 80%
+EXCEEDED_THRESHOLD = Decimal('1.00')  # 100%
+
+# Alert levels stored on BudgetMonthlySpend.alert_level
+LEVEL_NONE = 0
+LEVEL_WARNING = 80
+LEVEL_EXCEEDED = 100
+
+
+def threshold_level(spent: Decimal, limit: Decimal) -> int:
+    """Return the alert level reached by `spent` against `limit`."""
+    if limit <= 0:
+        return LEVEL_NONE
+    ratio = spent / limit
+    if ratio >= EXCEEDED_THRESHOLD:
+        return LEVEL_EXCEEDED
+    if ratio >= WARNING_THRESHOLD:
+        return LEVEL_WARNING
+    return LEVEL_NONE
+
+
+def check_budget_limit(
+    budget_id: int,
+    month: date,
+    spent: Optional[Decimal] = None,
+    alert_level: Optional[int] = None,
+) -> int:
+    """
+    Evaluate a budget's month against the 80%/100% thresholds.
+
+    - Warns when spending crosses 80% (early warning)
+    - Alerts when spending crosses 100% of the limit
+
+    Notifications fire only on an upward crossing of the last level recorded
+    for the month; dropping back below a threshold re-arms it. Pass `spent`
+    and `alert_level` when the caller already holds the rollup row (the
+    expense write path); otherwise they are read from the rollup.
+
+    Returns:
+        The month's new alert level.
+    """
+    try:
+        # Savepoint: a failed alert must not roll back the expense write
+        with transaction.atomic():
+            if spent is None or alert_level is None:
+                row = (
+                    BudgetMonthlySpend.objects.select_for_update()
+                    .filter(budget_id=budget_id, month=month)
+                    .values("spent", "alert_level")
+                    .first()
+                )
+                if not row:
+                    return LEVEL_NONE
+                spent, alert_level = row["spent"], row["alert_level"]
+
+            budget = (
+                Budget.objects.filter(id=budget_id)
+                .values("user_id", "budget_name", "total_limit")
+                .first()
+            )
+            if not budget:
+                return alert_level
+
+            budget_limit = Decimal(str(budget["total_limit"]))
+            level = threshold_level(spent, budget_limit)
+            if level == alert_level:
+                return level
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "UPDATE core_budgetmonthlyspend SET alert_level = %s "
+                    "WHERE budget_id = %s AND month = %s",
+                    [level, budget_id, month],
+                )
+
+            # Only alert on upward crossings for the month in progress
+            if level < alert_level or month != timezone.now().date().replace(day=1):
+                return level
+
+            if level == LEVEL_EXCEEDED:
+                Notification.objects.create(
+                    user_id=budget["user_id"],
+                    title="Budget Limit Exceeded",
+                    message=f"Your '{budget['budget_name']}' budget has exceeded its limit! Spent: {spent:.2f} / Limit: {budget_limit:.2f}",
+                    notification_type="budget_alert"
+                )
+                logger.info(f"Created budget EXCEEDED notification for user {budget['user_id']} on budget {budget_id}")
+            else:
+                percentage = int(spent / budget_limit * 100)
+                Notification.objects.create(
+                    user_id=budget["user_id"],
+                    title="Budget Warning",
+                    message=f"You've used {percentage}% of your '{budget['budget_name']}' budget. Spent: {spent:.2f} / Limit: {budget_limit:.2f}",
+                    notification_type="budget_warning"
+                )
+                logger.info(f"Created budget WARNING notification for user {budget['user_id']} on budget {budget_id} at {percentage}%")
+
+            return level
+
+    except Exception as e:
+        logger.error(f"Error in check_budget_limit: {e}")
+        return alert_level or LEVEL_NONE
@@ -12,15 +12,22 @@ from features.orchestrator.schemas import (
     AnalysisRequestSchema,
     AnalysisResponseSchema,
 )
-from features.crud.conversations.service import insert_chat_message
+from features.crud.conversations.service import insert_chat_message, schedule_summary_fold
 from core.models import ChatConversation
-from features.orchestrator.graph import main_orchestrator_graph
+from core.utils.cache import all_cache_stats
+from features.orchestrator.speculation import speculation_stats
+from features.database_agent.plan_cache import get_plan_cache
+from features.database_agent.result_cache import get_result_cache
+from features.warmup import run_warmup, warmup_report
+from features.agent_registry import aget_agent
 from asgiref.sync import sync_to_async
 
 from features.auth.api import AuthBearer
 
 logger = logging.getLogger(__name__)
 router = Router(auth=AuthBearer())
+# LLM routes; only mounted on workers with ENABLE_AGENTS (see config/api.py)
+analysis_router = Router(auth=AuthBearer())
 
 
 def _store_messages_sync(
@@ -81,7 +88,7 @@ def _store_messages_sync(
         return False
 
 
-@router.post("/analyze", response=AnalysisResponseSchema)
+@analysis_router.post("/analyze", response=AnalysisResponseSchema)
 async def analyze(request, payload: AnalysisRequestSchema):
     """
     Primary endpoint: Analyze a user request via LangGraph agents.
@@ -106,7 +113,8 @@ async def analyze(request, payload: AnalysisRequestSchema):
 
     try:
         # 2. Invoke Graph
-        result = await main_orchestrator_graph.ainvoke(initial_state)
+        agent = await aget_agent("orchestrator")
+        result = await agent.ainvoke(initial_state)
 
         # 3. Extract Results
         final_output = result.get("final_output", "No response generated.")
@@ -121,6 +129,7 @@ async def analyze(request, payload: AnalysisRequestSchema):
                 data=data,
                 agents_used=result.get("agents_used"),
             )
+            schedule_summary_fold(payload.conversation_id)
 
         return {
             "final_output": final_output,
@@ -141,3 +150,27 @@ async def analyze(request, payload: AnalysisRequestSchema):
 async def health(request):
     """Health check endpoint."""
     return {"status": "healthy", "service": "PersonalAssistantAPI"}
+
+
+@router.get("/cache-stats")
+async def cache_stats(request):
+    """Hit/miss counters of the caches, SQL plans and results, and speculative runs (this worker)."""
+    return {
+        "caches": all_cache_stats(),
+        "speculation": speculation_stats(),
+        "sql_plans": get_plan_cache().report(),
+        "sql_results": get_result_cache().report(),
+    }
+
+
+@router.get("/ready", auth=None, response={200: dict, 503: dict})
+async def ready(request):
+    """
+    Readiness probe: 200 once this worker is warmed up (DB pool open, agents
+    and prompts loaded), 503 otherwise. Runs the warm-up if it has not
+    completed yet, and reports per-step timings.
+    """
+    report = warmup_report()
+    if not report["ready"]:
+        report = await sync_to_async(run_warmup)()
+    return (200 if report["ready"] else 503), report
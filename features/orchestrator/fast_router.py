@@ -0,0 +1,269 @@
+"""
+Fast-path router ahead of the LLM routing call.
+
+Greetings, thanks and obvious data or analysis questions do not need a
+GPT-OSS-120B call to pick an agent. `fast_route` tries, in order:
+
+1. Keyword/regex rules (match_rules).
+2. Optionally, a small naive Bayes classifier trained on logged routing
+   decisions (settings.FAST_ROUTER_MODEL, written by `train_fast_router`).
+
+It returns a decision only when confident; otherwise the orchestrator falls
+back to the LLM router. Hits and misses are counted in the "fast_router"
+cache stats (GET /personal_assistant/cache-stats).
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from core.utils.cache import get_cache_stats
+
+DATABASE_AGENT = "database_agent"
+BEHAVIOUR_ANALYST = "behaviour_analyst"
+PERSONAL_ASSISTANT = "personal_assistant_response"
+AGENTS = (DATABASE_AGENT, BEHAVIOUR_ANALYST, PERSONAL_ASSISTANT)
+
+# Confidence given to a rule hit (rules only fire on unambiguous messages)
+RULE_CONFIDENCE = 0.99
+# Confidence of the weakest signal: a data word, and no write or analysis word
+KEYWORD_CONFIDENCE = 0.6
+
+# Instruction passed on to the chosen agent, as the LLM router would write it
+ROUTING_MESSAGES = {
+    DATABASE_AGENT: (
+        "Answer the user's request from their data: {message}. "
+        "Do NOT return internal IDs (e.g., id, budget_id, user_id). "
+        "Select only human-readable columns (e.g., budget_name, date, amount, description)."
+    ),
+    BEHAVIOUR_ANALYST: (
+        "Analyze the user's request: {message}. Explain the reasons and give "
+        "recommendations. If critical info is missing, ask ONE clarification question."
+    ),
+    PERSONAL_ASSISTANT: "Respond briefly and helpfully to the user's message: {message}",
+}
+
+_SMALL_TALK = re.compile(
+    r"^\s*(hi|hello|hey|hiya|yo|salam|good (morning|afternoon|evening|night)|"
+    r"thanks?( you)?( so much| a lot)?|thank you( so much| very much)?|thx|ty|"
+    r"bye|goodbye|see you|ok(ay)?|cool|great|nice|awesome|perfect|got it|"
+    r"who are you|what can you do|help)\b[\s!.?,:)]*$",
+    re.IGNORECASE,
+)
+_ANALYSIS = re.compile(
+    r"\b(why|trends?|patterns?|compare[sd]?|comparison|versus|vs\.?|recommend\w*|"
+    r"advice|advise|improve|overspend\w*|insights?|habits?|save more|cut back)\b",
+    re.IGNORECASE,
+)
+_LOOKUP = re.compile(
+    r"^\s*(how much|how many|what('s| is| was| are| were)? (my|the) |show( me)?|list|"
+    r"give me|what did i (spend|earn)|total)\b",
+    re.IGNORECASE,
+)
+_DATA_NOUN = re.compile(
+    r"\b(spen[dt]\w*|transactions?|balances?|income|earn\w*|budgets?|expenses?|"
+    r"deposits?|accounts?|goals?|paid|cost)\b",
+    re.IGNORECASE,
+)
+_WRITE = re.compile(
+    r"\b(add|create|delete|remove|update|change|edit|set up|record)\b", re.IGNORECASE
+)
+
+
+class FastRoute(NamedTuple):
+    agent: str
+    message: str
+    confidence: float
+    source: str  # "rule", "model" or "keywords"
+
+
+def match_rules(text: str) -> Optional[str]:
+    """Agent chosen by the keyword rules, or None when they do not apply cleanly."""
+    if _SMALL_TALK.match(text):
+        return PERSONAL_ASSISTANT
+    if _WRITE.search(text):
+        return None
+    analysis = bool(_ANALYSIS.search(text))
+    lookup = bool(_LOOKUP.search(text)) and bool(_DATA_NOUN.search(text))
+    if analysis and not lookup:
+        return BEHAVIOUR_ANALYST
+    if lookup and not analysis:
+        return DATABASE_AGENT
+    return None
+
+
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+def tokenize(text: str) -> List[str]:
+    words = _TOKEN.findall(text.lower())
+    return words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+
+
+class NaiveBayesRouter:
+    """Multinomial naive Bayes over word unigrams and bigrams (Laplace smoothing)."""
+
+    def __init__(self):
+        self.docs: Dict[str, int] = {}
+        self.counts: Dict[str, Counter] = {}
+
+    def fit(self, samples: Iterable[Tuple[str, str]]) -> "NaiveBayesRouter":
+        for text, agent in samples:
+            self.docs[agent] = self.docs.get(agent, 0) + 1
+            self.counts.setdefault(agent, Counter()).update(tokenize(text))
+        self._prepare()
+        return self
+
+    def _prepare(self) -> None:
+        self._vocab = len(set().union(*self.counts.values())) if self.counts else 0
+        self._totals = {agent: sum(c.values()) for agent, c in self.counts.items()}
+        total_docs = sum(self.docs.values())
+        self._priors = {agent: math.log(n / total_docs) for agent, n in self.docs.items()}
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """(agent, posterior probability); (None, 0.0) for an untrained model."""
+        if not self.docs:
+            return None, 0.0
+        tokens = tokenize(text)
+        scores = {}
+        for agent, counts in self.counts.items():
+            denominator = self._totals[agent] + self._vocab
+            scores[agent] = self._priors[agent] + sum(
+                math.log((counts[token] + 1) / denominator) for token in tokens
+            )
+        best = max(scores, key=scores.get)
+        norm = sum(math.exp(s - scores[best]) for s in scores.values())
+        return best, 1.0 / norm
+
+    def to_dict(self) -> dict:
+        return {"docs": self.docs, "counts": {a: dict(c) for a, c in self.counts.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NaiveBayesRouter":
+        model = cls()
+        model.docs = dict(data["docs"])
+        model.counts = {agent: Counter(c) for agent, c in data["counts"].items()}
+        model._prepare()
+        return model
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle)
+
+    @classmethod
+    def load(cls, path: str) -> "NaiveBayesRouter":
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+_model: Optional[NaiveBayesRouter] = None
+_model_path: Optional[str] = None
+_model_lock = threading.Lock()
+
+
+def get_model() -> Optional[NaiveBayesRouter]:
+    """The classifier at settings.FAST_ROUTER_MODEL (loaded once), or None."""
+    global _model, _model_path
+    path = settings.FAST_ROUTER_MODEL
+    if not path:
+        return None
+    if _model_path != path:
+        with _model_lock:
+            if _model_path != path:
+                try:
+                    _model = NaiveBayesRouter.load(path)
+                except FileNotFoundError:
+                    _model = None
+                _model_path = path
+    return _model
+
+
+def best_guess(
+    text: str, model: Optional[NaiveBayesRouter] = None
+) -> Tuple[Optional[str], float, str]:
+    """(agent, confidence, source) from rules, then `model`, then bare keywords."""
+    agent = match_rules(text)
+    if agent is not None:
+        return agent, RULE_CONFIDENCE, "rule"
+    if model is not None:
+        agent, confidence = model.predict(text)
+        if agent in AGENTS:
+            return agent, confidence, "model"
+    if _DATA_NOUN.search(text) and not (_WRITE.search(text) or _ANALYSIS.search(text)):
+        return DATABASE_AGENT, KEYWORD_CONFIDENCE, "keywords"
+    return None, 0.0, ""
+
+
+def classify(
+    text: str, model: Optional[NaiveBayesRouter] = None, min_confidence: float = 0.0
+) -> Optional[FastRoute]:
+    """best_guess if it is a rule hit or at least `min_confidence` sure, else None."""
+    agent, confidence, source = best_guess(text, model)
+    if agent is None or (source != "rule" and confidence < min_confidence):
+        return None
+    return FastRoute(agent, ROUTING_MESSAGES[agent].format(message=text), confidence, source)
+
+
+def fast_route(text: str) -> Optional[FastRoute]:
+    """Confident routing decision for `text`, or None to ask the LLM router."""
+    if not settings.FAST_ROUTER or not text.strip():
+        return None
+    route = classify(text, get_model(), settings.FAST_ROUTER_MIN_CONFIDENCE)
+    get_cache_stats("fast_router").record(route is not None)
+    return route
+
+
+def probably_data(text: str) -> bool:
+    """
+    Whether to start the database agent speculatively alongside the LLM
+    router: the best guess is database_agent with at least
+    SPECULATIVE_DB_MIN_CONFIDENCE, but fast_route was not sure enough.
+    """
+    if not settings.SPECULATIVE_DB or not text.strip():
+        return False
+    agent, confidence, _ = best_guess(text, get_model())
+    return agent == DATABASE_AGENT and confidence >= settings.SPECULATIVE_DB_MIN_CONFIDENCE
+
+
+# Assistant message label (orchestrator endpoints) -> routing decision
+SOURCE_AGENT_DECISIONS = {
+    "DatabaseAgent": DATABASE_AGENT,
+    "BehaviourAnalyst": BEHAVIOUR_ANALYST,
+    "PersonalAssistant": PERSONAL_ASSISTANT,
+}
+
+LOGGED_DECISIONS_SQL = """
+SELECT content, next_agent
+FROM (
+    SELECT id, sender_type, content,
+           LEAD(source_agent) OVER (PARTITION BY conversation_id ORDER BY id) AS next_agent
+    FROM core_chatmessage
+    WHERE content_type IS DISTINCT FROM 'json'
+) m
+WHERE sender_type = 'user' AND next_agent = ANY(%s)
+ORDER BY id DESC
+LIMIT %s
+"""
+
+
+def logged_routing_decisions(limit: int = 50_000) -> List[Tuple[str, str]]:
+    """
+    (user message, routing decision) pairs from stored conversations, newest
+    first. The decision is read off the agent label of the assistant reply.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(LOGGED_DECISIONS_SQL, [list(SOURCE_AGENT_DECISIONS), limit])
+        return [(text, SOURCE_AGENT_DECISIONS[label]) for text, label in cursor.fetchall()]
+
+
+def read_routing_dataset(path: str) -> List[Tuple[str, str]]:
+    """(message, agent) pairs from a JSON-lines file of {"message", "agent"} objects."""
+    with open(path, encoding="utf-8") as handle:
+        rows = [json.loads(line) for line in handle if line.strip()]
+    return [(row["message"], row["agent"]) for row in rows if row["agent"] in AGENTS]
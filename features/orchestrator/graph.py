@@ -8,15 +8,19 @@ PersonalAssistant orchestrates the flow:
 """
 
 import asyncio
-from typing import TypedDict
+from typing import Optional, TypedDict
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from langgraph.graph import StateGraph, END, START
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
-from features.database_agent.graph import database_agent_super_agent
+from features.database_agent.graph import FAILURE_PREFIXES, database_agent_super_agent
 from features.behaviour_analyst.graph import behaviour_analyst_super_agent
-from features.personal_assistant.agent import invoke_personal_assistant
-from features.crud.conversations.service import get_conversation_summary
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from features.personal_assistant.agent import ainvoke_personal_assistant
+from features.orchestrator.fast_router import ROUTING_MESSAGES, fast_route, probably_data
+from features.orchestrator.speculation import Speculation
+from features.crud.conversations.service import NO_MESSAGES, get_conversation_summary
+from core.llm_providers.registry import get_llm
 from langchain_core.messages import BaseMessage
 import json
 
@@ -55,6 +59,8 @@ class OrchestratorState(TypedDict):
     agents_used: (
         str  # Track which agent was called: 'database_agent', 'behaviour_analyst', etc.
     )
+    speculative_result: dict  # Database agent output computed alongside routing
+    db_edit: bool  # The database agent ran a write (its data is a status message)
 
 
 def parse_output(message: BaseMessage | str) -> RoutingDecision | None:
@@ -68,16 +74,57 @@ def parse_output(message: BaseMessage | str) -> RoutingDecision | None:
         print(f"Raw Output: {text}")
         return None
 
-def personal_assistant_orchestrator(state: OrchestratorState) -> dict:
+async def personal_assistant_orchestrator(state: OrchestratorState) -> dict:
     """PersonalAssistant uses LLM to decide routing and generate message."""
+    user_message = state.get("user_message", "")
+
+    # Obvious requests skip the LLM router (and the context it needs)
+    fast = fast_route(user_message)
+    if fast is not None:
+        return {"routing_decision": fast.agent, "routing_message": fast.message}
+
+    # Probable data lookups start the database agent while the router decides
+    speculation = None
+    speculative_message = ROUTING_MESSAGES["database_agent"].format(message=user_message)
+    if probably_data(user_message):
+        speculative_request = _database_request(user_message, speculative_message)
+        speculation = Speculation(_run_database_agent(state.get("user_id"), speculative_request))
+    try:
+        context = await _routing_context(state)
+        decision = await _route_with_llm(state, context)
+    except BaseException:
+        if speculation is not None:
+            speculation.cancel()
+        raise
+    if speculation is not None:
+        # The router's instruction resolves follow-ups ("and last month?") from
+        # history and budget IDs; the speculative one only has the raw message
+        use = decision["routing_decision"] == "database_agent" and (
+            decision["routing_message"] == speculative_message or not context["has_history"]
+        )
+        result = await speculation.settle(use, accept=_database_succeeded)
+        if result is not None:
+            decision["speculative_result"] = result
+    return decision
+
+
+def _database_succeeded(result: dict) -> bool:
+    data = result.get("result", {}).get("data")
+    return not (isinstance(data, str) and data.startswith(FAILURE_PREFIXES))
+
 
+async def _routing_context(state: OrchestratorState) -> dict:
+    """Active budgets and conversation memory the LLM router is prompted with."""
     conversation_id = state.get("conversation_id", "")
     user_id = state.get("user_id", "default")
-    user_name = state.get("user_name", "User")
 
     # Fetch active budgets directly
     try:
-        budgets = fetch_active_budgets(int(user_id)) if str(user_id).isdigit() else []
+        budgets = (
+            await sync_to_async(fetch_active_budgets)(int(user_id))
+            if str(user_id).isdigit()
+            else []
+        )
         if budgets:
             available_budgets = ", ".join(
                 [f"{b['budget_name']} (ID: {b['budget_id']})" for b in budgets]
@@ -89,13 +136,26 @@ def personal_assistant_orchestrator(state: OrchestratorState) -> dict:
 
     # 1. Fetch Memory Externally (Stateless Pattern)
     conversation_memory_str = (
-        get_conversation_summary(int(conversation_id))
+        await sync_to_async(get_conversation_summary)(int(conversation_id))
         if str(conversation_id).isdigit()
         else "No history."
     )
 
     print("conversation_memory_str", conversation_memory_str)
 
+    return {
+        "available_budgets": available_budgets,
+        "conversation_memory_str": conversation_memory_str,
+        "has_history": conversation_memory_str not in ("No history.", NO_MESSAGES),
+    }
+
+
+async def _route_with_llm(
+    state: OrchestratorState, context: Optional[dict] = None
+) -> dict:
+    """Ask the LLM router which agent handles the turn, and with what instruction."""
+    context = context or await _routing_context(state)
+    user_name = state.get("user_name", "User")
     user_message = state.get("user_message", "")
 
     # System prompt for routing decision
@@ -220,13 +280,13 @@ def personal_assistant_orchestrator(state: OrchestratorState) -> dict:
         [("system", system_prompt), ("human", user_prompt)]
     )
     formatted_prompt = {
-            "conversation_memory_str": conversation_memory_str,
-            "available_budgets": available_budgets,
+            "conversation_memory_str": context["conversation_memory_str"],
+            "available_budgets": context["available_budgets"],
             "user_message": user_message,
             "user_name": user_name,
     }
-    model = prompt_template | gpt_oss_120b_digital_ocean | parse_output
-    routing_output = model.invoke(formatted_prompt)
+    model = prompt_template | get_llm() | parse_output
+    routing_output = await model.ainvoke(formatted_prompt)
     if routing_output is None:
         return {
             "routing_decision": "personal_assistant_response",
@@ -239,11 +299,7 @@ def personal_assistant_orchestrator(state: OrchestratorState) -> dict:
     return {"routing_decision": agent, "routing_message": message}
 
 
-async def database_agent_node(state: OrchestratorState) -> dict:
-    """Execute Database Agent and return results asynchronously."""
-    routing_message = state.get("routing_message") or ""
-    user_message = state.get("user_message") or ""
-
+def _database_request(user_message: str, routing_message: str) -> str:
     # Feed the database agent a full request that always includes the user's ask.
     if routing_message and user_message:
         db_request = f"User ask: {user_message}\nInstruction: {routing_message}"
@@ -251,20 +307,32 @@ async def database_agent_node(state: OrchestratorState) -> dict:
         db_request = routing_message
     else:
         db_request = user_message
+    return db_request.strip()
+
+
+async def _run_database_agent(user_id, db_request: str) -> dict:
+    db_state = {"request": db_request, "user_id": user_id}
+    return await asyncio.wait_for(
+        database_agent_super_agent.ainvoke(db_state), timeout=20.0
+    )
+
+
+async def database_agent_node(state: OrchestratorState) -> dict:
+    """Execute Database Agent and return results asynchronously."""
+    routing_message = state.get("routing_message") or ""
+    user_message = state.get("user_message") or ""
 
-    db_state = {
-        "request": db_request.strip(),
-        "user_id": state.get("user_id"),
-    }
     try:
-        result = await asyncio.wait_for(
-            database_agent_super_agent.ainvoke(db_state), timeout=20.0
+        # Already computed when the run was started speculatively during routing
+        result = state.get("speculative_result") or await _run_database_agent(
+            state.get("user_id"), _database_request(user_message, routing_message)
         )
         agent_result = result.get("result", {})
         data = agent_result.get("data", [])
         edit = result.get("edit", False)
         return {
             "is_awaiting_data": not edit,
+            "db_edit": edit,
             "data": data,
             "routing_decision": "database_agent",
             "agents_used": "database_agent",
@@ -307,21 +375,72 @@ async def behaviour_analyst_node(state: OrchestratorState) -> dict:
     }
 
 
-def personal_assistant_response(state: OrchestratorState) -> dict:
+LOOKUP_FAILED = (
+    "I couldn't retrieve that data right now. Could you try rephrasing your request?"
+)
+EDIT_FAILED = "I couldn't make that change. Could you check the details and try again?"
+
+
+def templated_database_confirmation(state: OrchestratorState) -> dict:
+    """Database-agent turn reply without an LLM call (DB_CONFIRMATION_MODE="template")."""
+    data = state.get("data", [])
+    agents_used = state.get("agents_used", "")
+    if isinstance(data, str):
+        # Writes, failures and clarifications come back as text, not rows
+        if data.startswith(FAILURE_PREFIXES):
+            final_output = EDIT_FAILED if state.get("db_edit") else LOOKUP_FAILED
+        else:
+            final_output = data
+        return {
+            "final_output": final_output,
+            "data": [],
+            "has_data": False,
+            "agents_used": agents_used,
+        }
+    if not state.get("is_awaiting_data", False):
+        return {
+            "final_output": LOOKUP_FAILED,
+            "data": [],
+            "has_data": False,
+            "agents_used": agents_used,
+        }
+    if isinstance(data, list) and not data:
+        final_output = "I couldn't find any records matching your request."
+    elif isinstance(data, list):
+        final_output = (
+            "Here is what I found."
+            if len(data) == 1
+            else f"Here are the {len(data)} results I found."
+        )
+    else:
+        final_output = "Here are your results."
+    return {
+        "has_data": True,
+        "data": data,
+        "final_output": final_output,
+        "agents_used": agents_used,
+    }
+
+
+async def personal_assistant_response(state: OrchestratorState) -> dict:
     """PersonalAssistant generates final response using memory and context."""
 
     conversation_id = state.get("conversation_id", "")
     user_id = state.get("user_id", "default")
     user_name = state.get("user_name", "User")
 
+    routing_decision = state.get("routing_decision", "personal_assistant")
+    if routing_decision == "database_agent" and settings.DB_CONFIRMATION_MODE == "template":
+        # The table is the answer; skip the one-sentence confirmation LLM call
+        return templated_database_confirmation(state)
+
     # 1. Fetch Memory Externally
     conversation_memory_str = (
-        get_conversation_summary(int(conversation_id))
+        await sync_to_async(get_conversation_summary)(int(conversation_id))
         if str(conversation_id).isdigit()
         else "No history."
     )
 
-    routing_decision = state.get("routing_decision", "personal_assistant")
     routing_message = state.get("routing_message", "")
     is_awaiting_data = state.get("is_awaiting_data", False)
     agents_used = state.get("agents_used", "")  # Preserve agents_used from state
@@ -329,7 +448,7 @@ def personal_assistant_response(state: OrchestratorState) -> dict:
     if routing_decision == "database_agent":
         if is_awaiting_data:
             confirmation_prompt = f"The user ({state.get('user_name', 'User')}) asked: {state.get('user_message')}. Give a very brief one-sentence confirmation that you're showing them the results."
-            confirmation = invoke_personal_assistant(
+            confirmation = await ainvoke_personal_assistant(
                 confirmation_prompt,
                 conversation_history=conversation_memory_str,
                 context={
@@ -346,7 +465,7 @@ def personal_assistant_response(state: OrchestratorState) -> dict:
                 "agents_used": agents_used,  # Preserve agents_used
             }
         confirmation_prompt = f"The user ({state.get('user_name', 'User')}) asked: {state.get('user_message')}. Give a very brief one-sentence confirmation."
-        confirmation = invoke_personal_assistant(
+        confirmation = await ainvoke_personal_assistant(
             confirmation_prompt,
             conversation_history=conversation_memory_str,
             context={
@@ -370,15 +489,15 @@ def personal_assistant_response(state: OrchestratorState) -> dict:
             "routing_message": routing_message,
             "type": state.get("user_message"),
         }
-        response = invoke_personal_assistant(
+        response = await ainvoke_personal_assistant(
             state.get("user_message", ""),
             conversation_history=conversation_memory_str,
             context=context,
             user_id=user_id,
             user_name=user_name,
-        ).get("response", "no response")
+        )
         return {
-            "final_output": response,
+            "final_output": response.get("response", "no response"),
             "data": [],
             "has_data": False,
             "agents_used": agents_used,  # Preserve agents_used
@@ -390,7 +509,7 @@ def personal_assistant_response(state: OrchestratorState) -> dict:
         "type": state.get("user_message"),
     }
 
-    response = invoke_personal_assistant(
+    response = await ainvoke_personal_assistant(
         state.get("user_message", ""),
         conversation_history=conversation_memory_str,
         context=context,
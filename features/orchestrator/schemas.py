@@ -88,4 +88,6 @@ class TransactionMakerResponseSchema(Schema):
     time: Optional[str] = None
     city: Optional[str] = None
     neighbourhood: Optional[str] = None
+    # Id of an existing transaction this one appears to duplicate
+    duplicate_of: Optional[int] = None
     is_done: bool = False
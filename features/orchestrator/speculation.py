@@ -0,0 +1,93 @@
+"""
+Speculative database-agent runs.
+
+When the fast router thinks a turn is probably a data lookup but is not sure
+enough to skip the LLM router, the orchestrator starts the database agent at
+the same time as the routing call. If the router agrees (same agent, and an
+instruction the speculative one can stand in for), the result is ready (or
+partly done) when the graph reaches the database node. Otherwise the run is
+cancelled and its LLM call is wasted. The counters here weigh the
+wall-clock time saved against those wasted calls, per worker process.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+_lock = threading.Lock()
+_stats: Dict[str, float] = {
+    "started": 0,
+    "used": 0,
+    "discarded": 0,
+    "failed": 0,
+    "saved_ms": 0.0,
+    "wasted_llm_calls": 0,
+}
+
+
+def _record(**amounts: float) -> None:
+    with _lock:
+        for key, amount in amounts.items():
+            _stats[key] += amount
+
+
+def speculation_stats() -> Dict[str, Any]:
+    """Counters plus saved time per used run and wasted calls per started run."""
+    with _lock:
+        stats = dict(_stats)
+    stats["saved_ms"] = round(stats["saved_ms"], 1)
+    stats["avg_saved_ms"] = round(stats["saved_ms"] / stats["used"], 1) if stats["used"] else 0.0
+    stats["waste_rate"] = (
+        round(stats["wasted_llm_calls"] / stats["started"], 4) if stats["started"] else 0.0
+    )
+    return stats
+
+
+def reset_speculation_stats() -> None:
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
+
+
+async def _timed(work: Awaitable[Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = await work
+    return result, time.perf_counter() - start
+
+
+class Speculation:
+    """A database-agent run started before the routing decision is known."""
+
+    def __init__(self, work: Awaitable[Any]):
+        self.started = time.perf_counter()
+        self.task = asyncio.ensure_future(_timed(work))
+        _record(started=1)
+
+    def cancel(self) -> None:
+        self.task.cancel()
+
+    async def settle(
+        self, use: bool, accept: Optional[Callable[[Any], bool]] = None
+    ) -> Optional[Any]:
+        """
+        The run's result if `use` (the router agreed on the agent and its
+        instruction), else None (the run is cancelled). Also None if the run
+        failed or `accept` rejects its result; the caller then runs it again.
+        """
+        routing_s = time.perf_counter() - self.started
+        if not use:
+            self.cancel()
+            _record(discarded=1, wasted_llm_calls=1)
+            return None
+        try:
+            result, run_s = await self.task
+        except Exception:
+            _record(failed=1, wasted_llm_calls=1)
+            return None
+        if accept is not None and not accept(result):
+            _record(failed=1, wasted_llm_calls=1)
+            return None
+        # The overlap with the routing call is what the sequential graph would have waited
+        _record(used=1, saved_ms=min(routing_s, run_s) * 1000)
+        return result
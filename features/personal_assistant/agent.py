@@ -1,10 +1,10 @@
 """Personal Assistant General Chat Agent."""
 
 from langchain_core.prompts import ChatPromptTemplate
-from core.llm_providers.digital_ocean import gpt_oss_120b_digital_ocean
+from core.llm_providers.registry import get_llm
 
 
-def invoke_personal_assistant(
+async def ainvoke_personal_assistant(
     query: str,
     conversation_history: str = "",
     context: dict = None,
@@ -52,8 +52,8 @@ def invoke_personal_assistant(
     )
 
     try:
-        chain = prompt | gpt_oss_120b_digital_ocean
-        response = chain.invoke(
+        chain = prompt | get_llm()
+        response = await chain.ainvoke(
             {
                 "user_name": user_name,
                 "user_id": str(user_id) if user_id else "Unknown",
@@ -8,7 +8,7 @@ from asgiref.sync import sync_to_async
 from ninja import Router
 from django.db import transaction
 
-from features.transaction_maker.agent import Transaction_maker_agent
+from features.agent_registry import aget_agent
 from features.orchestrator.schemas import (
     TransactionMakerRequestSchema,
     TransactionMakerResponseSchema,
@@ -16,9 +16,12 @@ from features.orchestrator.schemas import (
 from features.crud.conversations.service import (
     get_conversation_summary,
     insert_chat_message,
+    schedule_summary_fold,
 )
 from features.crud.budgets.service import fetch_active_budgets
-from core.models import ChatConversation
+from features.crud.transactions.utils import find_duplicate
+from core.models import Account, ChatConversation
+from core.utils.fingerprint import transaction_fingerprint
 
 from features.auth.api import AuthBearer
 
@@ -56,7 +59,8 @@ async def transaction_assist(request, payload: TransactionMakerRequestSchema):
 
     # 2. Invoke Agent using native async (.ainvoke)
     try:
-        txn_result = await Transaction_maker_agent.ainvoke(
+        agent = await aget_agent("transaction_maker")
+        txn_result = await agent.ainvoke(
             {
                 "user_request": user_request,
                 "last_conversation": conversation_summary,
@@ -80,7 +84,36 @@ async def transaction_assist(request, payload: TransactionMakerRequestSchema):
             "is_done": True,
         }
 
-    # 3. Store interaction using Django ORM
+    # 3. Flag a likely duplicate before the client records the transaction.
+    # The account is not chosen yet, so try each active account (and none).
+    @sync_to_async
+    def check_duplicate():
+        if txn_result.amount is None or not txn_result.date:
+            return None
+        account_ids = [None] + list(
+            Account.objects.filter(user_id=user_id, active=True).values_list(
+                "id", flat=True
+            )
+        )
+        fingerprints = [
+            transaction_fingerprint(
+                user_id,
+                txn_result.date,
+                txn_result.amount,
+                txn_result.store_name,
+                account_id,
+            )
+            for account_id in account_ids
+        ]
+        return find_duplicate(user_id, fingerprints)
+
+    try:
+        duplicate_of = await check_duplicate()
+    except Exception:
+        logger.exception("Duplicate check failed")
+        duplicate_of = None
+
+    # 4. Store interaction using Django ORM
     @sync_to_async
     def store_interaction():
         if not conversation_id:
@@ -130,6 +163,7 @@ async def transaction_assist(request, payload: TransactionMakerRequestSchema):
             logger.exception("Failed to store TransactionMaker interaction")
 
     await store_interaction()
+    schedule_summary_fold(conversation_id)
 
     return {
         "conversation_id": conversation_id,
@@ -141,5 +175,6 @@ async def transaction_assist(request, payload: TransactionMakerRequestSchema):
         "time": txn_result.time,
         "city": txn_result.city,
         "neighbourhood": txn_result.neighbourhood,
+        "duplicate_of": duplicate_of,
         "is_done": txn_result.is_done,
     }
@@ -0,0 +1,145 @@
+"""
+Process warm-up.
+
+Pays the first-request costs before a worker takes traffic: importing the
+API routes, opening the database pool, building the DB schema text for
+prompts, importing the agents (LLM clients, prompt templates, compiled
+graphs) and rendering every module-level prompt once. Runs at worker start when WARMUP_ON_START is set
+(config/asgi.py, in a thread: the server's event loop is already running), and
+on the readiness probe otherwise.
+"""
+
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.urls import get_resolver
+
+from core.utils.database import thread_connection
+from core.utils.dynamic_db_schema import get_dynamic_schema
+from features.agent_registry import AGENTS, get_agent
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the pool to open its min_size connections
+POOL_WARMUP_TIMEOUT = 30
+
+
+def _warm_routes() -> str:
+    # Imports config.api and every mounted router
+    return f"{len(get_resolver().url_patterns)} url patterns"
+
+
+def _warm_database() -> str:
+    pool = connection.pool
+    if pool is not None:
+        pool.wait(timeout=POOL_WARMUP_TIMEOUT)
+    # Requests run in their own threads; release this one's connection after
+    with thread_connection(), connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    return f"pool min_size={pool.min_size}" if pool is not None else "no pool"
+
+
+def _warm_schema() -> str:
+    return f"{len(get_dynamic_schema())} chars"
+
+
+def _warm_agents() -> str:
+    if not settings.ENABLE_AGENTS:
+        return "skipped (ENABLE_AGENTS=False)"
+    for name in AGENTS:
+        get_agent(name)
+    return f"{len(AGENTS)} agents"
+
+
+def _warm_prompts() -> str:
+    """Format every module-level prompt template of the loaded agent modules."""
+    if not settings.ENABLE_AGENTS:
+        return "skipped (ENABLE_AGENTS=False)"
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+    rendered = 0
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith("features.") or module is None:
+            continue
+        for value in vars(module).values():
+            if isinstance(value, ChatPromptTemplate):
+                histories = {
+                    m.variable_name
+                    for m in value.messages
+                    if isinstance(m, MessagesPlaceholder)
+                }
+                value.format_messages(
+                    **{v: [] if v in histories else "" for v in value.input_variables}
+                )
+                rendered += 1
+    return f"{rendered} prompts"
+
+
+WARMUP_STEPS: Tuple[Tuple[str, Callable[[], str]], ...] = (
+    ("routes", _warm_routes),
+    ("database", _warm_database),
+    ("db_schema", _warm_schema),
+    ("agents", _warm_agents),
+    ("prompts", _warm_prompts),
+)
+
+_lock = threading.Lock()
+_report: Dict[str, Any] = {"ready": False, "steps": [], "total_ms": 0.0}
+
+
+def run_warmup() -> Dict[str, Any]:
+    """
+    Run every warm-up step once per process (again after a failure).
+
+    Returns:
+        {"ready": bool, "total_ms": float, "steps": [{name, ok, ms, detail}]}
+    """
+    with _lock:
+        if _report["ready"]:
+            return warmup_report()
+
+        steps: List[Dict[str, Any]] = []
+        for name, step in WARMUP_STEPS:
+            start = time.perf_counter()
+            try:
+                detail, ok = step(), True
+            except Exception as exc:
+                logger.exception("Warm-up step %s failed", name)
+                detail, ok = str(exc), False
+            ms = round((time.perf_counter() - start) * 1000, 1)
+            steps.append({"name": name, "ok": ok, "ms": ms, "detail": detail})
+            logger.info("Warm-up %s: %.1fms (%s)", name, ms, detail)
+
+        _report.update(
+            ready=all(s["ok"] for s in steps),
+            steps=steps,
+            total_ms=round(sum(s["ms"] for s in steps), 1),
+        )
+        return warmup_report()
+
+
+def run_warmup_at_start() -> Dict[str, Any]:
+    """
+    Run the warm-up from a worker thread and wait for it.
+
+    config.asgi is imported inside the server's running event loop (uvicorn
+    calls asyncio.run before loading the app), where the sync ORM calls of the
+    database and schema steps raise SynchronousOnlyOperation.
+    """
+    report: Dict[str, Any] = {}
+    thread = threading.Thread(
+        target=lambda: report.update(run_warmup()), name="warmup", daemon=True
+    )
+    thread.start()
+    thread.join()
+    return report
+
+
+def warmup_report() -> Dict[str, Any]:
+    """Result of the last warm-up run (ready=False if none has completed)."""
+    return {**_report, "steps": list(_report["steps"])}
@@ -1,29 +1,42 @@
 """
 Production server launcher from the repository root.
 
-Adds the API package to sys.path, loads environment variables, and serves the
-application via Waitress. This mirrors the previous api/run_server.py script so
-existing deployment instructions continue to work.
+Loads environment variables and serves the ASGI application with uvicorn in
+multi-process mode. The Dockerfile runs this script, so there is a single
+production entry point.
+
+Process model (all overridable by environment variables or flags):
+- WEB_WORKERS: worker processes. Defaults to what fits in the container's
+  memory limit at WEB_WORKER_MEMORY_MB per worker, capped at the CPU count.
+  A 512MB container therefore gets one worker.
+- WEB_MAX_REQUESTS: a worker exits after this many requests and the
+  supervisor starts a fresh one, which bounds slow memory growth (0 disables).
+- WEB_GRACEFUL_TIMEOUT: seconds in-flight requests get to finish on shutdown
+  or restart.
+
+Signals to the supervisor process: SIGHUP restarts workers gracefully, one
+at a time. SIGTTIN/SIGTTOU add/remove a worker. SIGTERM/SIGINT shut down.
+
+Each worker holds its own database pool (DB_POOL_MAX_SIZE connections), so the
+database sees up to WEB_WORKERS * DB_POOL_MAX_SIZE connections.
 """
+import argparse
 import logging
 import os
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 import sys
 sys.dont_write_bytecode = True
 
 
-
-
-
 BASE_DIR = Path(__file__).resolve().parent
-API_DIR = BASE_DIR / "api"
-sys.path.insert(0, str(API_DIR))
+sys.path.insert(0, str(BASE_DIR))
 
 load_dotenv()
 
-from waitress import serve  # noqa: E402
-from config.wsgi import application  # noqa: E402
+import uvicorn  # noqa: E402
+from uvicorn.supervisors import Multiprocess  # noqa: E402
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,11 +44,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ASGI_APP = "config.asgi:application"
 
-def main() -> None:
-    logger.info("=" * 70)
-    logger.info("Starting Personal Assistant API with Waitress (Production Server)")
-    logger.info("=" * 70)
+# Resident memory budgeted per worker (Django + LangChain/LangGraph loaded)
+DEFAULT_WORKER_MEMORY_MB = 384
+# Left for the supervisor process and the OS page cache
+RESERVED_MEMORY_MB = 96
+
+CGROUP_MEMORY_LIMITS = (
+    "/sys/fs/cgroup/memory.max",  # cgroup v2
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",  # cgroup v1
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Invalid %s value '%s'. Falling back to %s.", name, value, default)
+        return default
+
+
+def memory_limit_mb() -> Optional[int]:
+    """Container memory limit (cgroup), else physical memory, in MB."""
+    for path in CGROUP_MEMORY_LIMITS:
+        try:
+            raw = Path(path).read_text().strip()
+        except OSError:
+            continue
+        # "max" (v2) or a huge sentinel (v1) means no limit
+        if raw.isdigit() and int(raw) < 1 << 50:
+            return int(raw) // (1024 * 1024)
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.virtual_memory().total // (1024 * 1024)
+
+
+def default_workers() -> int:
+    """As many workers as memory allows, never more than CPUs, at least one."""
+    cpus = os.cpu_count() or 1
+    limit = memory_limit_mb()
+    if limit is None:
+        return cpus
+    per_worker = _env_int("WEB_WORKER_MEMORY_MB", DEFAULT_WORKER_MEMORY_MB)
+    by_memory = (limit - RESERVED_MEMORY_MB) // max(per_worker, 1)
+    return max(1, min(cpus, by_memory))
+
+
+def resolve_port() -> int:
     port_env = (
         os.getenv("PORT")
         or os.getenv("APP_PORT")
@@ -43,38 +104,72 @@ def main() -> None:
         or "8080"
     )
     try:
-        port = int(port_env)
+        return int(port_env)
     except ValueError:
         logger.warning(
             "Invalid port value '%s' from environment. Falling back to 8080.", port_env
         )
-        port = 8080
-    logger.info("Server: http://0.0.0.0:%s", port)
-    logger.info("API Docs: http://0.0.0.0:%s/api/docs/", port)
-    logger.info(
-        "Health Check: http://0.0.0.0:%s/api/personal_assistant/health", port
+        return 8080
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the Personal Assistant API (ASGI).")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-requests", type=int, default=None)
+    parser.add_argument("--graceful-timeout", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    port = args.port or resolve_port()
+    workers = args.workers or _env_int("WEB_WORKERS", 0) or default_workers()
+    max_requests = (
+        args.max_requests
+        if args.max_requests is not None
+        else _env_int("WEB_MAX_REQUESTS", 5000)
     )
+    graceful_timeout = (
+        args.graceful_timeout
+        if args.graceful_timeout is not None
+        else _env_int("WEB_GRACEFUL_TIMEOUT", 30)
+    )
+
     logger.info("=" * 70)
-    logger.info("Worker Threads: 8")
-    logger.info("Timeout: 640 seconds (for long-running analyses)")
+    logger.info("Starting Personal Assistant API with Uvicorn (ASGI, production)")
+    logger.info("=" * 70)
+    logger.info("Server: http://%s:%s", args.host, port)
+    logger.info("API Docs: http://%s:%s/api/docs/", args.host, port)
+    logger.info(
+        "Health Check: http://%s:%s/api/personal_assistant/health", args.host, port
+    )
     logger.info("=" * 70)
-    logger.info("Press Ctrl+C to stop the server")
+    logger.info("Workers: %s (memory limit: %s MB)", workers, memory_limit_mb())
+    logger.info("Max requests per worker: %s", max_requests or "unlimited")
+    logger.info("Graceful shutdown timeout: %ss", graceful_timeout)
     logger.info("=" * 70)
 
-    try:
-        serve(
-            application,
-            host="0.0.0.0",
-            port=port,
-            threads=8,
-            _quiet=False,
-            _start=True,
-        )
-    except KeyboardInterrupt:
-        logger.info("Server shutdown requested")
-    except Exception as exc:  # pragma: no cover - logging unexpected errors
-        logger.error("Server error: %s", exc, exc_info=True)
-        sys.exit(1)
+    config = uvicorn.Config(
+        ASGI_APP,
+        host=args.host,
+        port=port,
+        workers=workers,
+        # Django's ASGI handler does not implement the lifespan protocol
+        lifespan="off",
+        limit_max_requests=max_requests or None,
+        timeout_graceful_shutdown=graceful_timeout,
+        timeout_keep_alive=_env_int("WEB_KEEP_ALIVE", 5),
+        proxy_headers=True,
+        forwarded_allow_ips=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        log_level=os.getenv("WEB_LOG_LEVEL", "info"),
+    )
+    # Always run under the supervisor (uvicorn.run only does so for >1 worker),
+    # so a single recycled or crashed worker is restarted too.
+    server = uvicorn.Server(config)
+    sock = config.bind_socket()
+    Multiprocess(config, target=server.run, sockets=[sock]).run()
 
 
 if __name__ == "__main__":
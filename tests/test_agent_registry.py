@@ -0,0 +1,43 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+from core.utils.dynamic_db_schema import get_dynamic_schema
+from features import agent_registry
+
+
+class AgentRegistryTests(SimpleTestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.dict(
+                agent_registry.AGENTS,
+                {"stub": "features.crud.exports.service.parse_datasets"},
+            ),
+            mock.patch.object(agent_registry, "_loaded", {}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_loads_once_on_first_use(self):
+        from features.crud.exports.service import parse_datasets
+
+        self.assertNotIn("stub", agent_registry.loaded_agents())
+        with mock.patch.object(
+            agent_registry, "import_string", wraps=agent_registry.import_string
+        ) as import_string:
+            self.assertIs(agent_registry.get_agent("stub"), parse_datasets)
+            self.assertIs(async_to_sync(agent_registry.aget_agent)("stub"), parse_datasets)
+        import_string.assert_called_once()
+        self.assertIn("stub", agent_registry.loaded_agents())
+
+    def test_unknown_agent(self):
+        with self.assertRaises(KeyError):
+            agent_registry.get_agent("nope")
+
+
+class DynamicSchemaTests(SimpleTestCase):
+    def test_schema_is_built_once(self):
+        self.assertIs(get_dynamic_schema(), get_dynamic_schema())
+        self.assertIn("core_transaction", get_dynamic_schema())
@@ -0,0 +1,136 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import Budget, BudgetMonthlySpend, Income, Notification, Transaction
+from features.crud.budgets import endpoints
+from features.crud.budgets.schemas import BudgetUpdateSchema
+from features.crud.budgets.service import (
+    rebuild_budget_rollup,
+    record_expense_change,
+    verify_budget_rollup,
+)
+
+
+class BudgetRollupTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="rollup", password="password")
+        self.food = Budget.objects.create(
+            user=self.user, budget_name="Food", total_limit=1000
+        )
+        self.fun = Budget.objects.create(
+            user=self.user, budget_name="Fun", total_limit=500
+        )
+
+    def _create(self, **kwargs):
+        fields = {
+            "user": self.user,
+            "budget": self.food,
+            "date": date(2026, 3, 10),
+            "amount": Decimal("100.00"),
+            "transaction_type": "EXPENSE",
+        }
+        fields.update(kwargs)
+        txn = Transaction.objects.create(**fields)
+        record_expense_change(new_txn=txn)
+        return txn
+
+    def _row(self, budget, month=date(2026, 3, 1)):
+        return BudgetMonthlySpend.objects.get(budget=budget, month=month)
+
+    def test_create_update_delete_keep_rollup_in_sync(self):
+        txn = self._create()
+        self._create(amount=Decimal("50.00"))
+        self.assertEqual(self._row(self.food).spent, Decimal("150.00"))
+        self.assertEqual(self._row(self.food).count, 2)
+
+        # Move one expense to another budget and month
+        old = Transaction.objects.get(id=txn.id)
+        Transaction.objects.filter(id=txn.id).update(
+            budget=self.fun, date=date(2026, 4, 2), amount=Decimal("80.00")
+        )
+        record_expense_change(old_txn=old, new_txn=Transaction.objects.get(id=txn.id))
+        self.assertEqual(self._row(self.food).spent, Decimal("50.00"))
+        self.assertEqual(self._row(self.fun, date(2026, 4, 1)).spent, Decimal("80.00"))
+
+        # Soft delete
+        moved = Transaction.objects.get(id=txn.id)
+        record_expense_change(old_txn=moved)
+        Transaction.objects.filter(id=txn.id).update(active=False)
+        self.assertEqual(self._row(self.fun, date(2026, 4, 1)).count, 0)
+
+        self.assertEqual(verify_budget_rollup(self.user.id), [])
+
+    def test_non_expense_transactions_are_ignored(self):
+        self._create(transaction_type="DEPOSIT")
+        self.assertFalse(BudgetMonthlySpend.objects.exists())
+
+    def test_rebuild_repairs_drift(self):
+        self._create()
+        BudgetMonthlySpend.objects.update(spent=Decimal("1.00"))
+        self.assertEqual(len(verify_budget_rollup(self.user.id)), 1)
+
+        rebuild_budget_rollup(self.user.id)
+        self.assertEqual(verify_budget_rollup(self.user.id), [])
+
+    def test_rebuild_keeps_alert_state(self):
+        today = timezone.now().date()
+        self._create(date=today, amount=Decimal("900.00"))  # 90%
+        rebuild_budget_rollup(self.user.id)
+        self.assertEqual(self._row(self.food, today.replace(day=1)).alert_level, 80)
+
+        self._create(date=today, amount=Decimal("10.00"))
+        self.assertEqual(
+            Notification.objects.filter(notification_type="budget_warning").count(), 1
+        )
+
+    def test_alerts_fire_once_per_threshold_crossing(self):
+        today = timezone.now().date()
+        self._create(date=today, amount=Decimal("700.00"))
+        self.assertFalse(Notification.objects.exists())
+
+        self._create(date=today, amount=Decimal("150.00"))  # 85%
+        self._create(date=today, amount=Decimal("10.00"))  # still 86%
+        self.assertEqual(
+            Notification.objects.filter(notification_type="budget_warning").count(), 1
+        )
+
+        over = self._create(date=today, amount=Decimal("200.00"))  # 106%
+        self._create(date=today, amount=Decimal("5.00"))
+        self.assertEqual(
+            Notification.objects.filter(notification_type="budget_alert").count(), 1
+        )
+
+        # Dropping below the limit re-arms the 100% alert
+        record_expense_change(old_txn=over)
+        self.assertEqual(self._row(self.food, today.replace(day=1)).alert_level, 80)
+        self._create(date=today, amount=Decimal("300.00"))
+        self.assertEqual(
+            Notification.objects.filter(notification_type="budget_alert").count(), 2
+        )
+
+    def test_limit_changes_re_evaluate_the_alert_level(self):
+        today = timezone.now().date()
+        self._create(date=today, amount=Decimal("700.00"))  # 70% of 1000
+        Income.objects.create(user=self.user, type_income="Salary", amount=Decimal("5000.00"))
+        request = SimpleNamespace(user=self.user)
+
+        def set_limit(limit):
+            payload = BudgetUpdateSchema(total_limit=limit)
+            response = async_to_sync(endpoints.update_budget)(request, self.food.id, payload)
+            self.assertEqual(response["status"], "success")
+            return self._row(self.food, today.replace(day=1)).alert_level
+
+        self.assertEqual(set_limit(800), 80)  # 87.5%
+        self.assertEqual(set_limit(600), 100)
+        self.assertEqual(
+            list(Notification.objects.values_list("notification_type", flat=True).order_by("id")),
+            ["budget_warning", "budget_alert"],
+        )
+        self.assertEqual(set_limit(2000), 0)
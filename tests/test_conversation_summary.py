@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import ChatConversation, ChatMessage
+from features.crud.conversations.service import (
+    SUMMARY_BATCH_SIZE,
+    SUMMARY_WINDOW,
+    afold_conversation_summary,
+    afold_until_current,
+    get_conversation_summary,
+    insert_chat_message,
+)
+
+
+@override_settings(
+    CONVERSATION_SUMMARIZER="features.crud.conversations.summarizer.summarize_extractive"
+)
+class RollingSummaryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="summary", password="password")
+        self.conversation = ChatConversation.objects.create(user=self.user)
+        self.start = timezone.now() - timedelta(days=1)
+        self.sent = 0
+
+    def _send(self, count):
+        for _ in range(count):
+            message = insert_chat_message(
+                conversation_id=self.conversation.id,
+                sender_type="user",
+                source_agent="User",
+                content=f"message {self.sent}",
+            )
+            # auto_now_add ignores explicit values; pin distinct timestamps
+            ChatMessage.objects.filter(id=message.id).update(
+                created_at=self.start + timedelta(seconds=self.sent)
+            )
+            self.sent += 1
+
+    def _summary(self):
+        self.conversation.refresh_from_db()
+        return self.conversation.summary_text
+
+    def test_short_conversation_has_no_summary(self):
+        self._send(5)
+        history = get_conversation_summary(self.conversation.id)
+        self.assertNotIn("Summary of earlier conversation", history)
+        self.assertIn("message 0", history)
+        self.assertIsNone(self._summary())
+
+    def _fold(self):
+        return async_to_sync(afold_conversation_summary)(self.conversation.id)
+
+    def _assert_nothing_lost(self, history):
+        for n in range(self.sent):
+            self.assertRegex(history, rf"\bmessage {n}\b")
+
+    def test_old_messages_are_folded_incrementally(self):
+        self._send(SUMMARY_WINDOW + SUMMARY_BATCH_SIZE)
+        # Loading history never summarizes; unfolded messages are all shown
+        history = get_conversation_summary(self.conversation.id, limit=SUMMARY_WINDOW)
+        self.assertIsNone(self._summary())
+        self._assert_nothing_lost(history)
+
+        self.assertTrue(self._fold())
+        summary = self._summary()
+        self.assertEqual(summary.count("\n") + 1, SUMMARY_BATCH_SIZE)
+        self.assertIn("message 0", summary)
+        self.assertEqual(
+            self.conversation.summary_created_at,
+            self.start + timedelta(seconds=SUMMARY_BATCH_SIZE - 1),
+        )
+        history = get_conversation_summary(self.conversation.id, limit=SUMMARY_WINDOW)
+        self.assertIn(summary, history)
+        recent = history.split("Recent messages:")[1]
+        self.assertNotIn(f"message {SUMMARY_BATCH_SIZE - 1}\n", recent)
+        self.assertIn(f"message {SUMMARY_BATCH_SIZE}\n", recent)
+        self.assertIn(f"message {self.sent - 1}", recent)
+
+        # Below the batch size nothing is re-summarized
+        self._send(SUMMARY_BATCH_SIZE - 1)
+        self.assertFalse(self._fold())
+        self.assertEqual(self._summary(), summary)
+
+        # One more message completes a batch; only new messages are appended
+        self._send(1)
+        self.assertTrue(self._fold())
+        updated = self._summary()
+        self.assertTrue(updated.startswith(summary))
+        self.assertEqual(updated.count("\n") + 1, 2 * SUMMARY_BATCH_SIZE)
+        self.assertEqual(updated.count("message 0\n"), 1)
+
+    def test_short_limit_loses_no_message(self):
+        # The maker agents ask for 10 messages; everything else must still be
+        # in the summary or shown verbatim, before and after folding
+        self._send(SUMMARY_WINDOW + SUMMARY_BATCH_SIZE + 5)
+        self._assert_nothing_lost(get_conversation_summary(self.conversation.id, limit=10))
+
+        self.assertEqual(async_to_sync(afold_until_current)(self.conversation.id), 1)
+        history = get_conversation_summary(self.conversation.id, limit=10)
+        self.assertIn("Summary of earlier conversation", history)
+        self._assert_nothing_lost(history)
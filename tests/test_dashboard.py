@@ -0,0 +1,69 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Account, Budget, Income, Transaction
+from features.crud.analytics.endpoints import get_overspend
+from features.crud.budgets.service import record_expense_change
+from features.dashboard.endpoints import (
+    get_dashboard_budgets,
+    get_dashboard_overview,
+    get_dashboard_summary,
+)
+
+
+class DashboardOverviewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dash", password="password")
+        self.request = SimpleNamespace(user=self.user)
+        account = Account.objects.create(user=self.user, name="Main", balance=1000)
+        Account.objects.create(
+            user=self.user, name="Savings", type="SAVINGS", balance=500
+        )
+        Income.objects.create(
+            user=self.user, account=account, type_income="Salary", amount=3000
+        )
+        Income.objects.create(
+            user=self.user, type_income="Old", amount=200, active=False
+        )
+        self.food = Budget.objects.create(
+            user=self.user, budget_name="Food", total_limit=400, priority_level_int=2
+        )
+        self.fun = Budget.objects.create(
+            user=self.user, budget_name="Fun", total_limit=100, priority_level_int=1
+        )
+        for budget, amount in ((self.food, "150.00"), (self.fun, "120.00")):
+            txn = Transaction.objects.create(
+                user=self.user,
+                budget=budget,
+                account=account,
+                amount=Decimal(amount),
+                date=date.today(),
+            )
+            record_expense_change(new_txn=txn)
+
+    def test_overview_is_one_query(self):
+        with self.assertNumQueries(1):
+            overview = async_to_sync(get_dashboard_overview)(self.request)
+
+        summary = overview["summary"]
+        self.assertEqual(summary["total_income"], 3000.0)
+        self.assertEqual(summary["total_spent"], 270.0)
+        self.assertEqual(summary["total_budgeted_amount"], 500.0)
+        self.assertEqual(summary["total_assets"], 1500.0)
+        self.assertEqual([b["name"] for b in overview["budgets"]], ["Food", "Fun"])
+        self.assertEqual(overview["budgets"][0]["remaining"], 250.0)
+        overspent = {r["budget_name"]: r["is_overspent"] for r in overview["overspend"]["data"]}
+        self.assertEqual(overspent, {"Food": False, "Fun": True})
+        # Overspend reports all income sources, active or not
+        self.assertEqual(overview["overspend"]["summary"]["total_income"], 3200.0)
+
+    def test_endpoints_are_projections_of_overview(self):
+        overview = async_to_sync(get_dashboard_overview)(self.request)
+        self.assertEqual(async_to_sync(get_dashboard_budgets)(self.request), overview["budgets"])
+        self.assertEqual(async_to_sync(get_dashboard_summary)(self.request), overview["summary"])
+        self.assertEqual(async_to_sync(get_overspend)(self.request), overview["overspend"])
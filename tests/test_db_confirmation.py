@@ -0,0 +1,111 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from core.llm_providers.fake import FakeChatModel
+from features.orchestrator import graph
+from features.personal_assistant import agent as personal_assistant
+
+
+def db_state(**overrides):
+    state = {
+        "user_id": "1",
+        "conversation_id": "",
+        "user_name": "Sara",
+        "user_message": "show my food spending",
+        "routing_decision": "database_agent",
+        "routing_message": "Total Food spending this month",
+        "agents_used": "database_agent",
+        "is_awaiting_data": True,
+        "data": [{"total": 500}],
+    }
+    state.update(overrides)
+    return state
+
+
+@override_settings(DB_CONFIRMATION_MODE="template")
+class TemplatedConfirmationTests(TestCase):
+    def respond(self, state):
+        with mock.patch.object(graph, "ainvoke_personal_assistant") as llm:
+            result = async_to_sync(graph.personal_assistant_response)(state)
+        llm.assert_not_called()
+        return result
+
+    def test_results_are_returned_without_an_llm_call(self):
+        result = self.respond(db_state(data=[{"total": 500}, {"total": 20}]))
+        self.assertTrue(result["has_data"])
+        self.assertEqual(result["data"], [{"total": 500}, {"total": 20}])
+        self.assertEqual(result["final_output"], "Here are the 2 results I found.")
+        self.assertEqual(result["agents_used"], "database_agent")
+
+    def test_empty_result(self):
+        result = self.respond(db_state(data=[]))
+        self.assertTrue(result["has_data"])
+        self.assertIn("couldn't find any records", result["final_output"])
+
+    def test_failed_lookup(self):
+        result = self.respond(db_state(is_awaiting_data=False, data=[]))
+        self.assertFalse(result["has_data"])
+        self.assertIn("couldn't retrieve", result["final_output"])
+
+    def test_failures_reported_as_text_are_not_shown_as_results(self):
+        for data in ("Database error: relation does not exist", "LLM Error: timeout"):
+            with self.subTest(data=data):
+                result = self.respond(db_state(data=data))
+                self.assertFalse(result["has_data"])
+                self.assertEqual(result["data"], [])
+                self.assertIn("couldn't retrieve", result["final_output"])
+                self.assertNotIn("Database error", result["final_output"])
+
+    def test_agent_message_without_query_is_the_reply(self):
+        result = self.respond(db_state(data="Which month do you mean?"))
+        self.assertFalse(result["has_data"])
+        self.assertEqual(result["final_output"], "Which month do you mean?")
+
+    def test_edit_results(self):
+        done = "Added your lunch.\nWrite operation successful. Rows affected: 1"
+        result = self.respond(db_state(is_awaiting_data=False, db_edit=True, data=done))
+        self.assertFalse(result["has_data"])
+        self.assertEqual(result["final_output"], done)
+
+        failed = self.respond(
+            db_state(
+                is_awaiting_data=False,
+                db_edit=True,
+                data="Error Executing Edit Query: Security Restriction",
+            )
+        )
+        self.assertFalse(failed["has_data"])
+        self.assertIn("couldn't make that change", failed["final_output"])
+
+    @override_settings(DB_CONFIRMATION_MODE="llm")
+    def test_llm_mode_asks_the_assistant(self):
+        async def fake_assistant(*args, **kwargs):
+            return {"response": "Here you go!"}
+
+        with mock.patch.object(graph, "ainvoke_personal_assistant", side_effect=fake_assistant):
+            result = async_to_sync(graph.personal_assistant_response)(db_state())
+        self.assertEqual(result["final_output"], "Here you go!")
+
+
+class BehaviourAnalystResponseTests(TestCase):
+    def test_analysis_is_explained_by_the_assistant(self):
+        fake = FakeChatModel(
+            responses=[(r"Food spending is 40% above", "Your Food spending jumped this month.")],
+            default_response="unused",
+        )
+        state = db_state(
+            routing_decision="behaviour_analyst",
+            agents_used="behaviour_analyst",
+            is_awaiting_data=False,
+            data=[],
+            user_message="why is my food spending so high",
+            analysis={"summary": "Food spending is 40% above the monthly average."},
+        )
+        with mock.patch.object(personal_assistant, "get_llm", return_value=fake):
+            result = async_to_sync(graph.personal_assistant_response)(state)
+        self.assertEqual(result["final_output"], "Your Food spending jumped this month.")
+        self.assertFalse(result["has_data"])
+        self.assertEqual(result["agents_used"], "behaviour_analyst")
+        self.assertEqual(fake.calls, 1)
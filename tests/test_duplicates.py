@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Account, Transaction
+from core.utils.fingerprint import transaction_fingerprint
+from features.crud.transactions.expenses.endpoints import create_expense
+from features.crud.transactions.expenses.schemas import ExpenseCreateSchema
+
+
+class TransactionFingerprintTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="dupes", password="password")
+        self.account = Account.objects.create(user=self.user, name="Main", balance=500)
+        self.request = SimpleNamespace(user=self.user)
+
+    def test_fingerprint_ignores_cosmetic_differences(self):
+        a = transaction_fingerprint(1, date(2026, 3, 1), 12.5, "Coffee  Shop", 3)
+        b = transaction_fingerprint(1, "2026-03-01", Decimal("12.50"), " coffee shop", 3)
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, transaction_fingerprint(1, "2026-03-01", 12.5, "Coffee Shop", 4))
+
+    def test_save_keeps_fingerprint_current(self):
+        txn = Transaction.objects.create(
+            user=self.user, date=date(2026, 3, 1), amount=Decimal("9.00"), description="Bus"
+        )
+        self.assertEqual(txn.fingerprint, txn.compute_fingerprint())
+        txn.amount = Decimal("10.00")
+        txn.save(update_fields=["amount"])
+        txn.refresh_from_db()
+        self.assertEqual(txn.fingerprint, txn.compute_fingerprint())
+
+    def _create(self, **extra):
+        payload = ExpenseCreateSchema(
+            date=date(2026, 3, 1),
+            amount=25.0,
+            description="Pharmacy",
+            account_id=self.account.id,
+            **extra,
+        )
+        return async_to_sync(create_expense)(self.request, payload)
+
+    def test_expense_create_flags_duplicates(self):
+        first = self._create()
+        self.assertEqual(first["status"], "success")
+
+        duplicate = self._create()
+        self.assertEqual(duplicate["code"], 409)
+        self.assertIn(str(first["data"]["id"]), duplicate["message"])
+
+        forced = self._create(allow_duplicate=True)
+        self.assertEqual(forced["status"], "success")
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 2)
@@ -0,0 +1,74 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Account, Budget, BudgetMonthlySpend, Transaction
+from features.crud.budgets.service import record_expense_change
+from features.crud.transactions.expenses import endpoints
+from features.crud.transactions.expenses.schemas import ExpenseUpdateSchema
+
+
+class ExpenseAtomicityTests(TestCase):
+    """A failed expense write leaves balance, expense and rollup untouched."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="atomic", password="password")
+        self.account = Account.objects.create(user=self.user, name="Main", balance=500)
+        self.budget = Budget.objects.create(user=self.user, budget_name="Food", total_limit=900)
+        self.request = SimpleNamespace(user=self.user)
+        self.expense = Transaction.objects.create(
+            user=self.user,
+            date=date(2026, 3, 1),
+            amount=Decimal("100.00"),
+            budget=self.budget,
+            account=self.account,
+            transaction_type="EXPENSE",
+        )
+        record_expense_change(new_txn=self.expense)
+
+    def assertUnchanged(self):
+        self.account.refresh_from_db()
+        self.expense.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("500.00"))
+        self.assertEqual(self.expense.amount, Decimal("100.00"))
+        self.assertTrue(self.expense.active)
+        self.assertEqual(
+            BudgetMonthlySpend.objects.get(budget=self.budget).spent, Decimal("100.00")
+        )
+
+    def test_failed_update_rolls_back_the_balance(self):
+        payload = ExpenseUpdateSchema(amount=150.0)
+        with mock.patch.object(
+            endpoints, "record_expense_change", side_effect=RuntimeError("rollup down")
+        ):
+            response = async_to_sync(endpoints.update_expense)(
+                self.request, self.expense.id, payload
+            )
+        self.assertEqual(response["status"], "error")
+        self.assertUnchanged()
+
+    def test_failed_delete_rolls_back_the_refund(self):
+        with mock.patch.object(
+            Transaction, "save", side_effect=RuntimeError("disk full")
+        ):
+            response = async_to_sync(endpoints.delete_expense)(self.request, self.expense.id)
+        self.assertEqual(response["status"], "error")
+        self.assertUnchanged()
+
+    def test_update_and_delete_lock_the_expense_row(self):
+        for endpoint, args in (
+            (endpoints.update_expense, (ExpenseUpdateSchema(amount=120.0),)),
+            (endpoints.delete_expense, ()),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = async_to_sync(endpoint)(self.request, self.expense.id, *args)
+            self.assertEqual(response["status"], "success")
+            locked = [q["sql"] for q in queries if "FOR UPDATE" in q["sql"]]
+            self.assertTrue(any('"core_transaction"' in sql for sql in locked), locked)
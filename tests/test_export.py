@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+
+import zstandard
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+
+from core.models import Account, Budget, Goal, Income, Transaction
+from features.crud.exports import service
+from features.crud.exports.endpoints import export_ledger
+from features.crud.exports.service import export_chunks, parse_datasets
+
+
+class LedgerExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="exporter", password="x")
+        other = User.objects.create_user(username="other", password="x")
+        account = Account.objects.create(user=cls.user, name="Main", balance=100)
+        budget = Budget.objects.create(user=cls.user, budget_name="Food", total_limit=500)
+        Goal.objects.create(user=cls.user, goal_name="Car", target=5000)
+        Income.objects.create(user=cls.user, type_income="Salary", amount=3000)
+        Transaction.objects.bulk_create(
+            Transaction(
+                user=cls.user,
+                transaction_type="EXPENSE",
+                date=date(2026, 1, 1) + timedelta(days=i),
+                amount=Decimal("10.05") + i,
+                description=f'Store, "{i}"',
+                budget=budget,
+                account=account,
+                active=i % 10 != 0,
+            )
+            for i in range(250)
+        )
+        Transaction.objects.create(
+            user=other, transaction_type="EXPENSE", date=date(2026, 1, 1), amount=1
+        )
+
+    def _export(self, *args, **kwargs):
+        return b"".join(export_chunks(self.user.id, *args, **kwargs))
+
+    def test_ndjson_covers_all_datasets_for_the_user_only(self):
+        # Small chunks force many yields across the server-side cursor
+        with mock.patch.object(service, "EXPORT_CHUNK_BYTES", 512), \
+                mock.patch.object(service, "EXPORT_FETCH_SIZE", 50):
+            chunks = list(export_chunks(self.user.id, parse_datasets(None)))
+        self.assertGreater(len(chunks), 10)
+
+        records = [json.loads(line) for line in b"".join(chunks).splitlines()]
+        by_dataset = {}
+        for record in records:
+            by_dataset.setdefault(record["dataset"], []).append(record)
+
+        self.assertEqual(len(by_dataset["transactions"]), 250)  # inactive included
+        self.assertEqual(len(by_dataset["budgets"]), 1)
+        self.assertEqual(len(by_dataset["goals"]), 1)
+        self.assertEqual(len(by_dataset["income"]), 1)
+
+        first = by_dataset["transactions"][0]
+        self.assertEqual(first["amount"], "10.05")
+        self.assertEqual(first["date"], "2026-01-01")
+        self.assertFalse(first["active"])
+        dates = [r["date"] for r in by_dataset["transactions"]]
+        self.assertEqual(dates, sorted(dates))
+
+    def test_csv_single_dataset(self):
+        body = self._export(["transactions"], "csv").decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 250)
+        self.assertEqual(rows[1]["description"], 'Store, "1"')
+        self.assertEqual(rows[1]["amount"], "11.05")
+
+        with self.assertRaises(ValueError):
+            export_chunks(self.user.id, ["transactions", "budgets"], "csv")
+
+    def test_zstd_round_trip(self):
+        plain = self._export(["transactions"])
+        compressed = self._export(["transactions"], compression="zstd")
+        self.assertLess(len(compressed), len(plain))
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(compressed))
+        self.assertEqual(reader.read(), plain)
+
+    def test_parse_datasets(self):
+        self.assertEqual(parse_datasets(" Goals,income,goals "), ["goals", "income"])
+        with self.assertRaises(ValueError):
+            parse_datasets("transactions,secrets")
+
+    def test_endpoint_streams(self):
+        response = async_to_sync(export_ledger)(
+            SimpleNamespace(user=self.user),
+            datasets=None,
+            export_format="csv",
+            compression="zstd",
+        )
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response["Content-Type"], "application/zstd")
+        self.assertIn("transactions-", response["Content-Disposition"])
+        self.assertIn(".csv.zst", response["Content-Disposition"])
+        body = zstandard.ZstdDecompressor().stream_reader(
+            io.BytesIO(b"".join(response.streaming_content))
+        ).read()
+        self.assertEqual(len(body.decode().splitlines()), 251)
+
+    def test_endpoint_rejects_bad_format(self):
+        result = async_to_sync(export_ledger)(
+            SimpleNamespace(user=self.user),
+            datasets=None,
+            export_format="xml",
+            compression=None,
+        )
+        self.assertEqual(result["status"], "error")
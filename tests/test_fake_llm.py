@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from django.test import SimpleTestCase
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+
+from core.llm_providers.fake import FakeChatModel
+
+
+class Answer(BaseModel):
+    query: str
+    edit: bool
+
+
+class FakeChatModelTests(SimpleTestCase):
+    def test_first_matching_pattern_wins(self):
+        model = FakeChatModel(
+            responses=[(r"router", "routed"), (r".*", "catch-all")],
+            default_response="unused",
+        )
+        self.assertEqual(model.invoke("you are the router").content, "routed")
+        self.assertEqual(model.invoke("anything else").content, "catch-all")
+        self.assertEqual(model.calls, 2)
+
+    def test_structured_output_parses_json(self):
+        model = FakeChatModel(default_response='```json\n{"query": "SELECT 1", "edit": false}\n```')
+        chain = ChatPromptTemplate.from_messages([("user", "{q}")]) | (
+            model.with_structured_output(Answer)
+        )
+        self.assertEqual(chain.invoke({"q": "x"}), Answer(query="SELECT 1", edit=False))
+
+    def test_async_calls_overlap(self):
+        model = FakeChatModel(default_response="ok", latency_ms=100)
+
+        async def run():
+            return await asyncio.gather(*(model.ainvoke("hi") for _ in range(20)))
+
+        start = time.perf_counter()
+        results = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([r.content for r in results], ["ok"] * 20)
+        # 20 sequential calls would take 2s
+        self.assertLess(elapsed, 1.0)
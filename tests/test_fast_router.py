@@ -0,0 +1,99 @@
+import os
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from core.utils.cache import get_cache_stats
+from features.orchestrator.fast_router import (
+    BEHAVIOUR_ANALYST,
+    DATABASE_AGENT,
+    PERSONAL_ASSISTANT,
+    NaiveBayesRouter,
+    classify,
+    fast_route,
+    match_rules,
+)
+
+TRAINING = [
+    ("how much did i spend on groceries", DATABASE_AGENT),
+    ("total spending on food last month", DATABASE_AGENT),
+    ("my balance in the main account", DATABASE_AGENT),
+    ("why is my food spending so high", BEHAVIOUR_ANALYST),
+    ("help me understand my spending habits", BEHAVIOUR_ANALYST),
+    ("am i spending too much on dining out", BEHAVIOUR_ANALYST),
+    ("i feel like i am always broke", PERSONAL_ASSISTANT),
+    ("tell me a joke", PERSONAL_ASSISTANT),
+]
+
+
+class MatchRulesTests(SimpleTestCase):
+    def test_small_talk(self):
+        for text in ("Hi!", "thanks so much", "ok", "good morning :)"):
+            self.assertEqual(match_rules(text), PERSONAL_ASSISTANT, text)
+
+    def test_lookup(self):
+        for text in ("How much did I spend on Food last month?", "Show me my transactions"):
+            self.assertEqual(match_rules(text), DATABASE_AGENT, text)
+
+    def test_analysis(self):
+        for text in ("Why am I overspending on Dining Out?", "Any recommendations to save more?"):
+            self.assertEqual(match_rules(text), BEHAVIOUR_ANALYST, text)
+
+    def test_ambiguous_or_write_requests_are_left_to_the_llm(self):
+        for text in (
+            "How much did I spend last month compared to this month?",
+            "hi, can you add a transaction for 50 EGP",
+            "Delete my Food budget",
+            "I feel like I'm always broke",
+        ):
+            self.assertIsNone(match_rules(text), text)
+
+
+class NaiveBayesRouterTests(SimpleTestCase):
+    def test_predicts_trained_agent(self):
+        model = NaiveBayesRouter().fit(TRAINING)
+        agent, confidence = model.predict("I feel broke")
+        self.assertEqual(agent, PERSONAL_ASSISTANT)
+        self.assertGreater(confidence, 1 / 3)
+
+    def test_save_and_load_round_trip(self):
+        model = NaiveBayesRouter().fit(TRAINING)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "router.json")
+            model.save(path)
+            loaded = NaiveBayesRouter.load(path)
+        self.assertEqual(loaded.predict("spending habits"), model.predict("spending habits"))
+
+    def test_untrained_model_abstains(self):
+        self.assertEqual(NaiveBayesRouter().predict("hello"), (None, 0.0))
+
+
+class ClassifyTests(SimpleTestCase):
+    def test_rules_win_over_model(self):
+        route = classify("thanks", NaiveBayesRouter().fit(TRAINING), 0.0)
+        self.assertEqual((route.agent, route.source), (PERSONAL_ASSISTANT, "rule"))
+
+    def test_model_below_confidence_falls_back(self):
+        model = NaiveBayesRouter().fit(TRAINING)
+        self.assertIsNone(classify("I feel broke", model, min_confidence=1.0))
+        route = classify("I feel broke", model, min_confidence=0.0)
+        self.assertEqual((route.agent, route.source), (PERSONAL_ASSISTANT, "model"))
+        self.assertIn("I feel broke", route.message)
+
+
+@override_settings(FAST_ROUTER=True, FAST_ROUTER_MODEL="", FAST_ROUTER_MIN_CONFIDENCE=0.9)
+class FastRouteTests(SimpleTestCase):
+    def setUp(self):
+        self.stats = get_cache_stats("fast_router")
+        self.stats.reset()
+
+    def test_counts_hits_and_misses(self):
+        self.assertEqual(fast_route("hello").agent, PERSONAL_ASSISTANT)
+        self.assertIsNone(fast_route("I feel like I'm always broke"))
+        self.assertEqual(self.stats.as_dict()["hits"], 1)
+        self.assertEqual(self.stats.as_dict()["misses"], 1)
+
+    @override_settings(FAST_ROUTER=False)
+    def test_disabled(self):
+        self.assertIsNone(fast_route("hello"))
+        self.assertEqual(self.stats.as_dict()["hits"] + self.stats.as_dict()["misses"], 0)
@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from core.llm_providers import registry
+from core.llm_providers.registry import GovernedLLM, ProviderLimits, TokenBucket, get_llm
+
+FAKE_PROVIDERS = {
+    "fake": {
+        "BACKEND": "core.llm_providers.fake.fake_chat_model",
+        "OPTIONS": {"default_response": "hello"},
+        "MAX_CONCURRENCY": 2,
+    },
+}
+
+
+class Unavailable(Exception):
+    status_code = 503
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_no_rate_never_waits(self):
+        bucket = TokenBucket(rate=0, burst=1)
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0] * 5)
+
+
+@patch.object(registry, "BACKOFF_BASE", 0)
+class ProviderLimitsTests(SimpleTestCase):
+    def test_retries_retryable_errors(self):
+        limits = ProviderLimits("test", max_retries=2)
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise Unavailable()
+            return "ok"
+
+        self.assertEqual(asyncio.run(limits.acall(flaky)), "ok")
+        self.assertEqual(limits.stats["retries"], 2)
+
+    def test_does_not_retry_other_errors(self):
+        limits = ProviderLimits("test", max_retries=3)
+        attempts = []
+
+        def broken():
+            attempts.append(1)
+            raise ValueError("bad prompt")
+
+        with self.assertRaises(ValueError):
+            limits.call(broken)
+        self.assertEqual(len(attempts), 1)
+        self.assertEqual(limits.stats["failures"], 1)
+
+    def test_timeout_is_retried_then_raised(self):
+        limits = ProviderLimits("test", timeout=0.01, max_retries=1)
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(limits.acall(slow))
+        self.assertEqual(limits.stats["timeouts"], 2)
+        self.assertEqual(limits.stats["calls"], 2)
+
+    def test_concurrency_cap(self):
+        limits = ProviderLimits("test", max_concurrency=3)
+        in_flight = peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        async def run():
+            await asyncio.gather(*(limits.acall(call) for _ in range(10)))
+
+        asyncio.run(run())
+        self.assertEqual(peak, 3)
+
+
+@override_settings(LLM_PROVIDER="fake", LLM_PROVIDERS=FAKE_PROVIDERS)
+class GetLlmTests(SimpleTestCase):
+    def setUp(self):
+        patcher = patch.dict(registry._providers, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_builds_default_provider_once(self):
+        llm = get_llm()
+        self.assertIsInstance(llm, GovernedLLM)
+        self.assertIs(get_llm("fake"), llm)
+        self.assertEqual(llm.limits.max_concurrency, 2)
+
+    def test_governed_model_composes(self):
+        llm = get_llm()
+        self.assertEqual(asyncio.run(llm.ainvoke("hi")).content, "hello")
+        self.assertEqual(llm.invoke("hi").content, "hello")
+        self.assertEqual(registry.provider_stats()["fake"]["calls"], 2)
+
+    def test_unknown_provider(self):
+        with self.assertRaises(ValueError):
+            get_llm("missing")
@@ -0,0 +1,107 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from core.models import SqlPlan
+from features.database_agent.plan_cache import (
+    PlanCache,
+    bind_params,
+    normalize_request,
+    parameterize,
+)
+
+TODAY = date(2026, 10, 15)
+SQL = (
+    "SELECT SUM(amount) AS total FROM core_transaction "
+    "WHERE user_id = {user_id} AND date >= '2026-10-01' AND description ILIKE '%food%'"
+)
+
+
+class ParameterizeTests(SimpleTestCase):
+    def test_normalize_request(self):
+        self.assertEqual(
+            normalize_request("  Total spending for FOOD, last month?? "),
+            "total spending for food last month",
+        )
+
+    def test_user_id_and_date_windows_become_parameters(self):
+        template = parameterize(SQL.format(user_id=42), "food this month", 42, TODAY)
+        self.assertEqual(
+            template,
+            "SELECT SUM(amount) AS total FROM core_transaction WHERE user_id = %(user_id)s "
+            "AND date >= %(month_start)s AND description ILIKE '%%food%%'",
+        )
+        params = bind_params(7, TODAY + timedelta(days=31))
+        self.assertEqual((params["user_id"], params["month_start"]), (7, "2026-11-01"))
+
+    def test_dates_named_in_the_request_stay_literal(self):
+        sql = "SELECT * FROM core_transaction WHERE user_id = 42 AND date = '2025-03-02'"
+        template = parameterize(sql, "what did I spend on 2025-03-02", 42, TODAY)
+        self.assertIn("'2025-03-02'", template)
+
+    def test_unsafe_sql_is_not_cached(self):
+        unsafe = [
+            SQL.format(user_id=43),  # another user
+            "SELECT * FROM core_transaction",  # no user filter
+            "SELECT * FROM core_transaction WHERE user_id = 42 AND id = 42",
+            "SELECT * FROM core_transaction WHERE user_id = 42 AND date >= '2026-02-17'",
+            "SELECT * FROM core_transaction WHERE user_id = 42 AND date >= '2026-10-01 00:00'",
+            "SELECT * FROM core_transaction WHERE user_id = 42 "
+            "AND EXTRACT(MONTH FROM date) = 10",
+        ]
+        for sql in unsafe:
+            with self.subTest(sql=sql):
+                self.assertIsNone(parameterize(sql, "food this month", 42, TODAY))
+
+
+class PlanCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="plans")
+        self.cache = PlanCache(max_entries=2, ttl_seconds=3600, max_rows=10)
+        self.cache.clear()
+
+    def store(self, request="Food this month", sql=None):
+        sql = sql or SQL.format(user_id=self.user.id)
+        return self.cache.store(request, sql, "ok", self.user.id, TODAY, 900.0)
+
+    def test_hit_after_store_survives_restart(self):
+        self.assertIsNone(self.cache.lookup("food this month", self.user.id, TODAY))
+        self.assertTrue(self.store())
+
+        restarted = PlanCache(max_entries=2, ttl_seconds=3600, max_rows=10)
+        plan, params = restarted.lookup("FOOD this month!", 99, TODAY)
+        self.assertIn("%(user_id)s", plan.sql_template)
+        self.assertEqual(params["user_id"], 99)
+
+        restarted.record(plan, ok=True)
+        row = SqlPlan.objects.get(key=plan.key)
+        self.assertEqual((row.hits, row.successes), (1, 2))
+        self.assertEqual(restarted.report()["saved_llm_ms"], 900.0)
+
+    def test_uncacheable_sql_is_not_stored(self):
+        self.assertFalse(self.store(sql="SELECT 1"))
+        self.assertFalse(SqlPlan.objects.exists())
+
+    def test_failing_plan_is_dropped(self):
+        self.store()
+        plan, _ = self.cache.lookup("food this month", self.user.id, TODAY)
+        self.cache.record(plan, ok=False, error="column does not exist")
+        self.assertEqual(SqlPlan.objects.get(key=plan.key).failures, 1)
+        self.cache.record(plan, ok=False, error="column does not exist")
+        self.assertFalse(SqlPlan.objects.filter(key=plan.key).exists())
+        self.assertIsNone(self.cache.lookup("food this month", self.user.id, TODAY))
+
+    def test_expired_plan_is_evicted(self):
+        self.store()
+        SqlPlan.objects.update(created_at=timezone.now() - timedelta(hours=2))
+        self.cache.clear()
+        self.assertIsNone(self.cache.lookup("food this month", self.user.id, TODAY))
+        self.assertFalse(SqlPlan.objects.exists())
+
+    def test_lru_keeps_the_most_recent_plans_in_memory(self):
+        for request in ("food", "rent", "fuel"):
+            self.store(request=request)
+        self.assertEqual(self.cache.report()["in_memory"], 2)
+        self.assertEqual(SqlPlan.objects.count(), 3)
@@ -0,0 +1,231 @@
+"""Query-plan regression suite for the hot transaction paths.
+
+Every hot query is captured while running the real endpoint/service code, then
+re-run under EXPLAIN with sequential scans disabled. The planner only falls
+back to a Seq Scan in that mode when no usable index exists, so any Seq Scan
+in the plan means an index regressed.
+"""
+
+import re
+import unittest
+from datetime import timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import Account, Budget, Goal, Income, Notification, Transaction
+from features.crud.analytics.endpoints import (
+    get_budget_stats,
+    get_monthly_breakdown,
+    get_overspend,
+    search_transactions,
+)
+from features.crud.transactions.endpoints import get_transactions
+from features.crud.transactions.expenses.endpoints import get_expenses
+from features.crud.users.service import fetch_spending_stats, fetch_user_summary_data
+from features.dashboard.endpoints import (
+    get_dashboard_budgets,
+    get_dashboard_overview,
+    get_dashboard_summary,
+)
+from features.notifications.endpoints import list_notifications
+
+
+SEED_USERS = 3
+SEED_TRANSACTIONS_PER_USER = 2000
+
+
+@unittest.skipUnless(
+    connection.vendor == "postgresql", "Query plans are PostgreSQL-specific"
+)
+class HotPathQueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.now().date()
+        types = ["EXPENSE", "EXPENSE", "EXPENSE", "DEPOSIT", "TRANSFER"]
+
+        cls.users = []
+        for u in range(SEED_USERS):
+            user = User.objects.create_user(username=f"plan_user_{u}", password="x")
+            cls.users.append(user)
+            account = Account.objects.create(user=user, name="Main", balance=10000)
+            Account.objects.create(user=user, name="Savings", type="SAVINGS")
+            budgets = [
+                Budget.objects.create(
+                    user=user, budget_name=f"Budget {b}", total_limit=1000
+                )
+                for b in range(5)
+            ]
+            Goal.objects.create(user=user, goal_name="Car", target=5000)
+            Income.objects.create(
+                user=user,
+                account=account,
+                type_income="Salary",
+                amount=5000,
+                payment_day=1,
+                next_payment_date=today,
+            )
+            Notification.objects.create(user=user, title="Hello", message="World")
+
+            Transaction.objects.bulk_create(
+                Transaction(
+                    user=user,
+                    transaction_type=types[i % len(types)],
+                    date=today - timedelta(days=i % 400),
+                    amount=Decimal("10.00") + i % 50,
+                    description=f"Store {i % 40}",
+                    budget=budgets[i % len(budgets)],
+                    account=account,
+                    active=i % 17 != 0,
+                )
+                for i in range(SEED_TRANSACTIONS_PER_USER)
+            )
+
+        with connection.cursor() as cursor:
+            for table in (
+                "core_transaction",
+                "core_budget",
+                "core_goal",
+                "core_income",
+                "core_account",
+                "core_notification",
+            ):
+                cursor.execute(f"ANALYZE {table}")
+
+    def setUp(self):
+        self.user = self.users[0]
+        self.request = SimpleNamespace(user=self.user)
+
+    def assertNoSeqScan(self, run):
+        """Run `run`, then EXPLAIN every SELECT it issued with seqscans disabled."""
+        with CaptureQueriesContext(connection) as ctx:
+            run()
+
+        selects = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].lstrip().upper().startswith(("SELECT", "WITH"))
+        ]
+        self.assertTrue(selects, "No SELECT queries were captured")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            for sql in selects:
+                cursor.execute(f"EXPLAIN {sql}")
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+                self.assertNotIn("Seq Scan", plan, f"\n{sql}\n\n{plan}")
+
+    def assertSeeksPastCursor(self, run, column):
+        """The paged SELECT is an index scan whose Index Cond bounds `column`."""
+        with CaptureQueriesContext(connection) as ctx:
+            run()
+        paged = [q["sql"] for q in ctx.captured_queries if "ORDER BY" in q["sql"]]
+        self.assertEqual(len(paged), 1, paged)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {paged[0]}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.assertRegex(plan, r"(?<!Bitmap )Index (Only )?Scan", plan)
+        self.assertRegex(
+            plan, rf"Index Cond: .*\b{re.escape(column)} <= ", f"\n{paged[0]}\n\n{plan}"
+        )
+
+    def test_dashboard_budgets(self):
+        self.assertNoSeqScan(lambda: async_to_sync(get_dashboard_budgets)(self.request))
+
+    def test_dashboard_summary(self):
+        self.assertNoSeqScan(lambda: async_to_sync(get_dashboard_summary)(self.request))
+
+    def test_dashboard_overview(self):
+        self.assertNoSeqScan(lambda: async_to_sync(get_dashboard_overview)(self.request))
+
+    def test_budget_stats(self):
+        self.assertNoSeqScan(
+            lambda: async_to_sync(get_budget_stats)(self.request, active=True)
+        )
+
+    def test_overspend(self):
+        self.assertNoSeqScan(lambda: async_to_sync(get_overspend)(self.request))
+
+    def test_monthly_breakdown(self):
+        self.assertNoSeqScan(
+            lambda: async_to_sync(get_monthly_breakdown)(self.request, month=None)
+        )
+
+    def test_spending_stats(self):
+        self.assertNoSeqScan(lambda: fetch_spending_stats(self.user.id, months_back=3))
+
+    def test_user_summary_data(self):
+        self.assertNoSeqScan(lambda: fetch_user_summary_data(self.user.id))
+
+    def _list_expenses(self, cursor=None):
+        return async_to_sync(get_expenses)(
+            self.request,
+            active=True,
+            start_date=None,
+            end_date=None,
+            limit=100,
+            cursor=cursor,
+        )
+
+    def test_expense_listing(self):
+        self.assertNoSeqScan(self._list_expenses)
+
+    def test_expense_listing_next_page(self):
+        first_page = self._list_expenses()
+        self.assertIn("next_cursor", first_page)
+        self.assertNoSeqScan(lambda: self._list_expenses(first_page["next_cursor"]))
+        self.assertSeeksPastCursor(
+            lambda: self._list_expenses(first_page["next_cursor"]), "date"
+        )
+
+    def test_transaction_listing(self):
+        self.assertNoSeqScan(
+            lambda: async_to_sync(get_transactions)(
+                self.request,
+                active=True,
+                start_date=None,
+                end_date=None,
+                transaction_type=None,
+                limit=100,
+                cursor=None,
+            )
+        )
+
+    def test_transaction_search(self):
+        for mode in ("contains", "prefix", "fuzzy"):
+            with self.subTest(mode=mode):
+                self.assertNoSeqScan(
+                    lambda: async_to_sync(search_transactions)(
+                        self.request,
+                        query_text="Store 1",
+                        mode=mode,
+                        category=None,
+                        min_amount=None,
+                        max_amount=None,
+                        start_date=None,
+                        end_date=None,
+                        city=None,
+                        neighbourhood=None,
+                        limit=100,
+                    )
+                )
+
+    def test_notification_listing(self):
+        self.assertNoSeqScan(lambda: async_to_sync(list_notifications)(self.request))
+
+    def test_recurring_income_due(self):
+        today = timezone.now().date()
+        self.assertNoSeqScan(
+            lambda: list(
+                Income.objects.filter(
+                    active=True, next_payment_date__lte=today, payment_day__isnull=False
+                )
+            )
+        )
@@ -0,0 +1,99 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from core.models import Transaction
+from core.utils.database import run_select
+from features.database_agent import result_cache
+from features.database_agent.result_cache import ResultCache, cacheable
+
+TABLES = frozenset({"core_transaction", "core_budget", "core_chatmessage"})
+
+
+@mock.patch.object(result_cache, "_tables", TABLES)
+class CacheableTests(SimpleTestCase):
+    def test_user_queries_on_versioned_tables(self):
+        self.assertTrue(
+            cacheable(
+                "SELECT b.budget_name, SUM(t.amount) FROM core_transaction t "
+                "JOIN core_budget b ON b.id = t.budget_id WHERE t.user_id = 4 "
+                "AND t.date >= DATE_TRUNC('month', CURRENT_DATE) GROUP BY 1"
+            )
+        )
+
+    def test_other_queries_are_not_cached(self):
+        for sql in (
+            "SELECT SUM(amount) FROM core_transaction",  # no user filter
+            "SELECT content FROM core_chatmessage WHERE user_id = 4",  # unversioned table
+            "SELECT * FROM core_transaction WHERE user_id = 4 AND created_at > NOW()",
+            "SELECT random() FROM core_transaction WHERE user_id = 4",
+        ):
+            with self.subTest(sql=sql):
+                self.assertFalse(cacheable(sql))
+
+
+class ResultCacheTests(SimpleTestCase):
+    rows = [{"total": 1}]
+
+    def test_newer_version_drops_the_users_entries(self):
+        cache = ResultCache(max_bytes=1 << 20)
+        cache.put("a", 1, 3, self.rows)
+        cache.put("b", 2, 5, self.rows)
+        self.assertEqual(cache.get("a", 1, 3), self.rows)
+
+        self.assertIsNone(cache.get("c", 1, 4))
+        self.assertIsNone(cache.get("a", 1, 3))
+        self.assertEqual(cache.get("b", 2, 5), self.rows)
+        # A result computed on the old version is not stored
+        self.assertTrue(cache.put("d", 1, 4, self.rows))
+        self.assertFalse(cache.put("e", 1, 3, self.rows))
+
+    def test_lru_eviction_keeps_within_the_memory_budget(self):
+        rows = [{"description": "x" * 100}]
+        cache = ResultCache(max_bytes=600)
+        for key in "abcde":
+            cache.put(key, 1, 1, rows)
+            cache.get("a", 1, 1)  # keep "a" recently used
+        self.assertLessEqual(cache.bytes, 600)
+        self.assertIsNotNone(cache.get("a", 1, 1))
+        self.assertIsNone(cache.get("b", 1, 1))
+
+    def test_oversized_results_are_not_cached(self):
+        cache = ResultCache(max_bytes=400)
+        self.assertFalse(cache.put("a", 1, 1, [{"description": "x" * 200}]))
+        self.assertEqual(cache.bytes, 0)
+
+    def test_cached_rows_are_copies(self):
+        cache = ResultCache(max_bytes=1 << 20)
+        cache.put("a", 1, 1, [{"total": 1}])
+        cache.get("a", 1, 1)[0]["total"] = 2
+        self.assertEqual(cache.get("a", 1, 1), [{"total": 1}])
+
+
+class ResultCacheInvalidationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="cached")
+        self.cache = ResultCache(max_bytes=1 << 20)
+        self.sql = (
+            f"SELECT COUNT(*) AS n FROM core_transaction WHERE user_id = {self.user.id}"
+        )
+        self.runs = 0
+
+    def fetch(self):
+        def run():
+            self.runs += 1
+            return run_select(self.sql)
+
+        return self.cache.fetch(self.sql, None, self.user.id, run)
+
+    def test_writes_to_the_users_data_invalidate_results(self):
+        self.assertEqual(self.fetch(), [{"n": 0}])
+        self.assertEqual(self.fetch(), [{"n": 0}])
+        self.assertEqual(self.runs, 1)
+
+        Transaction.objects.create(user=self.user, date=date(2026, 10, 1), amount=5)
+        self.assertEqual(self.fetch(), [{"n": 1}])
+        self.assertEqual(self.runs, 2)
+        self.assertEqual(self.cache.report()["entries"], 1)
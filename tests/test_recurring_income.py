@@ -0,0 +1,67 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Account, Income, Transaction
+from features.crud.income.service import process_due_incomes
+
+
+class RecurringIncomeJobTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="earner", password="x")
+        self.account = Account.objects.create(user=self.user, name="Main", balance=0)
+
+    def _income(self, **kwargs):
+        defaults = {
+            "user": self.user,
+            "account": self.account,
+            "type_income": "Salary",
+            "amount": Decimal("1000.00"),
+        }
+        return Income.objects.create(**{**defaults, **kwargs})
+
+    def test_catches_up_every_missed_period(self):
+        income = self._income(payment_day=31, next_payment_date=date(2026, 1, 31))
+
+        totals = process_due_incomes(date(2026, 4, 15))
+
+        self.assertEqual(totals, {"incomes": 1, "deposits": 3, "chunks": 1})
+        deposits = Transaction.objects.filter(income_source=income).order_by("date")
+        self.assertEqual(
+            [t.income_period for t in deposits],
+            [date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31)],
+        )
+        self.assertTrue(all(t.fingerprint == t.compute_fingerprint() for t in deposits))
+        income.refresh_from_db()
+        self.assertEqual(income.next_payment_date, date(2026, 4, 30))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("3000.00"))
+
+    def test_periods_are_idempotent(self):
+        income = self._income(payment_day=5, next_payment_date=date(2026, 3, 5))
+        process_due_incomes(date(2026, 3, 10))
+
+        # A stale schedule (e.g. restored row, overlapping worker) pays nothing twice
+        Income.objects.filter(id=income.id).update(next_payment_date=date(2026, 3, 5))
+        totals = process_due_incomes(date(2026, 3, 10))
+
+        self.assertEqual(totals["deposits"], 0)
+        self.assertEqual(Transaction.objects.filter(income_source=income).count(), 1)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("1000.00"))
+        income.refresh_from_db()
+        self.assertEqual(income.next_payment_date, date(2026, 4, 5))
+
+    def test_chunks_and_skips_unpayable_incomes(self):
+        for _ in range(5):
+            self._income(payment_day=1, next_payment_date=date(2026, 3, 1))
+        no_account = self._income(account=None, payment_day=1, next_payment_date=date(2026, 3, 1))
+        future = self._income(payment_day=20, next_payment_date=date(2026, 3, 20))
+
+        totals = process_due_incomes(date(2026, 3, 10), chunk_size=2)
+
+        self.assertEqual(totals, {"incomes": 5, "deposits": 5, "chunks": 3})
+        self.assertFalse(Transaction.objects.filter(income_source=no_account).exists())
+        self.assertFalse(Transaction.objects.filter(income_source=future).exists())
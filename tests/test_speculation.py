@@ -0,0 +1,130 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from features.orchestrator import graph
+from features.orchestrator.fast_router import probably_data
+from features.orchestrator.speculation import (
+    Speculation,
+    reset_speculation_stats,
+    speculation_stats,
+)
+
+DB_RESULT = {"result": {"data": [{"total": 500}]}, "edit": False}
+
+
+async def slow_database_agent(*args, **kwargs):
+    await asyncio.sleep(0.01)
+    return DB_RESULT
+
+
+class SpeculationTests(SimpleTestCase):
+    def setUp(self):
+        reset_speculation_stats()
+
+    def settle(self, use, work, accept=None):
+        async def run():
+            speculation = Speculation(work())
+            await asyncio.sleep(0.02)  # the routing call
+            return await speculation.settle(use, accept)
+
+        return asyncio.run(run())
+
+    def test_agreeing_router_uses_the_result(self):
+        self.assertEqual(self.settle(True, slow_database_agent), DB_RESULT)
+        stats = speculation_stats()
+        self.assertEqual((stats["started"], stats["used"], stats["wasted_llm_calls"]), (1, 1, 0))
+        self.assertGreater(stats["saved_ms"], 0)
+
+    def test_disagreeing_router_discards_the_run(self):
+        self.assertIsNone(self.settle(False, slow_database_agent))
+        stats = speculation_stats()
+        self.assertEqual((stats["discarded"], stats["wasted_llm_calls"]), (1, 1))
+        self.assertEqual(stats["waste_rate"], 1.0)
+
+    def test_failed_run_is_not_used(self):
+        async def broken():
+            raise RuntimeError("LLM down")
+
+        self.assertIsNone(self.settle(True, broken))
+        self.assertIsNone(self.settle(True, slow_database_agent, accept=lambda r: False))
+        self.assertEqual(speculation_stats()["failed"], 2)
+
+
+@override_settings(SPECULATIVE_DB=True, SPECULATIVE_DB_MIN_CONFIDENCE=0.6, FAST_ROUTER_MODEL="")
+class ProbablyDataTests(SimpleTestCase):
+    def test_keyword_only_lookups(self):
+        self.assertTrue(probably_data("my food spending this month"))
+        self.assertFalse(probably_data("why is my food spending so high"))
+        self.assertFalse(probably_data("add a transaction for lunch"))
+        self.assertFalse(probably_data("tell me a joke"))
+
+    @override_settings(SPECULATIVE_DB=False)
+    def test_disabled(self):
+        self.assertFalse(probably_data("my food spending this month"))
+
+
+@override_settings(
+    FAST_ROUTER=True, SPECULATIVE_DB=True, SPECULATIVE_DB_MIN_CONFIDENCE=0.6, FAST_ROUTER_MODEL=""
+)
+class OrchestratorSpeculationTests(TestCase):
+    state = {"user_id": "1", "conversation_id": "", "user_message": "my food spending this month"}
+
+    def route(self, decision, message="Total Food spending.", has_history=False, agent=None):
+        async def router(state, context):
+            await asyncio.sleep(0.02)
+            return {"routing_decision": decision, "routing_message": message}
+
+        context = {
+            "available_budgets": "Food (ID: 3)",
+            "conversation_memory_str": "user: my rent spending last month",
+            "has_history": has_history,
+        }
+        with mock.patch.object(
+            graph, "_routing_context", return_value=context
+        ), mock.patch.object(graph, "_route_with_llm", side_effect=router), mock.patch.object(
+            graph, "_run_database_agent", side_effect=agent or slow_database_agent
+        ) as run:
+            result = async_to_sync(graph.personal_assistant_orchestrator)(dict(self.state))
+        run.assert_called_once()
+        return result
+
+    def test_result_is_handed_to_the_database_node(self):
+        decision = self.route("database_agent")
+        self.assertEqual(decision["speculative_result"], DB_RESULT)
+
+        with mock.patch.object(graph, "_run_database_agent") as run:
+            update = async_to_sync(graph.database_agent_node)({**self.state, **decision})
+        run.assert_not_called()
+        self.assertEqual(update["data"], [{"total": 500}])
+        self.assertTrue(update["is_awaiting_data"])
+
+    def test_result_is_dropped_when_routing_disagrees(self):
+        decision = self.route("personal_assistant_response")
+        self.assertNotIn("speculative_result", decision)
+
+    def test_result_is_dropped_when_the_router_rewrites_a_follow_up(self):
+        message = "Total Food (ID: 3) spending for last month."
+        decision = self.route("database_agent", message=message, has_history=True)
+        self.assertNotIn("speculative_result", decision)
+
+        # The database node then runs the router's instruction
+        with mock.patch.object(graph, "_run_database_agent", return_value=DB_RESULT) as run:
+            async_to_sync(graph.database_agent_node)({**self.state, **decision})
+        self.assertIn(message, run.call_args.args[1])
+
+    def test_matching_instruction_is_used_despite_history(self):
+        message = graph.ROUTING_MESSAGES["database_agent"].format(
+            message=self.state["user_message"]
+        )
+        decision = self.route("database_agent", message=message, has_history=True)
+        self.assertEqual(decision["speculative_result"], DB_RESULT)
+
+    def test_failed_result_is_not_used(self):
+        async def failing(*args, **kwargs):
+            return {"result": {"data": "Database error: timeout"}, "edit": False}
+
+        decision = self.route("database_agent", agent=failing)
+        self.assertNotIn("speculative_result", decision)
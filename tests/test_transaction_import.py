@@ -0,0 +1,131 @@
+import io
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Account, Budget, Notification, Transaction
+from features.crud.budgets.service import record_expense_change, verify_budget_rollup
+from features.crud.transactions.imports.parsers import (
+    ParsedRow,
+    RowError,
+    iter_csv_rows,
+    iter_ofx_rows,
+)
+from features.crud.transactions.imports.service import import_statement
+
+
+OFX_STATEMENT = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20260310120000[+2:EET]
+<TRNAMT>-45.20
+<NAME>Carrefour Maadi
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20260301
+<TRNAMT>5000.00
+<MEMO>Salary
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+class StatementParserTests(TestCase):
+    def test_csv_sign_convention_and_errors(self):
+        rows = list(iter_csv_rows(io.StringIO(
+            "Date,Amount,Description\n"
+            "2026-03-01,-12.50,Coffee\n"
+            "2026-03-02,\"1,000.00\",Refund\n"
+            "not-a-date,5,Broken\n"
+        )))
+        self.assertEqual(rows[0].transaction_type, "EXPENSE")
+        self.assertEqual(rows[0].amount, Decimal("12.50"))
+        self.assertEqual(rows[1].transaction_type, "DEPOSIT")
+        self.assertEqual(rows[1].amount, Decimal("1000.00"))
+        self.assertIsInstance(rows[2], RowError)
+        self.assertEqual(rows[2].line, 4)
+
+    def test_ofx(self):
+        rows = list(iter_ofx_rows(io.StringIO(OFX_STATEMENT)))
+        self.assertEqual(len(rows), 2)
+        self.assertIsInstance(rows[0], ParsedRow)
+        self.assertEqual(rows[0].date, date(2026, 3, 10))
+        self.assertEqual(rows[0].description, "Carrefour Maadi")
+        self.assertEqual(rows[1].transaction_type, "DEPOSIT")
+        self.assertEqual(rows[1].description, "Salary")
+
+
+class StatementImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="importer", password="password")
+        self.account = Account.objects.create(user=self.user, name="Main", balance=1000)
+        self.food = Budget.objects.create(
+            user=self.user, budget_name="Food", total_limit=100
+        )
+        self.fun = Budget.objects.create(
+            user=self.user, budget_name="Fun", total_limit=1000
+        )
+        # Earlier history teaches the importer where "Cinema" goes
+        cinema = Transaction.objects.create(
+            user=self.user,
+            budget=self.fun,
+            description="Cinema",
+            amount=Decimal("20.00"),
+            date=date.today() - timedelta(days=400),
+        )
+        record_expense_change(new_txn=cinema)
+
+    def test_import_assigns_budgets_balances_and_alerts_once(self):
+        today = date.today().isoformat()
+        csv_text = (
+            "date,amount,description,budget\n"
+            f"{today},-60.00,Market,food\n"
+            f"{today},-50.00,Bakery,Food\n"
+            f"{today},-30.00,Cinema,\n"
+            f"{today},-5.00,Unknown shop,\n"
+            f"{today},200.00,Refund,\n"
+            "bad,row,here,\n"
+        )
+        report = import_statement(
+            self.user.id, self.account.id, iter_csv_rows(io.StringIO(csv_text))
+        )
+
+        self.assertEqual(report["imported"], 5)
+        self.assertEqual(report["skipped"], 1)
+        self.assertEqual(report["unbudgeted_expenses"], 1)
+        self.assertEqual(report["account_balance"], 1055.0)
+
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("1055.00"))
+        self.assertEqual(
+            Transaction.objects.get(description="Cinema", date=date.today()).budget_id,
+            self.fun.id,
+        )
+        self.assertEqual(verify_budget_rollup(self.user.id), [])
+
+        # 110 / 100 on Food: a single "exceeded" alert, not one per row
+        alerts = Notification.objects.filter(user=self.user)
+        self.assertEqual(alerts.count(), 1)
+        self.assertEqual(alerts.get().notification_type, "budget_alert")
+
+    def test_reimport_skips_duplicates(self):
+        csv_text = "date,amount,description\n2026-03-01,-12.00,Kiosk\n2026-03-02,-8.00,Bus\n"
+        first = import_statement(
+            self.user.id, self.account.id, iter_csv_rows(io.StringIO(csv_text))
+        )
+        again = import_statement(
+            self.user.id, self.account.id, iter_csv_rows(io.StringIO(csv_text))
+        )
+        self.assertEqual((first["imported"], first["duplicates"]), (2, 0))
+        self.assertEqual((again["imported"], again["duplicates"]), (0, 2))
+        self.assertEqual(again["account_balance"], 980.0)
+
+    def test_foreign_account_is_rejected(self):
+        other = User.objects.create_user(username="other", password="password")
+        account = Account.objects.create(user=other, name="Theirs", balance=0)
+        with self.assertRaises(ValueError):
+            import_statement(self.user.id, account.id, iter([]))
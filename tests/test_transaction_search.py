@@ -0,0 +1,70 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import Budget, Transaction
+from features.crud.analytics.endpoints import search_transactions
+
+
+class TransactionSearchTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="search", password="password")
+        self.request = SimpleNamespace(user=self.user)
+        dining = Budget.objects.create(
+            user=self.user, budget_name="Dining", total_limit=500
+        )
+        today = date.today()
+        for days, description, budget in (
+            (0, "Starbucks Zamalek", None),
+            (1, "Carrefour", None),
+            (2, "Star Market", None),
+            (3, "Pizza place", dining),
+        ):
+            Transaction.objects.create(
+                user=self.user,
+                budget=budget,
+                description=description,
+                amount=Decimal("10.00"),
+                date=today - timedelta(days=days),
+            )
+
+    def _search(self, text, mode="contains"):
+        return async_to_sync(search_transactions)(
+            self.request,
+            query_text=text,
+            mode=mode,
+            category=None,
+            min_amount=None,
+            max_amount=None,
+            start_date=None,
+            end_date=None,
+            city=None,
+            neighbourhood=None,
+            limit=100,
+        )
+
+    def _descriptions(self, response):
+        return [row["description"] for row in response["data"]]
+
+    def test_contains_matches_description_and_budget_name(self):
+        self.assertEqual(self._descriptions(self._search("BUCKS")), ["Starbucks Zamalek"])
+        self.assertEqual(self._descriptions(self._search("dining")), ["Pizza place"])
+
+    def test_prefix_mode(self):
+        self.assertEqual(
+            self._descriptions(self._search("star", mode="prefix")),
+            ["Starbucks Zamalek", "Star Market"],
+        )
+        self.assertEqual(self._descriptions(self._search("bucks", mode="prefix")), [])
+
+    def test_fuzzy_mode_ranks_by_similarity(self):
+        response = self._search("starbuks", mode="fuzzy")
+        self.assertEqual(response["data"][0]["description"], "Starbucks Zamalek")
+        self.assertIn("score", response["data"][0])
+
+    def test_unknown_mode_is_rejected(self):
+        self.assertEqual(self._search("star", mode="regex")["status"], "error")
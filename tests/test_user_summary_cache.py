@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.models import Account, Budget, Goal, Profile, Transaction
+from core.utils.cache import get_cache_stats, get_data_version
+from features.crud.budgets.service import fetch_active_budgets
+from features.crud.users.service import (
+    build_user_summary,
+    fetch_active_goals,
+    fetch_income_total,
+    fetch_spending_stats,
+    fetch_user_accounts,
+    fetch_user_profile,
+    format_user_summary,
+    get_user_summary,
+)
+
+
+class UserSummaryCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.stats = get_cache_stats("user_summary")
+        self.stats.reset()
+        self.user = User.objects.create_user(
+            username="snapshot", password="password", first_name="Sam", last_name="Lee"
+        )
+        Profile.objects.create(user=self.user, job_title="Engineer")
+        self.budget = Budget.objects.create(
+            user=self.user, budget_name="Food", total_limit=1000
+        )
+
+    def test_writes_bump_data_version(self):
+        version = get_data_version(self.user.id)
+        self.assertGreater(version, 0)
+
+        Budget.objects.filter(id=self.budget.id).update(total_limit=900)
+        self.assertEqual(get_data_version(self.user.id), version + 1)
+
+        # One bump per statement, however many rows it touches
+        Transaction.objects.bulk_create(
+            Transaction(user=self.user, amount=Decimal("5.00"), date=date.today())
+            for _ in range(10)
+        )
+        self.assertEqual(get_data_version(self.user.id), version + 2)
+
+    def test_repeat_turns_hit_cache_until_data_changes(self):
+        first = get_user_summary(self.user.id)
+        self.assertIn("Food", first)
+
+        # Only the version lookup runs on a hit
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_summary(self.user.id), first)
+        self.assertEqual(self.stats.as_dict()["hits"], 1)
+        self.assertEqual(self.stats.as_dict()["misses"], 1)
+
+        Budget.objects.create(user=self.user, budget_name="Travel", total_limit=300)
+        self.assertIn("Travel", get_user_summary(self.user.id))
+        self.assertEqual(self.stats.as_dict()["misses"], 2)
+
+    def test_consolidated_query_matches_per_section_fetchers(self):
+        Account.objects.create(user=self.user, name="Main", balance=250)
+        Goal.objects.create(user=self.user, goal_name="Car", target=5000)
+        for amount, store in (("40.00", "Market"), ("15.50", "Cafe"), ("9.99", None)):
+            Transaction.objects.create(
+                user=self.user,
+                budget=self.budget,
+                amount=Decimal(amount),
+                description=store,
+                date=date.today(),
+            )
+
+        expected = format_user_summary(
+            user_id=self.user.id,
+            profile=fetch_user_profile(self.user.id),
+            income=fetch_income_total(self.user.id),
+            accounts=fetch_user_accounts(self.user.id),
+            goals=fetch_active_goals(self.user.id),
+            budgets=fetch_active_budgets(self.user.id),
+            spending_stats=fetch_spending_stats(self.user.id, months_back=3),
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(build_user_summary(self.user.id), expected)
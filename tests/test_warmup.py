@@ -0,0 +1,50 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from features import warmup
+from features.orchestrator.endpoints import ready
+
+
+@override_settings(ENABLE_AGENTS=False)
+class WarmupTests(TestCase):
+    def setUp(self):
+        patch = mock.patch.dict(warmup._report, {"ready": False, "steps": [], "total_ms": 0.0})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_reports_every_step(self):
+        report = warmup.run_warmup()
+
+        self.assertTrue(report["ready"])
+        self.assertEqual(
+            [s["name"] for s in report["steps"]],
+            [name for name, _ in warmup.WARMUP_STEPS],
+        )
+        self.assertTrue(all(s["ms"] >= 0 for s in report["steps"]))
+        # Second call returns the stored report without re-running
+        with mock.patch.object(warmup, "_warm_database") as step:
+            self.assertEqual(warmup.run_warmup(), report)
+        step.assert_not_called()
+
+    def test_start_inside_a_running_event_loop(self):
+        # What uvicorn does: config.asgi is imported from within asyncio.run
+        async def serve():
+            return warmup.run_warmup_at_start()
+
+        report = asyncio.run(serve())
+        self.assertTrue(report["ready"], report["steps"])
+
+    def test_readiness_probe(self):
+        failing = (("database", mock.Mock(side_effect=RuntimeError("db down"))),)
+        with mock.patch.object(warmup, "WARMUP_STEPS", failing):
+            status, report = async_to_sync(ready)(SimpleNamespace())
+        self.assertEqual(status, 503)
+        self.assertEqual(report["steps"][0]["detail"], "db down")
+
+        status, report = async_to_sync(ready)(SimpleNamespace())
+        self.assertEqual(status, 200)
+        self.assertTrue(report["ready"])